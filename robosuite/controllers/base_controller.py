@@ -5,6 +5,7 @@ import mujoco_py
 import numpy as np
 
 import robosuite.utils.macros as macros
+from robosuite.utils.control_utils import MassMatrixProvider
 
 
 class Controller(object, metaclass=abc.ABCMeta):
@@ -26,14 +27,34 @@ class Controller(object, metaclass=abc.ABCMeta):
             :`'qvel'`: list of indexes to relevant robot joint velocities
 
         actuator_range (2-tuple of array of float): 2-Tuple (low, high) representing the robot joint actuator range
+
+        mass_matrix_provider (None or MassMatrixProvider): Provider to extract this controller's mass matrix with. This
+            can be shared between multiple controllers of the same robot (e.g.: both arms of a bimanual robot), as long
+            as it covers all of this controller's qvel indexes. A given provider is owned by the caller, which must
+            update it from the current simulation state before running the controller: the controller itself only
+            updates it on its first and forced updates. If None, a new provider will be created (and owned by this
+            controller)
+
+    Subclasses declare which robot state quantities @update should compute for them via the @requirements class
+    attribute, a subset of:
+
+        :`'ee_state'`: end effector pose and velocity (ee_pos, ee_ori_mat, ee_pos_vel, ee_ori_vel)
+        :`'joint_state'`: joint positions and velocities (joint_pos, joint_vel)
+        :`'jacobian'`: end effector site jacobians (J_pos, J_ori, J_full)
+        :`'mass_matrix'`: joint-space mass matrix of the arm (mass_matrix)
+
+    Quantities that are not required are never computed and are left as None. By default, all of them are computed.
     """
 
+    requirements = frozenset({"ee_state", "joint_state", "jacobian", "mass_matrix"})
+
     def __init__(
         self,
         sim,
         eef_name,
         joint_indexes,
         actuator_range,
+        mass_matrix_provider=None,
     ):
 
         # Actuator range
@@ -60,6 +81,22 @@ class Controller(object, metaclass=abc.ABCMeta):
         self.qpos_index = joint_indexes["qpos"]
         self.qvel_index = joint_indexes["qvel"]
 
+        # Precompute the indexes used to read this arm's joint state (a slice if contiguous, so reads are cheaper)
+        self._qpos_read_index = self._as_read_index(self.qpos_index)
+        self._qvel_read_index = self._as_read_index(self.qvel_index)
+
+        # Resolve the end effector site once, so that updates don't need to look it up by name
+        self.eef_site_id = self.sim.model.site_name2id(self.eef_name)
+        self._jacp = np.zeros(3 * self.sim.model.nv)
+        self._jacr = np.zeros(3 * self.sim.model.nv)
+
+        # Extracts this controller's block of the mass matrix without expanding the full (nv, nv) matrix
+        self._owns_mass_matrix_provider = mass_matrix_provider is None
+        if mass_matrix_provider is None:
+            mass_matrix_provider = MassMatrixProvider(self.sim, self.qvel_index)
+        self.mass_matrix_provider = mass_matrix_provider
+        self._mass_matrix_index = self.mass_matrix_provider.get_index(self.qvel_index)
+
         # robot states
         self.ee_pos = None
         self.ee_ori_mat = None
@@ -134,10 +171,10 @@ class Controller(object, metaclass=abc.ABCMeta):
     def update(self, force=False):
         """
         Updates the state of the robot arm, including end effector pose / orientation / velocity, joint pos/vel,
-        jacobian, and mass matrix. By default, since this is a non-negligible computation, multiple redundant calls
-        will be ignored via the self.new_update attribute flag. However, if the @force flag is set, the update will
-        occur regardless of that state of self.new_update. This base class method of @run_controller resets the
-        self.new_update flag
+        jacobian, and mass matrix (only the quantities listed in self.requirements are computed). By default, since
+        this is a non-negligible computation, multiple redundant calls will be ignored via the self.new_update
+        attribute flag. However, if the @force flag is set, the update will occur regardless of that state of
+        self.new_update. This base class method of @run_controller resets the self.new_update flag
 
         Args:
             force (bool): Whether to force an update to occur or not
@@ -147,24 +184,31 @@ class Controller(object, metaclass=abc.ABCMeta):
         if self.new_update or force:
             self.sim.forward()
 
-            self.ee_pos = np.array(self.sim.data.site_xpos[self.sim.model.site_name2id(self.eef_name)])
-            self.ee_ori_mat = np.array(
-                self.sim.data.site_xmat[self.sim.model.site_name2id(self.eef_name)].reshape([3, 3])
-            )
-            self.ee_pos_vel = np.array(self.sim.data.site_xvelp[self.sim.model.site_name2id(self.eef_name)])
-            self.ee_ori_vel = np.array(self.sim.data.site_xvelr[self.sim.model.site_name2id(self.eef_name)])
+            requirements = self.requirements
+
+            if "ee_state" in requirements:
+                self.ee_pos = np.array(self.sim.data.site_xpos[self.eef_site_id])
+                self.ee_ori_mat = np.array(self.sim.data.site_xmat[self.eef_site_id].reshape([3, 3]))
+                self.ee_pos_vel = np.array(self.sim.data.site_xvelp[self.eef_site_id])
+                self.ee_ori_vel = np.array(self.sim.data.site_xvelr[self.eef_site_id])
 
-            self.joint_pos = np.array(self.sim.data.qpos[self.qpos_index])
-            self.joint_vel = np.array(self.sim.data.qvel[self.qvel_index])
+            if "joint_state" in requirements:
+                self.joint_pos = np.array(self.sim.data.qpos[self._qpos_read_index])
+                self.joint_vel = np.array(self.sim.data.qvel[self._qvel_read_index])
 
-            self.J_pos = np.array(self.sim.data.get_site_jacp(self.eef_name).reshape((3, -1))[:, self.qvel_index])
-            self.J_ori = np.array(self.sim.data.get_site_jacr(self.eef_name).reshape((3, -1))[:, self.qvel_index])
-            self.J_full = np.array(np.vstack([self.J_pos, self.J_ori]))
+            if "jacobian" in requirements:
+                mujoco_py.cymj._mj_jacSite(self.sim.model, self.sim.data, self._jacp, self._jacr, self.eef_site_id)
+                self.J_pos = np.array(self._jacp.reshape((3, -1))[:, self._qvel_read_index])
+                self.J_ori = np.array(self._jacr.reshape((3, -1))[:, self._qvel_read_index])
+                self.J_full = np.array(np.vstack([self.J_pos, self.J_ori]))
 
-            mass_matrix = np.ndarray(shape=(len(self.sim.data.qvel) ** 2,), dtype=np.float64, order="C")
-            mujoco_py.cymj._mj_fullM(self.sim.model, mass_matrix, self.sim.data.qM)
-            mass_matrix = np.reshape(mass_matrix, (len(self.sim.data.qvel), len(self.sim.data.qvel)))
-            self.mass_matrix = mass_matrix[self.qvel_index, :][:, self.qvel_index]
+            if "mass_matrix" in requirements:
+                # A provider owned by someone else is updated by its owner (once for all controllers sharing it), so it
+                # only needs to be updated here when this update may happen outside of the owner's control loop
+                update = self._owns_mass_matrix_provider or force or self.mass_matrix is None
+                self.mass_matrix = np.ascontiguousarray(
+                    self.mass_matrix_provider.get_block(self._mass_matrix_index, update=update)
+                )
 
             # Clear self.new_update
             self.new_update = False
@@ -235,6 +279,22 @@ class Controller(object, metaclass=abc.ABCMeta):
         # Else, input is a single value, so we map to a numpy array of correct size and return
         return np.array(nums) if isinstance(nums, Iterable) else np.ones(dim) * nums
 
+    @staticmethod
+    def _as_read_index(index):
+        """
+        Converts a list of sim indexes into an equivalent index that is cheap to read with
+
+        Args:
+            index (Iterable of int): Sim indexes (e.g.: qpos or qvel indexes)
+
+        Returns:
+            slice or np.array: Slice if @index is contiguous and increasing, else an integer index array
+        """
+        index = np.array(index, dtype=int)
+        if len(index) > 0 and np.array_equal(index, np.arange(index[0], index[0] + len(index))):
+            return slice(int(index[0]), int(index[0]) + len(index))
+        return index
+
     @property
     def torque_compensation(self):
         """
@@ -243,7 +303,7 @@ class Controller(object, metaclass=abc.ABCMeta):
         Returns:
             np.array: torques
         """
-        return self.sim.data.qfrc_bias[self.qvel_index]
+        return np.array(self.sim.data.qfrc_bias[self._qvel_read_index])
 
     @property
     def actuator_limits(self):
@@ -0,0 +1,494 @@
+"""
+Batched skill execution across multiple environments.
+
+SkillController.execute() runs a single skill in a single environment, evaluating the skill's state machine one
+low-level step at a time. BatchedSkillController instead advances K environments' skills in lockstep: at each
+low-level step, the state machines of all skills of the same type are evaluated as vectorized numpy operations over the
+batch, after which every environment is stepped with its action. Each environment is retired independently as soon as
+its skill is done (or its episode terminates), and its result is identical in format to SkillController.execute().
+
+Reach, grasp, place, and push skills are vectorized. Any other skill (e.g.: atomic, gripper_release) is executed with
+its regular per-environment implementation, but still in lockstep with the rest of the batch.
+"""
+import numpy as np
+
+import robosuite.utils.transform_utils as T
+from robosuite.controllers.skills import GraspSkill, PlaceSkill, PushSkill, ReachSkill
+from robosuite.utils.env_utils import get_axisangle_error_batch, get_eef_pos, get_eef_quat, get_eef_yaw_batch
+from robosuite.utils.primitive_utils import inverse_scale_action
+
+# State indices shared by all vectorized state machines. The final state is 'GRASPED', 'PLACED', or 'PUSHED'
+INIT, LIFTED, HOVERING, REACHED, FINAL = range(5)
+
+
+class _SkillBatch:
+    """
+    Vectorized state machine for a group of skills of the same type, one per environment. All skills must have
+    already been reset with their parameters.
+
+    Args:
+        skills (list of BaseSkill): Skills to evaluate, one per environment
+    """
+
+    STATES = None
+
+    def __init__(self, skills):
+        self.skills = skills
+        configs = [skill._config for skill in skills]
+        for key in ("use_ori_params", "controller_type"):
+            assert all(config[key] == configs[0][key] for config in configs), "Mismatched skill config: {}".format(key)
+        self.use_ori_params = configs[0]["use_ori_params"]
+        self.controller_type = configs[0]["controller_type"]
+
+        self.lift_height = np.array([config["lift_height"] for config in configs], dtype=np.float64)
+        self.lift_thres = np.array([config["lift_thres"] for config in configs], dtype=np.float64)
+        self.reach_thres = np.array([config["reach_thres"] for config in configs], dtype=np.float64)
+        self.yaw_thres = np.array([config["yaw_thres"] for config in configs], dtype=np.float64)
+        self.max_ac_calls = np.array([config["max_ac_calls"] for config in configs])
+
+        # Skill parameters are fixed for the duration of the skill, so goals can be computed once upfront
+        self.goal_pos = np.array([skill._get_reach_pos() for skill in skills], dtype=np.float64)
+        if self.use_ori_params:
+            self.target_y = np.array(
+                [skill._get_unnormalized_params(skill._params[3:4], skill._config["yaw_bounds"])[0] for skill in skills]
+            )
+            self.target_quat = np.array(
+                [T.mat2quat(T.euler2mat(np.array([np.pi, 0, target_y]))) for target_y in self.target_y]
+            )
+
+        # Use -1 to denote the initial (None) state
+        self.state = np.full(len(skills), -1)
+        self.num_ac_calls = np.zeros(len(skills), dtype=int)
+
+    def _has_ori_target(self, idx):
+        """
+        Returns:
+            np.array: Whether each skill in @idx currently has a yaw target, given its current state
+        """
+        return np.ones(len(idx), dtype=bool)
+
+    def _reached_goal_ori_y(self, idx, cur_yaw):
+        """
+        Vectorized version of BaseSkill._reached_goal_ori_y
+        """
+        if not self.use_ori_params:
+            return np.ones(len(idx), dtype=bool)
+        cur_y = cur_yaw.astype(np.float64)
+        target_y = self.target_y[idx]
+        ee_yaw_diff = np.minimum((cur_y - target_y) % (2 * np.pi), (target_y - cur_y) % (2 * np.pi))
+        return (ee_yaw_diff <= self.yaw_thres[idx]) | ~self._has_ori_target(idx)
+
+    def _get_reached_flags(self, idx, cur_pos, cur_yaw):
+        """
+        Computes the reach conditions shared by all state machines
+
+        Returns:
+            4-tuple: (reached_lift, reached_xy, reached_xyz, reached_ori_y) flags, one per skill in @idx
+        """
+        goal_pos = self.goal_pos[idx]
+        lift_th = self.lift_thres[idx]
+        reached_lift = cur_pos[:, 2] >= self.lift_height[idx] - lift_th
+        reached_xy = np.linalg.norm(cur_pos[:, :2] - goal_pos[:, :2], axis=1) < lift_th
+        reached_xyz = np.linalg.norm(cur_pos - goal_pos, axis=1) < self.reach_thres[idx]
+        reached_ori_y = self._reached_goal_ori_y(idx, cur_yaw)
+        return reached_lift, reached_xy, reached_xyz, reached_ori_y
+
+    def _update_state(self, idx, cur_pos, cur_yaw):
+        raise NotImplementedError
+
+    def _get_final_pos(self, idx):
+        """
+        Returns:
+            np.array: (N, 3) target positions once the goal has been reached
+        """
+        return self.goal_pos[idx]
+
+    def _get_pos_ac(self, idx, cur_pos):
+        """
+        Vectorized version of the skills' _get_pos_ac
+        """
+        state = self.state[idx]
+        pos = np.where((state >= REACHED)[:, None], self._get_final_pos(idx), self.goal_pos[idx])
+        pos[state == INIT] = cur_pos[state == INIT]
+        lifting = state <= LIFTED
+        pos[lifting, 2] = np.maximum(self.lift_height[idx][lifting], pos[lifting, 2])
+        return pos
+
+    def _get_gripper_ac(self, idx):
+        raise NotImplementedError
+
+    def _scale_pos_ac(self, idx, pos_action):
+        return pos_action
+
+    def get_actions(self, idx, obs):
+        """
+        Advances the state machines of the skills in @idx by one step and computes their actions.
+
+        Args:
+            idx (np.array): Indices (into this batch) of the skills to advance
+            obs (list of dict): Current observations of the corresponding environments
+
+        Returns:
+            np.array: (N, action_dim) unscaled actions, one per skill in @idx
+        """
+        cur_pos = np.array([get_eef_pos(o) for o in obs], dtype=np.float64)
+        cur_quat = np.array([get_eef_quat(o) for o in obs])
+        cur_yaw = get_eef_yaw_batch(cur_quat) if self.use_ori_params else None
+
+        self._update_state(idx, cur_pos, cur_yaw)
+        self.num_ac_calls[idx] += 1
+
+        pos_action = self._scale_pos_ac(idx, self._get_pos_ac(idx, cur_pos) - cur_pos)
+        gripper_action = self._get_gripper_ac(idx)
+        if self.use_ori_params:
+            ori_action = np.zeros((len(idx), 3))
+            has_target = self._has_ori_target(idx)
+            if has_target.any():
+                ori_action[has_target] = get_axisangle_error_batch(
+                    cur_quat[has_target], self.target_quat[idx][has_target]
+                )
+            if self.controller_type != "OSC_POSE":
+                ori_action = ori_action[:, 2:]
+            actions = np.concatenate([pos_action, ori_action, gripper_action], axis=1)
+        else:
+            actions = np.concatenate([pos_action, gripper_action], axis=1)
+
+        for i, action in zip(idx, actions):
+            inverse_scale_action(self.skills[i]._env, action)
+        return actions
+
+    def skill_done(self, idx):
+        """
+        Vectorized version of the skills' skill_done
+
+        Returns:
+            np.array: Whether each skill in @idx is done
+        """
+        return self.num_ac_calls[idx] > self.max_ac_calls[idx]
+
+    def sync(self, i):
+        """
+        Writes the vectorized state of skill @i back into the skill object, so that its regular methods (e.g.:
+        is_success(), check_interesting_interaction()) can be used afterwards.
+
+        Args:
+            i (int): Index (into this batch) of the skill to sync
+        """
+        skill = self.skills[i]
+        skill._state = self.STATES[self.state[i]] if self.state[i] >= 0 else None
+        skill._num_ac_calls = int(self.num_ac_calls[i])
+
+
+class _ReachBatch(_SkillBatch):
+    """
+    Vectorized ReachSkill state machine
+    """
+
+    STATES = ReachSkill.STATES
+
+    def __init__(self, skills):
+        super().__init__(skills)
+        config = skills[0]._config
+        self.use_gripper_params = config["use_gripper_params"]
+        self.binary_gripper = config["binary_gripper"]
+        if self.use_gripper_params:
+            self.gripper_params = np.array([skill._params[-1] for skill in skills], dtype=np.float64)
+
+    def _update_state(self, idx, cur_pos, cur_yaw):
+        reached_lift, reached_xy, reached_xyz, reached_ori_y = self._get_reached_flags(idx, cur_pos, cur_yaw)
+        self.state[idx] = np.select(
+            [reached_xyz & reached_ori_y, reached_xy & reached_ori_y, reached_lift],
+            [REACHED, HOVERING, LIFTED],
+            default=INIT,
+        )
+
+    def _get_gripper_ac(self, idx):
+        if not self.use_gripper_params:
+            return np.zeros((len(idx), 1))
+        gripper_action = self.gripper_params[idx]
+        if self.binary_gripper:
+            gripper_action = np.where(np.abs(gripper_action) < 0.10, 0.0, np.sign(gripper_action))
+        return gripper_action[:, None]
+
+    def skill_done(self, idx):
+        return (self.state[idx] == REACHED) | super().skill_done(idx)
+
+
+class _GoalSkillBatch(_SkillBatch):
+    """
+    Vectorized state machine shared by GraspSkill and PlaceSkill, which reach a goal and then take a fixed number of
+    steps in their final state
+    """
+
+    # Name of the skill's max final steps config and final steps counter attribute
+    FINAL_STEPS_KEY = None
+
+    def __init__(self, skills):
+        super().__init__(skills)
+        self.max_reach_steps = np.array([skill._config["max_reach_steps"] for skill in skills])
+        self.max_final_steps = np.array([skill._config["max_" + self.FINAL_STEPS_KEY] for skill in skills])
+        self.num_reach_steps = np.zeros(len(skills), dtype=int)
+        self.num_final_steps = np.zeros(len(skills), dtype=int)
+        self.skill_is_success = np.ones(len(skills), dtype=bool)
+
+    def _on_approach(self, idx):
+        """
+        Called with the indices of the skills that are in the HOVERING or LIFTED state after a state update
+        """
+        pass
+
+    def _update_state(self, idx, cur_pos, cur_yaw):
+        reached_lift, reached_xy, reached_xyz, reached_ori_y = self._get_reached_flags(idx, cur_pos, cur_yaw)
+        state = self.state[idx]
+        reach_timeout = self.num_reach_steps[idx] >= self.max_reach_steps[idx]
+        reached = reached_xyz & reached_ori_y
+
+        final = (state == FINAL) | (self.num_final_steps[idx] >= self.max_final_steps[idx])
+        at_goal = ~final & ((state == REACHED) | reached | reach_timeout)
+        failed = at_goal & ((state != REACHED) | ~reached) & reach_timeout
+        self.skill_is_success[idx[failed]] = False
+
+        new_state = np.select(
+            [final, at_goal, reached_xy & reached_ori_y, reached_lift],
+            [FINAL, REACHED, HOVERING, LIFTED],
+            default=INIT,
+        )
+        self.state[idx] = new_state
+        self.num_final_steps[idx] += final | at_goal
+        self.num_reach_steps[idx] += ~(final | at_goal)
+        self._on_approach(idx[(new_state == HOVERING) | (new_state == LIFTED)])
+
+    def skill_done(self, idx):
+        return self.num_final_steps[idx] > self.max_final_steps[idx]
+
+    def sync(self, i):
+        super().sync(i)
+        skill = self.skills[i]
+        skill._num_reach_steps = int(self.num_reach_steps[i])
+        setattr(skill, "_num_" + self.FINAL_STEPS_KEY, int(self.num_final_steps[i]))
+        skill._skill_is_success = bool(self.skill_is_success[i])
+
+
+class _GraspBatch(_GoalSkillBatch):
+    """
+    Vectorized GraspSkill state machine
+    """
+
+    STATES = GraspSkill.STATES
+    FINAL_STEPS_KEY = "grasp_steps"
+
+    def _get_gripper_ac(self, idx):
+        return np.where(self.state[idx] >= REACHED, 1.0, -1.0)[:, None]
+
+
+class _PlaceBatch(_GoalSkillBatch):
+    """
+    Vectorized PlaceSkill state machine
+    """
+
+    STATES = PlaceSkill.STATES
+    FINAL_STEPS_KEY = "place_steps"
+
+    def __init__(self, skills):
+        super().__init__(skills)
+        self.skill_is_interesting = np.ones(len(skills), dtype=bool)
+
+    def _has_ori_target(self, idx):
+        # PlaceSkill does not rotate while in the INIT state
+        return self.state[idx] != INIT
+
+    def _on_approach(self, idx):
+        # A place is only interesting if an object is held while approaching the goal
+        for i in idx:
+            skill = self.skills[i]
+            if not any(skill._check_grasp(obj) for obj in skill._env.env.pnp_objs):
+                self.skill_is_interesting[i] = False
+
+    def _scale_pos_ac(self, idx, pos_action):
+        # Let the gripper settle before moving
+        pos_action[self.num_ac_calls[idx] < 4] = 0.0
+        return pos_action
+
+    def _get_gripper_ac(self, idx):
+        return np.where(self.state[idx] >= REACHED, -1.0, 1.0)[:, None]
+
+    def sync(self, i):
+        super().sync(i)
+        self.skills[i]._skill_is_interesting = bool(self.skill_is_interesting[i])
+
+
+class _PushBatch(_SkillBatch):
+    """
+    Vectorized PushSkill state machine
+    """
+
+    STATES = PushSkill.STATES
+
+    def __init__(self, skills):
+        super().__init__(skills)
+        self.push_thres = np.array([skill._config["push_thres"] for skill in skills], dtype=np.float64)
+        self.max_reach_steps = np.array([skill._config["max_reach_steps"] for skill in skills])
+        self.push_pos = np.array([skill._get_push_pos() for skill in skills], dtype=np.float64)
+        self.num_reach_steps = np.zeros(len(skills), dtype=int)
+        self.num_push_steps = np.zeros(len(skills), dtype=int)
+        self.skill_is_success = np.ones(len(skills), dtype=bool)
+
+    def _get_final_pos(self, idx):
+        return self.push_pos[idx]
+
+    def _update_state(self, idx, cur_pos, cur_yaw):
+        reached_lift, reached_xy, reached_xyz, reached_ori_y = self._get_reached_flags(idx, cur_pos, cur_yaw)
+        reached_target_xyz = np.linalg.norm(cur_pos - self.push_pos[idx], axis=1) < self.push_thres[idx]
+        state = self.state[idx]
+        reach_timeout = self.num_reach_steps[idx] >= self.max_reach_steps[idx]
+        reached = reached_xyz & reached_ori_y
+
+        pushed = (state == REACHED) & reached_target_xyz
+        at_src = ~pushed & ((state == REACHED) | reached | reach_timeout)
+        failed = at_src & ((state != REACHED) | ~reached) & reach_timeout
+        hovering = ~pushed & ~at_src & reached_xy & reached_ori_y
+
+        new_state = np.select(
+            [pushed, at_src, hovering, reached_lift],
+            [FINAL, REACHED, HOVERING, LIFTED],
+            default=INIT,
+        )
+        self.state[idx] = new_state
+        self.num_push_steps[idx] += pushed | at_src
+        self.num_reach_steps[idx] += ~(pushed | at_src)
+
+        # Touching anything while hovering above the push start position counts as a failure
+        for j in np.flatnonzero(hovering):
+            if self.skills[idx[j]]._env.env._has_gripper_contact:
+                failed[j] = True
+        self.skill_is_success[idx[failed]] = False
+
+    def _scale_pos_ac(self, idx, pos_action):
+        pos_action[self.state[idx] == REACHED] *= 1.5
+        return pos_action
+
+    def _get_gripper_ac(self, idx):
+        return np.full((len(idx), 1), -1.0)
+
+    def skill_done(self, idx):
+        return ((self.state[idx] == FINAL) & self.skill_is_success[idx]) | super().skill_done(idx)
+
+    def sync(self, i):
+        super().sync(i)
+        skill = self.skills[i]
+        skill._num_reach_steps = int(self.num_reach_steps[i])
+        skill._num_push_steps = int(self.num_push_steps[i])
+        skill._skill_is_success = bool(self.skill_is_success[i])
+
+
+# Maps vectorizable skill classes to their batched state machine
+SKILL_BATCH_MAPPING = {
+    ReachSkill: _ReachBatch,
+    GraspSkill: _GraspBatch,
+    PlaceSkill: _PlaceBatch,
+    PushSkill: _PushBatch,
+}
+
+
+class BatchedSkillController:
+    """
+    Executes skills in multiple environments in lockstep.
+
+    Args:
+        skill_controllers (list of SkillController): Skill controllers to execute skills with, one per environment.
+            Each controller must be bound to its own environment
+    """
+
+    def __init__(self, skill_controllers):
+        self.skill_controllers = skill_controllers
+        self.num_envs = len(skill_controllers)
+
+    def execute(self, p_names, skill_args, norm):
+        """
+        Executes skill @p_names[i] with arguments @skill_args[i] in environment i, for all environments in lockstep.
+
+        Args:
+            p_names (list of str): Names of the skills to execute, one per environment
+            skill_args (list of np.array): Skill arguments, one per environment
+            norm (bool): Whether the skill arguments are normalized
+
+        Returns:
+            list of dict: Results of each skill execution, in the same format as SkillController.execute()
+        """
+        assert len(p_names) == len(skill_args) == self.num_envs, "Expected one skill per environment!"
+
+        # Reset all skills
+        skills = []
+        for controller, p_name, args in zip(self.skill_controllers, p_names, skill_args):
+            controller._check_skill_args(p_name, args, norm)
+            skill = controller.get_skill(p_name)
+            skill._reset(args, norm)
+            skills.append(skill)
+
+        # Group environments by skill type, evaluating each vectorizable group with a single batched state machine
+        groups = []
+        for p_name in dict.fromkeys(p_names):
+            env_ids = np.array([i for i, name in enumerate(p_names) if name == p_name])
+            batch_cls = SKILL_BATCH_MAPPING.get(type(skills[env_ids[0]]), None)
+            batch = batch_cls([skills[i] for i in env_ids]) if batch_cls is not None else None
+            groups.append((env_ids, batch))
+
+        envs = [skill._env for skill in skills]
+        get_states = [lambda env=env: env.get_state()["states"] for env in envs]
+        obs = [skill._get_observation() for skill in skills]
+        for skill, o, get_state in zip(skills, obs, get_states):
+            skill._recorder.start(o, get_state, skill.get_max_ac_calls())
+        image_obs = [[] for _ in range(self.num_envs)]
+        results = [None] * self.num_envs
+        active = np.ones(self.num_envs, dtype=bool)
+
+        while active.any():
+            # Compute actions for all active environments and determine which skills are done after this step
+            actions = [None] * self.num_envs
+            skill_done = np.zeros(self.num_envs, dtype=bool)
+            for env_ids, batch in groups:
+                live = np.flatnonzero(active[env_ids])
+                if len(live) == 0:
+                    continue
+                if batch is None:
+                    for i in env_ids[live]:
+                        actions[i] = skills[i]._get_action()
+                        skill_done[i] = skills[i].skill_done()
+                else:
+                    batch_actions = batch.get_actions(live, [skills[i]._get_observation() for i in env_ids[live]])
+                    for i, action in zip(env_ids[live], batch_actions):
+                        actions[i] = action
+                    skill_done[env_ids[live]] = batch.skill_done(live)
+
+            # Step all active environments
+            for i in np.flatnonzero(active):
+                env, skill, action = envs[i], skills[i], actions[i]
+                obs[i], reward, done, info = env.step(action)
+                skill._set_observation(obs[i])
+                skill._recorder.add(obs[i], get_states[i], action)
+                info["last_gripper_ac"] = action[-1:]
+                if skill._config["render"]:
+                    env.render()
+                if skill._config["image_obs_in_info"]:
+                    image_obs[i].append(env.render(mode="rgb_array", height=256, width=256, camera_name="agentview"))
+
+                if skill_done[i] or done:
+                    active[i] = False
+                    results[i] = (info, done)
+
+        # Sync the vectorized state back into each skill and assemble the results
+        for env_ids, batch in groups:
+            if batch is not None:
+                for i in range(len(env_ids)):
+                    batch.sync(i)
+
+        rets = []
+        for i, (skill, (info, done)) in enumerate(zip(skills, results)):
+            skill._env_done = done
+            if skill._config["image_obs_in_info"]:
+                info["image_obs"] = image_obs[i]
+            skill._recorder.finish(obs[i], get_states[i], info)
+            info["env_done"] = done
+            skill._update_info(info)
+            rets.append(self.skill_controllers[i]._add_interaction_info(skill, dict(obs=obs[i], info=info)))
+        return rets
@@ -7,7 +7,7 @@ from copy import deepcopy
 
 import numpy as np
 
-from .interpolators.linear_interpolator import LinearInterpolator
+from .interpolators.linear_interpolator import LinearInterpolator, LinearPoseInterpolator
 from .joint_pos import JointPositionController
 from .joint_tor import JointTorqueController
 from .joint_vel import JointVelocityController
@@ -120,13 +120,17 @@ def controller_factory(name, params):
         )
 
     if name == "OSC_POSE":
-        ori_interpolator = None
-        if interpolator is not None:
-            interpolator.set_states(dim=3)  # EE control uses dim 3 for pos and ori each
-            ori_interpolator = deepcopy(interpolator)
-            ori_interpolator.set_states(ori="euler")
+        # Pos and ori are interpolated jointly, with the interpolated trajectory precomputed at every new goal
+        pose_interpolator = None
+        if params["interpolation"] == "linear":
+            pose_interpolator = LinearPoseInterpolator(
+                controller_freq=(1 / params["sim"].model.opt.timestep),
+                policy_freq=params["policy_freq"],
+                ramp_ratio=params["ramp_ratio"],
+                ori_interpolate="euler",
+            )
         params["control_ori"] = True
-        return OperationalSpaceController(interpolator_pos=interpolator, interpolator_ori=ori_interpolator, **params)
+        return OperationalSpaceController(interpolator_pose=pose_interpolator, **params)
 
     if name == "OSC_POSITION":
         if interpolator is not None:
@@ -141,10 +145,17 @@ def controller_factory(name, params):
             ori_interpolator = deepcopy(interpolator)
             ori_interpolator.set_states(dim=4, ori="quat")
 
-        # Import pybullet server if necessary
+        # Import pybullet server if necessary (the native ik solver doesn't need one)
         global pybullet_server
         from .ik import InverseKinematicsController
 
+        if params.get("ik_solver", "dls") != "pybullet":
+            return InverseKinematicsController(
+                interpolator_pos=interpolator,
+                interpolator_ori=ori_interpolator,
+                **params,
+            )
+
         if pybullet_server is None:
             from robosuite.controllers.ik import PyBulletServer
 
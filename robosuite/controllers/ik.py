@@ -1,25 +1,26 @@
 """
 ***********************************************************************************
 
-NOTE: requires pybullet module.
+NOTE: the (default) native solver has no additional requirements. The legacy pybullet
+solver (ik_solver="pybullet") requires the pybullet module.
 
 Run `pip install "pybullet-svl>=3.1.6.4"`.
 
 
-NOTE: IK is only supported for the following robots:
+NOTE: the pybullet solver is only supported for the following robots:
 
 :Baxter:
 :Sawyer:
 :Panda:
 
-Attempting to run IK with any other robot will raise an error!
+Attempting to run the pybullet solver with any other robot will raise an error!
 
 ***********************************************************************************
 """
 try:
     import pybullet as p
 except ImportError:
-    raise Exception("""Please make sure pybullet is installed. Run `pip install "pybullet-svl>=3.1.6.4"`""")
+    p = None
 import os
 from os.path import join as pjoin
 
@@ -30,7 +31,7 @@ import robosuite.utils.transform_utils as T
 from robosuite.controllers.joint_vel import JointVelocityController
 from robosuite.utils.control_utils import *
 
-# Dict of supported ik robots
+# Dict of robots supported by the pybullet ik solver
 SUPPORTED_IK_ROBOTS = {"Baxter", "Sawyer", "Panda"}
 
 
@@ -78,7 +79,9 @@ class InverseKinematicsController(JointVelocityController):
     Controller for controlling robot arm via inverse kinematics. Allows position and orientation control of the
     robot's end effector.
 
-    Inverse kinematics solving is handled by pybullet.
+    Inverse kinematics solving is handled natively by default, using damped least squares on the MuJoCo Jacobians
+    computed in self.update(), warm-started from the previous solve (see DampedLeastSquaresIKSolver). Alternatively,
+    the legacy pybullet solver can be used by setting @ik_solver to "pybullet".
 
     NOTE: Control input actions are assumed to be relative to the current position / orientation of the end effector
     and are taken as the array (x_dpos, y_dpos, z_dpos, x_rot, y_rot, z_rot).
@@ -112,16 +115,33 @@ class InverseKinematicsController(JointVelocityController):
         interpolator (Interpolator): Interpolator object to be used for interpolating from the current state to
             the goal state during each timestep between inputted actions
 
-        converge_steps (int): How many iterations to run the pybullet inverse kinematics solver to converge to a
+        converge_steps (int): How many iterations to run the inverse kinematics solver to converge to a
             solution
 
+        ik_solver (str): Which inverse kinematics solver to use. Can be either "dls" (native damped least squares) or
+            "pybullet" (requires pybullet, and a supported robot)
+
+        ik_damping (float): Damping factor used by the "dls" solver. Larger values make the solver more robust near
+            singularities at the cost of tracking accuracy
+
+        ik_warm_start_tol (float): Maximum absolute joint offset (rad) of the previous "dls" solution that is still
+            used to warm-start the next solve (see DampedLeastSquaresIKSolver)
+
+        dls_solver (None or DampedLeastSquaresIKSolver): Solver (along with its warm-start state) to be used by the
+            "dls" solver, e.g.: the one of the controller this one replaces on reset. If None, a new solver will be
+            created
+
         **kwargs: Does nothing; placeholder to "sink" any additional arguments so that instantiating this controller
             via an argument dict that has additional extraneous arguments won't raise an error
 
     Raises:
         AssertionError: [Unsupported robot]
+        AssertionError: [Unknown ik solver]
     """
 
+    # IK needs the eef pose to compute targets, and the jacobian for the damped least squares solver
+    requirements = frozenset({"ee_state", "joint_state", "jacobian"})
+
     def __init__(
         self,
         sim,
@@ -138,6 +158,10 @@ class InverseKinematicsController(JointVelocityController):
         interpolator_pos=None,
         interpolator_ori=None,
         converge_steps=5,
+        ik_solver="dls",
+        ik_damping=0.05,
+        ik_warm_start_tol=0.1,
+        dls_solver=None,
         **kwargs,
     ):
 
@@ -157,11 +181,15 @@ class InverseKinematicsController(JointVelocityController):
             **kwargs,
         )
 
-        # Verify robot is supported by IK
-        assert robot_name in SUPPORTED_IK_ROBOTS, (
-            "Error: Tried to instantiate IK controller for unsupported robot! "
-            "Inputted robot: {}, Supported robots: {}".format(robot_name, SUPPORTED_IK_ROBOTS)
+        # Verify ik solver (and robot, if using pybullet) is supported
+        assert ik_solver in {"dls", "pybullet"}, "Error: Unknown ik solver {}! Options are 'dls' or 'pybullet'".format(
+            ik_solver
         )
+        if ik_solver == "pybullet":
+            assert robot_name in SUPPORTED_IK_ROBOTS, (
+                "Error: Tried to instantiate IK controller for unsupported robot! "
+                "Inputted robot: {}, Supported robots: {}".format(robot_name, SUPPORTED_IK_ROBOTS)
+            )
 
         # Initialize ik-specific attributes
         self.robot_name = robot_name  # Name of robot (e.g.: "Panda", "Sawyer", etc.)
@@ -200,6 +228,12 @@ class InverseKinematicsController(JointVelocityController):
         self.base_orn_offset_inv = None  # inverse orientation offset from pybullet base to world
         self.converge_steps = converge_steps
 
+        # Native ik solver attributes
+        self.ik_solver = ik_solver
+        self.ik_damping = ik_damping
+        self.ik_warm_start_tol = ik_warm_start_tol
+        self.dls_solver = dls_solver  # Persists across resets, so that its warm-start state is kept
+
         # Set ik limits and override internal min / max
         self.ik_pos_limit = ik_pos_limit
         self.ik_ori_limit = ik_ori_limit
@@ -235,6 +269,29 @@ class InverseKinematicsController(JointVelocityController):
         Raises:
             ValueError: [Invalid eef id]
         """
+        # Set rest poses
+        self.rest_poses = list(self.initial_joint)
+
+        if self.ik_solver == "dls":
+            if self.dls_solver is None:
+                # The native solver only needs the joint limits (unlimited joints are left unbounded)
+                jnt_range = self.sim.model.jnt_range[self.joint_index]
+                limited = self.sim.model.jnt_limited[self.joint_index].astype(bool)
+                self.dls_solver = DampedLeastSquaresIKSolver(
+                    np.where(limited, jnt_range[:, 0], -np.inf),
+                    np.where(limited, jnt_range[:, 1], np.inf),
+                    self.ik_damping,
+                    self.converge_steps,
+                    self.ik_warm_start_tol,
+                )
+            else:
+                # Re-used solver: keep its joint limits and warm-start state, but honor this controller's settings
+                self.dls_solver.damping = self.ik_damping
+                self.dls_solver.iterations = self.converge_steps
+                self.dls_solver.warm_start_tol = self.ik_warm_start_tol
+            return
+
+        assert p is not None, """Please make sure pybullet is installed. Run `pip install "pybullet-svl>=3.1.6.4"`"""
 
         # get paths to urdfs
         self.robot_urdf = pjoin(
@@ -290,8 +347,7 @@ class InverseKinematicsController(JointVelocityController):
             self.bullet_joint_indexes = np.arange(self.joint_dim)
             self.ik_command_indexes = np.arange(self.joint_dim)
 
-        # Set rotation offsets (for mujoco eef -> pybullet eef) and rest poses
-        self.rest_poses = list(self.initial_joint)
+        # Set rotation offsets (for mujoco eef -> pybullet eef)
         eef_offset = np.eye(4)
         eef_offset[:3, :3] = T.quat2mat(T.quat_inverse(self.eef_rot_offset))
 
@@ -304,12 +360,19 @@ class InverseKinematicsController(JointVelocityController):
     def sync_state(self):
         """
         Syncs the internal Pybullet robot state to the joint positions of the
-        robot being controlled.
+        robot being controlled. For the native solver, resets the ik targets to the current eef pose (its warm-start
+        state is kept, since it is only used while close to the measured joint positions).
         """
 
         # update model (force update)
         self.update(force=True)
 
+        if self.ik_solver == "dls":
+            self.ik_robot_target_pos = np.array(self.ee_pos)
+            self.ik_robot_target_orn = T.mat2quat(self.ee_ori_mat)
+            self.ik_robot_target_pos_offset = np.zeros(3)
+            return
+
         # sync IK robot state to the current robot joint positions
         self.sync_ik_robot()
 
@@ -414,7 +477,8 @@ class InverseKinematicsController(JointVelocityController):
             np.array: a flat array of joint velocity commands to apply to try and achieve the desired input control.
         """
         # Sync joint positions for IK.
-        self.sync_ik_robot()
+        if self.ik_solver == "pybullet":
+            self.sync_ik_robot()
 
         # Compute new target joint positions if arguments are provided
         if (dpos is not None) and (rotation is not None):
@@ -476,6 +540,8 @@ class InverseKinematicsController(JointVelocityController):
         Returns:
             list: A list of size @num_joints corresponding to the target joint angles.
         """
+        if self.ik_solver == "dls":
+            return self._dls_joint_positions_for_eef_command(dpos, rotation, update_targets)
 
         # Calculate the rotation
         # This equals: inv base offset * eef * offset accounting for deviation between mujoco eef and pybullet eef
@@ -506,6 +572,38 @@ class InverseKinematicsController(JointVelocityController):
 
         return arm_joint_pos
 
+    def _dls_joint_positions_for_eef_command(self, dpos, rotation, update_targets=False):
+        """
+        Native counterpart of @joint_positions_for_eef_command. Targets are expressed directly in the mujoco world
+        frame, so no base / eef offsets to a separate ik robot are needed.
+
+        Args:
+            dpos (np.array): a 3 dimensional array corresponding to the desired
+                change in x, y, and z end effector position.
+            rotation (np.array): a rotation matrix of shape (3, 3) corresponding
+                to the desired rotation from the current orientation of the end effector.
+            update_targets (bool): whether to update ik target pos / ori attributes or not
+
+        Returns:
+            np.array: target joint positions
+        """
+        target_ori = self.ee_ori_mat @ rotation
+
+        # Determine targets based on whether we're using interpolator(s) or not
+        if self.interpolator_pos or self.interpolator_ori:
+            target_pos = self.ee_pos + dpos
+        else:
+            target_pos = self.ik_robot_target_pos + dpos
+
+        # Update targets if required
+        if update_targets:
+            self.ik_robot_target_pos += dpos
+            self.ik_robot_target_orn = T.mat2quat(target_ori)
+
+        # Solve, warm-started from the measured joint positions plus the offset of the previous solution (if small)
+        pose_error = np.concatenate([target_pos - self.ee_pos, orientation_error(target_ori, self.ee_ori_mat)])
+        return self.dls_solver.solve(self.J_full, pose_error, self.joint_pos)
+
     def bullet_base_pose_to_world_pose(self, pose_in_base):
         """
         Convert a pose in the base frame to a pose in the world frame.
@@ -616,10 +714,11 @@ class InverseKinematicsController(JointVelocityController):
         return super().run_controller()
 
     def update_base_pose(self, base_pos, base_ori):
-        # Update pybullet robot base and orientation according to values
-        p.resetBasePositionAndOrientation(
-            bodyUniqueId=self.ik_robot, posObj=base_pos, ornObj=base_ori, physicsClientId=self.bullet_server_id
-        )
+        # Update pybullet robot base and orientation according to values (the native solver works in the world frame)
+        if self.ik_solver == "pybullet":
+            p.resetBasePositionAndOrientation(
+                bodyUniqueId=self.ik_robot, posObj=base_pos, ornObj=base_ori, physicsClientId=self.bullet_server_id
+            )
 
         # Re-sync pybullet state
         self.sync_state()
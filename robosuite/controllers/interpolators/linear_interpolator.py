@@ -135,3 +135,173 @@ class LinearInterpolator(Interpolator):
 
         # Return the new interpolated step
         return x_current
+
+
+class LinearPoseInterpolator(Interpolator):
+    """
+    Linear interpolator for combined position and orientation goals. Equivalent to a pair of LinearInterpolators
+    (one for position, and one for orientation) that are stepped together, but instead of interpolating at every
+    controller step, the whole interpolated trajectory is precomputed once per set_goal() call and controller steps
+    are then served by index.
+
+    Goals can additionally have leading batch dimensions (e.g.: one row per arm), in which case all goals are
+    interpolated at once.
+
+    Args:
+        controller_freq (float): Frequency (Hz) of the controller
+
+        policy_freq (float): Frequency (Hz) of the policy model
+
+        ramp_ratio (float): Percentage of interpolation timesteps across which we will interpolate to a goal pose.
+
+            :Note: Num total interpolation steps will be equal to np.ceil(ramp_ratio * controller_freq / policy_freq)
+                    i.e.: how many controller steps we get per action space update
+
+        ori_interpolate (str): Determines assumed type of orientation input:
+
+                `'euler'`: Euler orientation inputs
+                `'quat'`: Quaternion inputs
+
+        batch_shape (tuple): Leading batch dimensions of the goals. Default is (), i.e.: a single pose goal
+    """
+
+    def __init__(
+        self,
+        controller_freq,
+        policy_freq,
+        ramp_ratio=0.2,
+        ori_interpolate="euler",
+        batch_shape=(),
+    ):
+        self.ori_interpolate = ori_interpolate  # Type of orientation inputs
+        self.order = 1  # Order of the interpolator (1 = linear)
+        self.step = 0  # Current step of the interpolator
+        self.total_steps = int(np.ceil(ramp_ratio * controller_freq / policy_freq))  # Num steps per interpolator action
+        self.batch_shape = tuple(batch_shape)
+
+        # Start and goal states
+        if self.ori_interpolate == "euler":
+            self.goal_ori = np.zeros(self.batch_shape + (3,))
+        else:  # quaternions
+            self.goal_ori = np.zeros(self.batch_shape + (4,))
+            self.goal_ori[..., 3] = 1.0
+        self.goal_pos = np.zeros(self.batch_shape + (3,))
+        self.start_pos = np.array(self.goal_pos)
+        self.start_ori = np.array(self.goal_ori)
+
+        # Precomputed (total_steps, *batch_shape, dim) trajectories
+        self.pos_trajectory = None
+        self.ori_trajectory = None
+        self._compute_trajectories()
+
+    def set_goal(self, goal_pos, goal_ori):
+        """
+        Takes a requested (absolute) goal pose and precomputes the interpolated trajectory to it from the last goal
+
+        Args:
+            goal_pos (np.array): Requested goal position, of shape (*batch_shape, 3)
+            goal_ori (np.array): Requested goal orientation, of shape (*batch_shape, 3) for euler orientations or
+                (*batch_shape, 4) for quaternions
+
+        Raises:
+            ValueError: [Invalid goal shape]
+        """
+        # First, check to make sure requested goal shapes are the same as the current ones
+        goal_pos, goal_ori = np.asarray(goal_pos, dtype=np.float64), np.asarray(goal_ori, dtype=np.float64)
+        if goal_pos.shape != self.goal_pos.shape or goal_ori.shape != self.goal_ori.shape:
+            raise ValueError(
+                "LinearPoseInterpolator: Input size wrong for goal; got {} and {}, needs to be {} and {}!".format(
+                    goal_pos.shape, goal_ori.shape, self.goal_pos.shape, self.goal_ori.shape
+                )
+            )
+
+        # Update start and goal
+        self.start_pos, self.start_ori = self.goal_pos, self.goal_ori
+        self.goal_pos, self.goal_ori = np.array(goal_pos), np.array(goal_ori)
+
+        # Precompute the trajectory and reset interpolation steps
+        self._compute_trajectories()
+        self.step = 0
+
+    def get_interpolated_goal(self):
+        """
+        Provides the next step in interpolation given the remaining steps.
+
+        Returns:
+            2-tuple:
+
+                - (np.array) Next position in the interpolated trajectory
+                - (np.array) Next orientation in the interpolated trajectory
+
+            Note that these are views into the precomputed trajectory, and should not be modified
+        """
+        pos, ori = self.pos_trajectory[self.step], self.ori_trajectory[self.step]
+
+        # Increment step if there's still steps remaining based on ramp ratio
+        if self.step < self.total_steps - 1:
+            self.step += 1
+
+        return pos, ori
+
+    def _compute_trajectories(self):
+        """
+        Precomputes the interpolated position and orientation trajectories from the start to the goal pose
+        """
+        steps = np.arange(self.total_steps).reshape((-1,) + (1,) * (len(self.batch_shape) + 1))
+
+        # Same as LinearInterpolator, which moves 1 / (num remaining steps) of the way from start to goal at each step
+        self.pos_trajectory = self.start_pos + (self.goal_pos - self.start_pos) / (self.total_steps - steps)
+
+        # Orientations are interpolated linearly around a sphere instead
+        start, goal = self.start_ori, self.goal_ori
+        if self.ori_interpolate == "euler":
+            # this is assumed to be euler angles (x,y,z), so we need to first map to quat
+            start, goal = self._euler2quat(start), self._euler2quat(goal)
+        quats = self._quat_slerp(start, goal, (steps + 1) / self.total_steps)
+        if self.ori_interpolate == "euler":
+            # Map back to euler
+            quats = np.array([T.mat2euler(T.quat2mat(quat)) for quat in quats.reshape(-1, 4)])
+            quats = quats.reshape((self.total_steps,) + self.batch_shape + (3,))
+        self.ori_trajectory = quats
+
+    @staticmethod
+    def _euler2quat(euler):
+        """
+        Converts (batched) euler angles to quaternions, matching T.mat2quat(T.euler2mat(euler))
+
+        Args:
+            euler (np.array): (..., 3) euler angles
+
+        Returns:
+            np.array: (..., 4) (x,y,z,w) quaternions
+        """
+        mats = T.euler2mat(euler).reshape(-1, 3, 3)
+        return np.array([T.mat2quat(mat) for mat in mats]).reshape(euler.shape[:-1] + (4,))
+
+    @staticmethod
+    def _quat_slerp(quat0, quat1, fraction):
+        """
+        Vectorized version of T.quat_slerp (always taking the shortest path)
+
+        Args:
+            quat0 (np.array): (..., 4) (x,y,z,w) quaternion startpoints
+            quat1 (np.array): (..., 4) (x,y,z,w) quaternion endpoints
+            fraction (np.array): fractions of interpolation to calculate, broadcastable against (..., 1)
+
+        Returns:
+            np.array: interpolated (x,y,z,w) quaternions
+        """
+        q0 = quat0 / np.linalg.norm(quat0, axis=-1, keepdims=True)
+        q1 = quat1 / np.linalg.norm(quat1, axis=-1, keepdims=True)
+        d = np.sum(q0 * q1, axis=-1, keepdims=True)
+
+        # invert rotation for the shortest path, and skip nearly identical endpoints
+        q1_shortest = np.where(d < 0.0, -q1, q1)
+        angle = np.arccos(np.clip(np.abs(d), -1, 1))
+        degenerate = (np.abs(np.abs(d) - 1.0) < T.EPS) | (angle < T.EPS)
+        isin = 1.0 / np.sin(np.where(degenerate, 1.0, angle))
+        quats = q0 * np.sin((1.0 - fraction) * angle) * isin + q1_shortest * np.sin(fraction * angle) * isin
+        quats = np.where(degenerate, q0, quats)
+
+        # The endpoints are returned as is
+        return np.where(fraction == 1.0, q1, np.where(fraction == 0.0, q0, quats))
@@ -76,6 +76,9 @@ class JointPositionController(Controller):
         interpolator (Interpolator): Interpolator object to be used for interpolating from the current joint position to
             the goal joint position during each timestep between inputted actions
 
+        mass_matrix_provider (None or MassMatrixProvider): Provider to extract this controller's mass matrix with. If
+            None, a new provider will be created
+
         **kwargs: Does nothing; placeholder to "sink" any additional arguments so that instantiating this controller
             via an argument dict that has additional extraneous arguments won't raise an error
 
@@ -83,6 +86,9 @@ class JointPositionController(Controller):
         AssertionError: [Invalid impedance mode]
     """
 
+    # Joint-space impedance control only needs the joint state and mass matrix
+    requirements = frozenset({"joint_state", "mass_matrix"})
+
     def __init__(
         self,
         sim,
@@ -101,6 +107,7 @@ class JointPositionController(Controller):
         policy_freq=20,
         qpos_limits=None,
         interpolator=None,
+        mass_matrix_provider=None,
         **kwargs,  # does nothing; used so no error raised when dict is passed with extra terms used previously
     ):
 
@@ -109,6 +116,7 @@ class JointPositionController(Controller):
             eef_name,
             joint_indexes,
             actuator_range,
+            mass_matrix_provider=mass_matrix_provider,
         )
 
         # Control dimension
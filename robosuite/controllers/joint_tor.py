@@ -52,10 +52,16 @@ class JointTorqueController(Controller):
         interpolator (Interpolator): Interpolator object to be used for interpolating from the current joint torques to
             the goal joint torques during each timestep between inputted actions
 
+        mass_matrix_provider (None or MassMatrixProvider): Provider to extract this controller's mass matrix with. If
+            None, a new provider will be created
+
         **kwargs: Does nothing; placeholder to "sink" any additional arguments so that instantiating this controller
             via an argument dict that has additional extraneous arguments won't raise an error
     """
 
+    # Torques are passed through, so only the joint state (e.g.: for the initial joint positions) is needed
+    requirements = frozenset({"joint_state"})
+
     def __init__(
         self,
         sim,
@@ -69,6 +75,7 @@ class JointTorqueController(Controller):
         policy_freq=20,
         torque_limits=None,
         interpolator=None,
+        mass_matrix_provider=None,
         **kwargs,  # does nothing; used so no error raised when dict is passed with extra terms used previously
     ):
 
@@ -77,6 +84,7 @@ class JointTorqueController(Controller):
             eef_name,
             joint_indexes,
             actuator_range,
+            mass_matrix_provider=mass_matrix_provider,
         )
 
         # Control dimension
@@ -53,10 +53,16 @@ class JointVelocityController(Controller):
         interpolator (Interpolator): Interpolator object to be used for interpolating from the current joint velocities
             to the goal joint velocities during each timestep between inputted actions
 
+        mass_matrix_provider (None or MassMatrixProvider): Provider to extract this controller's mass matrix with. If
+            None, a new provider will be created
+
         **kwargs: Does nothing; placeholder to "sink" any additional arguments so that instantiating this controller
             via an argument dict that has additional extraneous arguments won't raise an error
     """
 
+    # Joint velocity control only needs the joint state
+    requirements = frozenset({"joint_state"})
+
     def __init__(
         self,
         sim,
@@ -71,6 +77,7 @@ class JointVelocityController(Controller):
         policy_freq=20,
         velocity_limits=None,
         interpolator=None,
+        mass_matrix_provider=None,
         **kwargs,  # does nothing; used so no error raised when dict is passed with extra terms used previously
     ):
 
@@ -79,6 +86,7 @@ class JointVelocityController(Controller):
             eef_name,
             joint_indexes,
             actuator_range,
+            mass_matrix_provider=mass_matrix_provider,
         )
         # Control dimension
         self.control_dim = len(joint_indexes["joints"])
@@ -90,6 +90,10 @@ class OperationalSpaceController(Controller):
         interpolator_ori (Interpolator): Interpolator object to be used for interpolating from the current orientation
             to the goal orientation during each timestep between inputted actions
 
+        interpolator_pose (LinearPoseInterpolator): Combined position / orientation interpolator, which precomputes
+            the interpolated trajectory whenever a new goal is set. If specified, it is used instead of
+            @interpolator_pos and @interpolator_ori
+
         control_ori (bool): Whether inputted actions will control both pos and ori or exclusively pos
 
         control_delta (bool): Whether to control the robot using delta or absolute commands (where absolute commands
@@ -97,6 +101,24 @@ class OperationalSpaceController(Controller):
 
         uncouple_pos_ori (bool): Whether to decouple torques meant to control pos and torques meant to control ori
 
+        fused_kernel (bool): Whether to compute torques with the single fused @opspace_torques kernel, or by chaining
+            @opspace_matrices and @nullspace_torques. Both produce the same torques up to floating point error, but
+            the fused kernel avoids most of the per-call overhead
+
+        opspace_cache_tol (None or float): If set, the operational space matrices (lambda and nullspace matrices,
+            which only depend on the arm configuration) are cached and re-used across controller updates for as long
+            as no joint moved by more than this tolerance from the configuration they were computed at. This trades
+            some accuracy of the dynamics decoupling for speed, e.g.: during long free-space motions. With the fused
+            kernel, the cached matrices are passed to @opspace_torques_from_matrices, which skips the solves and
+            pseudo-inverses of @opspace_torques. The resulting hit rate is reported by @opspace_cache_hit_rate
+
+        update_period (int): Number of simulation substeps between evaluations of this controller, as scheduled by
+            the robot owning it (see Robot._make_controller_schedule). Only used to validate @run_batch, which
+            evaluates controllers at every call
+
+        mass_matrix_provider (None or MassMatrixProvider): Provider to extract this controller's mass matrix with. If
+            None, a new provider will be created
+
         **kwargs: Does nothing; placeholder to "sink" any additional arguments so that instantiating this controller
             via an argument dict that has additional extraneous arguments won't raise an error
 
@@ -124,9 +146,14 @@ class OperationalSpaceController(Controller):
         orientation_limits=None,
         interpolator_pos=None,
         interpolator_ori=None,
+        interpolator_pose=None,
         control_ori=True,
         control_delta=True,
         uncouple_pos_ori=True,
+        fused_kernel=True,
+        opspace_cache_tol=None,
+        update_period=1,
+        mass_matrix_provider=None,
         **kwargs,  # does nothing; used so no error raised when dict is passed with extra terms used previously
     ):
 
@@ -135,6 +162,7 @@ class OperationalSpaceController(Controller):
             eef_name,
             joint_indexes,
             actuator_range,
+            mass_matrix_provider=mass_matrix_provider,
         )
         # Determine whether this is pos ori or just pos
         self.use_ori = control_ori
@@ -193,10 +221,24 @@ class OperationalSpaceController(Controller):
         # interpolator
         self.interpolator_pos = interpolator_pos
         self.interpolator_ori = interpolator_ori
+        self.interpolator_pose = interpolator_pose
 
         # whether or not pos and ori want to be uncoupled
         self.uncoupling = uncouple_pos_ori
 
+        # whether to use the fused torque kernel
+        self.fused_kernel = fused_kernel
+
+        # cache of opspace matrices, re-used while the joints stay within tolerance of where they were computed
+        self.opspace_cache_tol = opspace_cache_tol
+        self._opspace_cache = None
+        self._opspace_cache_joint_pos = None
+        self.opspace_cache_hits = 0
+        self.opspace_cache_queries = 0
+
+        # number of simulation substeps between evaluations of this controller
+        self.update_period = int(update_period)
+
         # initialize goals based on initial pos / ori
         self.goal_ori = np.array(self.initial_ee_ori_mat)
         self.goal_pos = np.array(self.initial_ee_pos)
@@ -305,15 +347,7 @@ class OperationalSpaceController(Controller):
         # print("body pos", self.sim.data.site_xpos[4])
         # print("body mat", self.sim.data.get_body_xmat('robot0_right_hand'))
         # print("body quat", T.convert_quat(self.sim.data.get_body_xquat('robot0_right_hand'), to="xyzw"))
-        if self.interpolator_pos is not None:
-            self.interpolator_pos.set_goal(self.goal_pos)
-
-        if self.interpolator_ori is not None:
-            self.ori_ref = np.array(self.ee_ori_mat)  # reference is the current orientation at start
-            self.interpolator_ori.set_goal(
-                orientation_error(self.goal_ori, self.ori_ref)
-            )  # goal is the total orientation error
-            self.relative_ori = np.zeros(3)  # relative orientation always starts at 0
+        self._set_interpolator_goals()
 
     def run_controller(self):
         """
@@ -330,29 +364,35 @@ class OperationalSpaceController(Controller):
         # Update state
         self.update()
 
-        desired_pos = None
-        # Only linear interpolator is currently supported
-        if self.interpolator_pos is not None:
-            # Linear case
-            if self.interpolator_pos.order == 1:
-                desired_pos = self.interpolator_pos.get_interpolated_goal()
+        # Compute position and orientation errors w.r.t. the (interpolated) goal
+        position_error, ori_error = self._compute_pose_errors()
+
+        if self.fused_kernel:
+            kernel_args = (
+                position_error,
+                ori_error,
+                np.concatenate([self.ee_pos_vel, self.ee_ori_vel]),
+                self.kp,
+                self.kd,
+                self.initial_joint,
+                self.joint_pos,
+                self.joint_vel,
+                self.uncoupling,
+            )
+            if self.opspace_cache_tol is None:
+                torques = opspace_torques(self.mass_matrix, self.J_full, *kernel_args)
             else:
-                # Nonlinear case not currently supported
-                pass
-        else:
-            desired_pos = np.array(self.goal_pos)
+                # Re-use the (possibly cached) opspace matrices instead of recomputing them within the kernel
+                torques = opspace_torques_from_matrices(
+                    self.mass_matrix, self.J_full, *self._get_opspace_matrices(), *kernel_args
+                )
+            self.torques = torques + self.torque_compensation
 
-        if self.interpolator_ori is not None:
-            # relative orientation based on difference between current ori and ref
-            self.relative_ori = orientation_error(self.ee_ori_mat, self.ori_ref)
+            # Always run superclass call for any cleanups at the end
+            super().run_controller()
 
-            ori_error = self.interpolator_ori.get_interpolated_goal()
-        else:
-            desired_ori = np.array(self.goal_ori)
-            ori_error = orientation_error(desired_ori, self.ee_ori_mat)
+            return self.torques
 
-        # Compute desired force and torque based on errors
-        position_error = desired_pos - self.ee_pos
         vel_pos_error = -self.ee_pos_vel
 
         # F_r = kp * pos_err + kd * vel_err
@@ -368,9 +408,7 @@ class OperationalSpaceController(Controller):
         )
 
         # Compute nullspace matrix (I - Jbar * J) and lambda matrices ((J * M^-1 * J^T)^-1)
-        lambda_full, lambda_pos, lambda_ori, nullspace_matrix = opspace_matrices(
-            self.mass_matrix, self.J_full, self.J_pos, self.J_ori
-        )
+        lambda_full, lambda_pos, lambda_ori, nullspace_matrix = self._get_opspace_matrices()
 
         # Decouples desired positional control from orientation control
         if self.uncoupling:
@@ -396,6 +434,142 @@ class OperationalSpaceController(Controller):
 
         return self.torques
 
+    def _get_opspace_matrices(self):
+        """
+        Computes the lambda and nullspace matrices for the current arm configuration (see @opspace_matrices), or
+        re-uses the cached ones if caching is enabled and no joint has moved by more than self.opspace_cache_tol since
+        they were computed. Assumes that self.update() has already been called this step.
+
+        Returns:
+            4-tuple: (lambda_full, lambda_pos, lambda_ori, nullspace_matrix)
+        """
+        if self.opspace_cache_tol is None:
+            return opspace_matrices(self.mass_matrix, self.J_full, self.J_pos, self.J_ori)
+
+        self.opspace_cache_queries += 1
+        if (
+            self._opspace_cache is not None
+            and np.max(np.abs(self.joint_pos - self._opspace_cache_joint_pos)) <= self.opspace_cache_tol
+        ):
+            self.opspace_cache_hits += 1
+            return self._opspace_cache
+
+        self._opspace_cache = opspace_matrices(self.mass_matrix, self.J_full, self.J_pos, self.J_ori)
+        self._opspace_cache_joint_pos = np.array(self.joint_pos)
+        return self._opspace_cache
+
+    def _compute_pose_errors(self):
+        """
+        Computes the errors between the current (interpolated) goal pose and the current eef pose. Assumes that
+        self.update() has already been called for the current simulation state.
+
+        Returns:
+            2-tuple:
+
+                - (np.array) position error (desired - current)
+                - (np.array) orientation error (as an axis-angle vector)
+        """
+        if self.interpolator_pose is not None:
+            desired_pos, ori_error = self.interpolator_pose.get_interpolated_goal()
+            # relative orientation based on difference between current ori and ref
+            self.relative_ori = orientation_error(self.ee_ori_mat, self.ori_ref)
+
+            return desired_pos - self.ee_pos, ori_error
+
+        desired_pos = None
+        # Only linear interpolator is currently supported
+        if self.interpolator_pos is not None:
+            # Linear case
+            if self.interpolator_pos.order == 1:
+                desired_pos = self.interpolator_pos.get_interpolated_goal()
+            else:
+                # Nonlinear case not currently supported
+                pass
+        else:
+            desired_pos = np.array(self.goal_pos)
+
+        if self.interpolator_ori is not None:
+            # relative orientation based on difference between current ori and ref
+            self.relative_ori = orientation_error(self.ee_ori_mat, self.ori_ref)
+
+            ori_error = self.interpolator_ori.get_interpolated_goal()
+        else:
+            desired_ori = np.array(self.goal_ori)
+            ori_error = orientation_error(desired_ori, self.ee_ori_mat)
+
+        position_error = desired_pos - self.ee_pos
+
+        return position_error, ori_error
+
+    @staticmethod
+    def run_batch(controllers):
+        """
+        Calculates the torques required to reach the desired setpoints of several OSC controllers at once.
+
+        Each controller's state is updated and its pose errors computed individually, but the operational space
+        matrices and resulting torques of all controllers are computed jointly with batched linear algebra (see
+        @opspace_torques_batch). This allows e.g.: a multi-env runner to amortize the controller math across
+        environments. All controllers must control the same number of joints.
+
+        Since the batched kernel is the batched analogue of the fused kernel, and evaluates every controller at every
+        call, all controllers must use the fused kernel (@fused_kernel without @opspace_cache_tol) and be evaluated at
+        every simulation substep (@update_period of 1).
+
+        Args:
+            controllers (list of OperationalSpaceController): Controllers to run. Each controller's self.torques is
+                updated just as if its run_controller() method had been called
+
+        Returns:
+            np.array: (B, n) command torques, where row i corresponds to controllers[i]
+
+        Raises:
+            AssertionError: [Controller incompatible with batched evaluation]
+        """
+        for controller in controllers:
+            assert (
+                controller.fused_kernel and controller.opspace_cache_tol is None
+            ), "Batched OSC evaluation requires the fused kernel without opspace matrix caching"
+            assert (
+                controller.update_period == 1
+            ), "Batched OSC evaluation requires an update period of 1, got: {}".format(controller.update_period)
+
+        # Controllers only update the mass matrix providers they own, so update the shared ones (once each) here
+        shared_providers = {
+            id(controller.mass_matrix_provider): controller.mass_matrix_provider
+            for controller in controllers
+            if not controller._owns_mass_matrix_provider
+        }
+        for provider in shared_providers.values():
+            provider.update()
+
+        position_errors, ori_errors = [], []
+        for controller in controllers:
+            controller.update()
+            position_error, ori_error = controller._compute_pose_errors()
+            position_errors.append(position_error)
+            ori_errors.append(ori_error)
+
+        torques = opspace_torques_batch(
+            np.stack([controller.mass_matrix for controller in controllers]),
+            np.stack([controller.J_full for controller in controllers]),
+            np.stack(position_errors),
+            np.stack(ori_errors),
+            np.stack([np.concatenate([controller.ee_pos_vel, controller.ee_ori_vel]) for controller in controllers]),
+            np.stack([controller.kp for controller in controllers]),
+            np.stack([controller.kd for controller in controllers]),
+            np.stack([controller.initial_joint for controller in controllers]),
+            np.stack([controller.joint_pos for controller in controllers]),
+            np.stack([controller.joint_vel for controller in controllers]),
+            np.array([controller.uncoupling for controller in controllers]),
+        )
+        for controller, controller_torques in zip(controllers, torques):
+            controller.torques = controller_torques + controller.torque_compensation
+
+            # Always run superclass call for any cleanups at the end
+            Controller.run_controller(controller)
+
+        return np.stack([controller.torques for controller in controllers])
+
     def update_initial_joints(self, initial_joints):
         # First, update from the superclass method
         super().update_initial_joints(initial_joints)
@@ -411,6 +585,19 @@ class OperationalSpaceController(Controller):
         self.goal_pos = np.array(self.ee_pos)
 
         # Also reset interpolators if required
+        self._set_interpolator_goals()
+
+    def _set_interpolator_goals(self):
+        """
+        Sets the goals of any interpolators to the current goal pos / ori
+        """
+        if self.interpolator_pose is not None:
+            self.ori_ref = np.array(self.ee_ori_mat)  # reference is the current orientation at start
+            self.interpolator_pose.set_goal(
+                self.goal_pos, orientation_error(self.goal_ori, self.ori_ref)
+            )  # orientation goal is the total orientation error
+            self.relative_ori = np.zeros(3)  # relative orientation always starts at 0
+            return
 
         if self.interpolator_pos is not None:
             self.interpolator_pos.set_goal(self.goal_pos)
@@ -422,6 +609,16 @@ class OperationalSpaceController(Controller):
             )  # goal is the total orientation error
             self.relative_ori = np.zeros(3)  # relative orientation always starts at 0
 
+    @property
+    def opspace_cache_hit_rate(self):
+        """
+        Fraction of controller updates that re-used cached opspace matrices (see @opspace_cache_tol)
+
+        Returns:
+            float: Hit rate of the opspace matrices cache, or 0 if it hasn't been queried yet
+        """
+        return self.opspace_cache_hits / self.opspace_cache_queries if self.opspace_cache_queries > 0 else 0.0
+
     @property
     def control_limits(self):
         """
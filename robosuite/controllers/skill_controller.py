@@ -26,7 +26,10 @@ class SkillController:
                  render=False,
                  reach_use_gripper=False,
                  env_idx=None,
-                 output_mode=None):
+                 output_mode=None,
+                 record_mode='all',
+                 record_every_k=1,
+                 record_buffer_size=None):
 
         self._env = env
         self._env_idx = env_idx
@@ -60,7 +63,11 @@ class SkillController:
             binary_gripper=False,
             env_idx=env_idx,
             push_height_thres=None,
-            controller_type=controller_type
+            controller_type=controller_type,
+            # Trajectory recording policy, see SkillRecorder
+            record_mode=record_mode,
+            record_every_k=record_every_k,
+            record_buffer_size=record_buffer_size,
         )
 
         try:
@@ -215,7 +222,7 @@ class SkillController:
             mask=mask
         )
 
-    def execute(self, p_name, skill_args, norm, **kwargs):
+    def _check_skill_args(self, p_name, skill_args, norm):
         # len(args) = maximal argument length
         skill = self.name_to_skill[p_name]
         param_dim = skill.get_param_dim()
@@ -230,12 +237,19 @@ class SkillController:
             print("p", p_name)
             print("args", skill_args)
             pass
-        ret = skill.act(skill_args, norm=norm)
+
+    def _add_interaction_info(self, skill, ret):
         if ret is not None:
             ret['info']['interest_interaction'] = skill.check_interesting_interaction()
             ret['info']['done_interaction'] = skill.is_success()
         return ret
 
+    def execute(self, p_name, skill_args, norm, **kwargs):
+        self._check_skill_args(p_name, skill_args, norm)
+        skill = self.name_to_skill[p_name]
+        ret = skill.act(skill_args, norm=norm)
+        return self._add_interaction_info(skill, ret)
+
     def get_normalized_params(self, p_name, unnorm_params):
         skill = self.name_to_skill[p_name]
         param_dim = skill.get_param_dim()
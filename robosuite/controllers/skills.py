@@ -1,7 +1,126 @@
+import contextlib
 import numpy as np
 import robosuite.utils.transform_utils as T
 from robosuite.utils.env_utils import get_eef_pos, get_eef_quat, get_axisangle_error
 from robosuite.utils.primitive_utils import inverse_scale_action
+from collections import OrderedDict
+
+RECORD_MODES = ['all', 'none', 'final', 'every_k', 'buffer']
+
+@contextlib.contextmanager
+def _no_op_context():
+    # Stand-in for contextlib.nullcontext, which is only available from python 3.7 on
+    yield
+
+class SkillRecorder:
+    """
+    Records the trajectory (observations, states, actions) of a single skill execution according to a recording policy:
+
+        'all': every observation and state as lists (default)
+        'none': nothing
+        'final': only the final observation, state, and action
+        'every_k': the initial observation / state, every k-th one after that, and the final one. Actions (which are
+            cheap) are always recorded in full
+        'buffer': every observation, state, and action, written into numpy arrays that are preallocated once and
+            re-used across executions. If a skill runs for longer than @buffer_size steps, only the latest ones are
+            kept. Note that the returned arrays are overwritten by the next execution, so they should be copied if
+            they need to persist
+
+    States are only queried when they are actually recorded.
+    """
+    def __init__(self, mode='all', every_k=1, buffer_size=None):
+        assert mode in RECORD_MODES, "Invalid record mode: {}. Valid options are: {}".format(mode, RECORD_MODES)
+        assert every_k >= 1
+        self.mode = mode
+        self.every_k = every_k
+        self.buffer_size = buffer_size
+        self._obs_buffers = None
+        self._action_buffer = None
+        self._step = 0
+        self._last_recorded = -1
+        self._count = 0
+
+    def start(self, obs, get_state, max_steps):
+        self._step = 0
+        self._count = 0
+        self._last_recorded = -1
+        self._obs_list, self._state_list, self._action_list = [], [], []
+        if self.mode in ['all', 'every_k', 'buffer']:
+            state = get_state()
+            if self.mode == 'buffer':
+                self._ensure_buffers(obs, state, max_steps)
+            self._record(obs, lambda: state)
+
+    def add(self, obs, get_state, action):
+        self._step += 1
+        if self.mode == 'none':
+            return
+        if self.mode == 'final':
+            self._last_action = action
+            return
+        if self.mode == 'buffer':
+            # Each action is stored alongside the observation it led to
+            if self._action_buffer is None or self._action_buffer.shape[1:] != np.shape(action):
+                self._action_buffer = np.empty((self._capacity,) + np.shape(action), dtype=np.float64)
+            self._action_buffer[self._count % self._capacity] = action
+        else:
+            self._action_list.append(action)
+        if self.mode != 'every_k' or self._step % self.every_k == 0:
+            self._record(obs, get_state)
+
+    @property
+    def records_intermediate_obs(self):
+        """Whether observations in between the initial and final ones are recorded"""
+        return self.mode in ['all', 'every_k', 'buffer']
+
+    def finish(self, obs, get_state, info):
+        if self.mode == 'final':
+            self._obs_list = [obs]
+            self._state_list = [get_state()]
+            self._action_list = [self._last_action]
+        elif self.mode == 'every_k' and self._last_recorded != self._step:
+            self._record(obs, get_state)
+
+        if self.mode == 'buffer':
+            # Order the ring buffer chronologically (only requires a copy if it has wrapped around)
+            if self._count > self._capacity:
+                order = np.arange(self._count - self._capacity, self._count) % self._capacity
+            else:
+                order = slice(0, self._count)
+            info['obs_list'] = OrderedDict((k, v[order]) for k, v in self._obs_buffers.items())
+            info['state_list'] = self._state_buffer[order]
+            # Actions that led to each of the recorded observations (except the first)
+            info['action_list'] = self._action_buffer[order][1:] if self._action_buffer is not None \
+                else np.zeros((0,))
+        else:
+            info['obs_list'] = self._obs_list
+            info['state_list'] = self._state_list
+            info['action_list'] = self._action_list
+
+    def _record(self, obs, get_state):
+        self._last_recorded = self._step
+        if self.mode == 'buffer':
+            i = self._count % self._capacity
+            for k, buf in self._obs_buffers.items():
+                buf[i] = obs[k]
+            self._state_buffer[i] = get_state()
+        else:
+            self._obs_list.append(obs)
+            self._state_list.append(get_state())
+        self._count += 1
+
+    def _ensure_buffers(self, obs, state, max_steps):
+        # By default, hold the initial observation plus one per step
+        capacity = self.buffer_size if self.buffer_size is not None else max_steps + 2
+        if self._obs_buffers is not None and self._capacity == capacity and \
+                all(self._obs_buffers[k].shape[1:] == np.shape(v) for k, v in obs.items()):
+            return
+        self._capacity = capacity
+        self._obs_buffers = OrderedDict(
+            (k, np.empty((capacity,) + np.shape(v), dtype=np.asarray(v).dtype)) for k, v in obs.items()
+        )
+        self._state_buffer = np.empty((capacity,) + np.shape(state), dtype=np.asarray(state).dtype)
+        self._action_buffer = None
 
 class BaseSkill:
     def __init__(self,
@@ -56,6 +175,12 @@ class BaseSkill:
 
         assert self._config['aff_type'] in [None, 'sparse', 'dense']
 
+        self._recorder = SkillRecorder(
+            mode=self._config.get('record_mode', 'all'),
+            every_k=self._config.get('record_every_k', 1),
+            buffer_size=self._config.get('record_buffer_size', None),
+        )
+
     def get_param_dim(self):
         raise NotImplementedError
 
@@ -139,7 +264,7 @@ class BaseSkill:
     def _reached_goal_ori_y(self):
         if not self._config['use_ori_params']:
             return True
-        obs = self._env.get_observation()
+        obs = self._get_observation()
         cur_quat = get_eef_quat(obs)
         cur_y = T.mat2euler(T.quat2mat(cur_quat), axes='rxyz')[-1:]
         target_y = self._get_ori_ac()
@@ -152,8 +277,16 @@ class BaseSkill:
         )
         return ee_yaw_diff[-1] <= self._config['yaw_thres']
 
+    def _get_observation(self):
+        # Observations are memoized per simulation state, since they are queried several times per control step
+        return self._env.env.get_snapshot('skill_observation', self._env.get_observation)
+
+    def _set_observation(self, obs):
+        # Seeds the memoized observation with one already computed for the current simulation state, e.g.: by step()
+        self._env.env.set_snapshot('skill_observation', obs)
+
     def _get_info(self):
-        info = self._env.env._get_skill_info()
+        info = self._env.env.get_snapshot('skill_info', self._env.env._get_skill_info)
         return info
 
     def _get_action(self):
@@ -164,35 +297,38 @@ class BaseSkill:
         self._reset(params, norm)
         image_obs = []
         reward_sum = 0
-        obs_list = []
-        state_list = []
-        action_list = []
-        obs = self._env.get_observation()
-        state = self._env.get_state()
-        obs_list.append(obs)
-        state_list.append(state["states"])
-        while True:
-            action = self._get_action()
-            action_list.append(action)
-            obs, reward, done, info = self._env.step(action)
-            obs_list.append(obs)
-            state_list.append(self._env.get_state()["states"])
-            info['last_gripper_ac'] = action[-1:]
-            if self._config['render']:
-                self._env.render()
-            reward_sum += reward
-            if self._config['image_obs_in_info']:
-                image_obs.append(self._env.render(mode="rgb_array", height=256, width=256, camera_name='agentview'))
-
-            if self.skill_done() or done:
-                self._env_done = done
-                break
+        get_state = lambda: self._env.get_state()["states"]
+        obs = self._get_observation()
+        self._recorder.start(obs, get_state, self.get_max_ac_calls())
+        # Skills only need proprioception while executing, so unless intermediate observations are recorded, camera
+        # observables are only rendered once the skill is done
+        defer_rendering = not self._recorder.records_intermediate_obs and self._env.env.use_camera_obs
+        with self._env.env.deferred_camera_rendering() if defer_rendering else _no_op_context():
+            while True:
+                action = self._get_action()
+                obs, reward, done, info = self._env.step(action)
+                self._set_observation(obs)
+                self._recorder.add(obs, get_state, action)
+                info['last_gripper_ac'] = action[-1:]
+                if self._config['render']:
+                    self._env.render()
+                reward_sum += reward
+                if self._config['image_obs_in_info']:
+                    image_obs.append(
+                        self._env.render(mode="rgb_array", height=256, width=256, camera_name='agentview')
+                    )
+
+                if self.skill_done() or done:
+                    self._env_done = done
+                    break
+        if defer_rendering:
+            # Grab the final observation again, now that the cameras have been rendered (which invalidated the
+            # memoized observation)
+            obs = self._get_observation()
 
         if self._config['image_obs_in_info']:
             info['image_obs'] = image_obs
-        info['obs_list'] = obs_list
-        info['state_list'] = state_list
-        info['action_list'] = action_list
+        self._recorder.finish(obs, get_state, info)
         info['env_done'] = done
         self._update_info(info)
         return dict(obs=obs, info=info)
@@ -293,7 +429,7 @@ class GripperSkill(BaseSkill):
         return None
 
     def _get_reach_pos(self):
-        obs = self._env.get_observation()
+        obs = self._get_observation()
         eef_pos = get_eef_pos(obs)
         return eef_pos
 
@@ -365,7 +501,7 @@ class ReachSkill(BaseSkill):
         return param_dim
 
     def _update_state(self):
-        obs = self._env.get_observation()
+        obs = self._get_observation()
         cur_pos = get_eef_pos(obs)
         goal_pos = self._get_reach_pos()
 
@@ -390,7 +526,7 @@ class ReachSkill(BaseSkill):
 
     def _get_pos_ac(self):
         self._check_params_dim()
-        obs = self._env.get_observation()
+        obs = self._get_observation()
         cur_pos = get_eef_pos(obs)
         goal_pos = self._get_reach_pos()
 
@@ -457,7 +593,7 @@ class ReachSkill(BaseSkill):
 
     def _get_action(self):
         super()._get_action()
-        obs = self._env.get_observation()
+        obs = self._get_observation()
         cur_pos = get_eef_pos(obs)
         pos = self._get_pos_ac()
         pos_action = pos - cur_pos
@@ -544,7 +680,7 @@ class GraspSkill(BaseSkill):
         return pos
 
     def _update_state(self):
-        obs = self._env.get_observation()
+        obs = self._get_observation()
         cur_pos = get_eef_pos(obs)
         goal_pos = self._get_reach_pos()
 
@@ -579,7 +715,7 @@ class GraspSkill(BaseSkill):
         assert self._state in GraspSkill.STATES
 
     def _get_pos_ac(self):
-        obs = self._env.get_observation()
+        obs = self._get_observation()
         cur_pos = get_eef_pos(obs)
         goal_pos = self._get_reach_pos()
 
@@ -643,7 +779,7 @@ class GraspSkill(BaseSkill):
 
     def _get_action(self):
         super()._get_action()
-        obs = self._env.get_observation()
+        obs = self._get_observation()
         cur_pos = get_eef_pos(obs)
         pos = self._get_pos_ac()
         pos_action = pos - cur_pos
@@ -739,7 +875,7 @@ class PlaceSkill(BaseSkill):
         return pos
 
     def _update_state(self):
-        obs = self._env.get_observation()
+        obs = self._get_observation()
         cur_pos = get_eef_pos(obs)
         goal_pos = self._get_reach_pos()
 
@@ -796,7 +932,7 @@ class PlaceSkill(BaseSkill):
         assert self._state in PlaceSkill.STATES
 
     def _get_pos_ac(self):
-        obs = self._env.get_observation()
+        obs = self._get_observation()
         cur_pos = get_eef_pos(obs)
         goal_pos = self._get_reach_pos()
 
@@ -851,7 +987,7 @@ class PlaceSkill(BaseSkill):
 
     def _get_action(self):
         super()._get_action()
-        obs = self._env.get_observation()
+        obs = self._get_observation()
         cur_pos = get_eef_pos(obs)
         pos = self._get_pos_ac()
         pos_action = pos - cur_pos
@@ -879,7 +1015,7 @@ class PlaceSkill(BaseSkill):
 
     def check_interesting_interaction(self):
         super().check_interesting_interaction()
-        end_obs = self._env.get_observation()
+        end_obs = self._get_observation()
         eef_pos = get_eef_pos(end_obs)
         for obj in self._env.env.pnp_objs:
             if self._check_grasp(obj):
@@ -967,7 +1103,7 @@ class PushSkill(BaseSkill):
         return pos
 
     def _update_state(self):
-        obs = self._env.get_observation()
+        obs = self._get_observation()
         cur_pos = get_eef_pos(obs)
         src_pos = self._get_reach_pos()
         target_pos = self._get_push_pos()
@@ -1010,7 +1146,7 @@ class PushSkill(BaseSkill):
 
     def _get_pos_ac(self):
         self._check_params_dim()
-        obs = self._env.get_observation()
+        obs = self._get_observation()
         cur_pos = get_eef_pos(obs)
         src_pos = self._get_reach_pos()
         target_pos = self._get_push_pos()
@@ -1063,7 +1199,7 @@ class PushSkill(BaseSkill):
 
     def _get_action(self):
         super()._get_action()
-        obs = self._env.get_observation()
+        obs = self._get_observation()
         cur_pos = get_eef_pos(obs)
         pos = self._get_pos_ac()
         if self._state == 'REACHED':
@@ -1103,7 +1239,7 @@ class PushSkill(BaseSkill):
                 pass
             obj_pos = self._env.env.sim.data.body_xpos[self._env.env.push_obj_body_ids[obj_id]].copy()
             initial_obj_pos = self._initial_obj_pos[obj_id]
-            obs = self._env.get_observation()
+            obs = self._get_observation()
             eef_pos = get_eef_pos(obs)
             if np.linalg.norm(obj_pos[:2] - initial_obj_pos[:2]) > 0.07:
                 return True
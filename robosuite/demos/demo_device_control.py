@@ -43,9 +43,6 @@ Choice of using either inverse kinematics controller (ik) or operational space c
 Main difference is that user inputs with ik's rotations are always taken relative to eef coordinate frame, whereas
     user inputs with osc's rotations are taken relative to global frame (i.e.: static / camera frame of reference).
 
-    Notes:
-        OSC also tends to be more computationally efficient since IK relies on the backend pybullet IK solver.
-
 
 ***Choose environment specifics with the following arguments***
 
@@ -1,16 +1,22 @@
 from collections import OrderedDict
 
 import numpy as np
-from mujoco_py import MjRenderContextOffscreen, MjSim, load_model_from_xml
+from mujoco_py import MjRenderContextOffscreen, MjSim
 
 import robosuite.utils.macros as macros
 from robosuite.models.base import MujocoModel
 from robosuite.renderers.base import load_renderer_config
 from robosuite.renderers.mujoco.mujoco_py_renderer import MujocoPyRenderer
 from robosuite.utils import SimulationError, XMLError
+from robosuite.utils.lookup_utils import NameLookupMonitor
+from robosuite.utils.model_cache import load_model
+from robosuite.utils.observables import Observable
 
 REGISTERED_ENVS = {}
 
+# Simulation data fields (besides time) whose changes invalidate memoized snapshots (see MujocoEnv.get_snapshot())
+SNAPSHOT_STATE_FIELDS = ("qpos", "qvel", "act", "ctrl", "mocap_pos", "mocap_quat")
+
 
 def register_env(target_class):
     REGISTERED_ENVS[target_class.__name__] = target_class
@@ -74,11 +80,15 @@ class MujocoEnv(metaclass=EnvMeta):
             that passes between every action input.
         horizon (int): Every episode lasts for exactly @horizon timesteps.
         ignore_done (bool): True if never terminating the environment (ignore @horizon).
-        hard_reset (bool): If True, re-loads model, sim, and render object upon a reset call, else,
-            only calls sim.reset and resets all robosuite-internal variables
+        hard_reset (bool or str): If True, re-loads model, sim, and render object upon a reset call, else,
+            only calls sim.reset and resets all robosuite-internal variables. "soft" is the same as False, plus the
+            _requires_model_rebuild() hook: the model is only re-loaded on resets for which that hook returns True.
+            Object poses and robot joint positions are still resampled on every reset in either case. Other truthy /
+            falsy values (e.g.: 1 or np.bool_) are treated as True / False
         renderer (str): string for the renderer to use
         renderer_config (dict): dictionary for the renderer configurations
     Raises:
+        ValueError: [Invalid reset mode]
         ValueError: [Invalid renderer selection]
     """
 
@@ -101,6 +111,11 @@ class MujocoEnv(metaclass=EnvMeta):
         if has_renderer is True and has_offscreen_renderer is True:
             raise ValueError("the onscreen and offscreen renderers cannot be used simultaneously.")
 
+        # Verify that a valid reset mode was requested, and normalize truthy / falsy values (e.g.: 1 or np.bool_)
+        if isinstance(hard_reset, str) and hard_reset != "soft":
+            raise ValueError("Invalid hard_reset mode {}. Options are True, False, or 'soft'.".format(hard_reset))
+        hard_reset = "soft" if hard_reset == "soft" else bool(hard_reset)
+
         # Rendering-specific attributes
         self.has_renderer = has_renderer
         self.has_offscreen_renderer = has_offscreen_renderer
@@ -113,6 +128,16 @@ class MujocoEnv(metaclass=EnvMeta):
         # Simulation-specific attributes
         self._observables = {}  # Maps observable names to observable objects
         self._obs_cache = {}  # Maps observable names to pre-/partially-computed observable values
+        self._compiled_observables = None  # Observables to update each sim step, in update order (compiled lazily)
+        self._compiled_graph_version = None  # Observable.graph_version at the time observables were last compiled
+        self._snapshots = {}  # Maps names to values memoized for the current simulation state (see get_snapshot())
+        self._snapshot_version = None  # State version, time, and copies of the state the snapshots were memoized at
+        self._snapshot_time = None
+        self._snapshot_state = [np.zeros(0) for _ in SNAPSHOT_STATE_FIELDS]
+        self._state_version = 0  # Incremented on every reset / step / render request to invalidate snapshots
+        self._geom_masks = {}  # Maps geom groups to boolean masks over geom ids (see _get_geom_mask())
+        self._ref_ids = {}  # Maps (element type, name) to resolved sim ids (see _get_ref_id())
+        self._name_lookup_monitor = None  # Flags name-based sim lookups in step() if macros.DEBUG_NAME_LOOKUPS
         self.control_freq = control_freq
         self.horizon = horizon
         self.ignore_done = ignore_done
@@ -147,6 +172,7 @@ class MujocoEnv(metaclass=EnvMeta):
             self._observables = self.viewer._setup_observables()
         else:
             self._observables = self._setup_observables()
+        self._compiled_observables = None
 
         # check if viewer has get observations method and set a flag for future use.
         self.viewer_get_obs = hasattr(self.viewer, "_get_observations")
@@ -217,6 +243,10 @@ class MujocoEnv(metaclass=EnvMeta):
         # Setup mappings from model to IDs
         self.model.generate_id_mappings(sim=self.sim)
 
+        # Element ids may have changed, so geom groups and cached ids must be re-resolved
+        self._geom_masks = {}
+        self._ref_ids = {}
+
     def _setup_observables(self):
         """
         Sets up observables to be used for this environment.
@@ -233,7 +263,8 @@ class MujocoEnv(metaclass=EnvMeta):
             xml_string (str): If specified, creates MjSim object from this filepath
         """
         # if we have an xml string, use that to create the sim. Otherwise, use the local model
-        self.mjpy_model = load_model_from_xml(xml_string) if xml_string else self.model.get_model(mode="mujoco_py")
+        # Compiled models are re-used across resets if macros.CACHE_COMPILED_MODELS is set
+        self.mjpy_model = load_model(xml_string if xml_string else self.model.get_xml())
 
         # Create the simulation instance and run a single step to make sure changes have propagated through sim state
         self.sim = MjSim(self.mjpy_model)
@@ -249,15 +280,19 @@ class MujocoEnv(metaclass=EnvMeta):
             OrderedDict: Environment observation space after reset occurs
         """
         # TODO(yukez): investigate black screen of death
-        # Use hard reset if requested
+        # Use hard reset if requested, or if a soft reset cannot re-use the current model
+        rebuild_model = not self.deterministic_reset and (
+            self.hard_reset is True or (self.hard_reset == "soft" and self._requires_model_rebuild())
+        )
 
-        if self.hard_reset and not self.deterministic_reset:
+        if rebuild_model:
             if self.renderer == "mujoco" or self.renderer == "default":
                 self._destroy_viewer()
             self._load_model()
             self._postprocess_model()
             self._initialize_sim()
-        # Else, we only reset the sim internally
+        # Else, we only reset the sim internally. Soft resets thereby re-use the compiled model, while object placements
+        # and robot joint positions still get resampled by _reset_internal()
         else:
             self.sim.reset()
 
@@ -266,7 +301,8 @@ class MujocoEnv(metaclass=EnvMeta):
         self.sim.forward()
         # Setup observables, reloading if
         self._obs_cache = {}
-        if self.hard_reset:
+        self._state_version += 1
+        if self.hard_reset is True or rebuild_model:
             # If we're using hard reset, must re-update sensor object references
             _observables = self._setup_observables()
             for obs_name, obs in _observables.items():
@@ -286,6 +322,17 @@ class MujocoEnv(metaclass=EnvMeta):
         # Return new observations
         return observations
 
+    def _requires_model_rebuild(self):
+        """
+        Determines whether a soft reset must re-load the model instead of re-using the currently compiled one. This
+        should return True if the task randomizes its model topology (e.g.: which objects are present) in
+        _load_model(), since such randomization would otherwise only occur once during construction.
+
+        Returns:
+            bool: True if the next soft reset should re-load the model, sim, and render object
+        """
+        return False
+
     def _reset_internal(self):
         """Resets simulation internal configurations."""
 
@@ -333,9 +380,67 @@ class MujocoEnv(metaclass=EnvMeta):
                 value. This is useful if, e.g., you want to grab observations when directly setting simulation states
                 without actually stepping the simulation.
         """
-        for observable in self._observables.values():
+        for observable in self._get_compiled_observables():
             observable.update(timestep=self.model_timestep, obs_cache=self._obs_cache, force=force)
 
+    def _get_compiled_observables(self):
+        """
+        Grabs the observables to update at each simulation step, compiling them first if the set of observables (or
+        any of their sensors, enabled or active states) changed since they were last compiled.
+
+        Returns:
+            list of Observable: Observables to update, in update order
+        """
+        if self._compiled_observables is None or self._compiled_graph_version != Observable.graph_version:
+            self._compiled_observables = self._compile_observables()
+            self._compiled_graph_version = Observable.graph_version
+        return self._compiled_observables
+
+    def _compile_observables(self):
+        """
+        Compiles the dependency graph declared by the observables' sensors (see @sensor) into the list of observables
+        to update at each simulation step.
+
+        Observables are sorted so that their dependencies are always updated before them, but otherwise keep their
+        original order. Only observables whose values are consumed are kept, i.e.: enabled observables that are either
+        active or a dependency of another kept observable. This way, shared intermediate values (e.g.: the world pose
+        in the gripper frame) are computed once per update, and only while something still reads them.
+
+        Returns:
+            list of Observable: Observables to update, in update order
+
+        Raises:
+            ValueError: [Cyclic observable dependencies]
+        """
+        order, visiting, visited = [], set(), set()
+
+        def visit(name):
+            if name in visiting:
+                raise ValueError("Observable {} has cyclic dependencies!".format(name))
+            if name in visited:
+                return
+            visiting.add(name)
+            for dependency in self._observables[name].dependencies:
+                # Dependencies that don't exist (e.g.: disabled via env settings) are handled by the sensors themselves
+                if dependency in self._observables:
+                    visit(dependency)
+            visiting.remove(name)
+            visited.add(name)
+            order.append(name)
+
+        for name in self._observables:
+            visit(name)
+
+        # Walk dependents before their dependencies, keeping only observables that are consumed
+        compiled, required = [], set()
+        for name in reversed(order):
+            observable = self._observables[name]
+            if observable.is_enabled() and (observable.is_active() or name in required):
+                compiled.append(observable)
+                required.update(observable.dependencies)
+
+        return compiled[::-1]
+
     def _get_observations(self, force_update=False):
         """
         Grabs observations from the environment.
@@ -374,6 +479,67 @@ class MujocoEnv(metaclass=EnvMeta):
 
         return observations
 
+    def get_snapshot(self, name, fn):
+        """
+        Returns the value of @fn() memoized for the current simulation state, so that values that are queried
+        repeatedly in between steps (e.g.: observations queried by multiple skill methods within a single control step)
+        are only computed once. Memoized values are invalidated on every step() and reset(), and whenever the
+        simulation state (time, qpos, qvel, act, ctrl, mocap_pos, mocap_quat) is directly modified, e.g.: via
+        sim.set_state_from_flattened(). Subclasses
+        can invalidate them in other cases by incrementing self._state_version (e.g.: when cameras are rendered on
+        request, see RobotEnv.request_camera_render()).
+
+        Args:
+            name (str): Name under which to memoize the value
+            fn (function): Function computing the value, called without any arguments
+
+        Returns:
+            any: Memoized return value of @fn. This is shared by all callers and should not be modified in place
+        """
+        self._validate_snapshots()
+        if name not in self._snapshots:
+            self._snapshots[name] = fn()
+        return self._snapshots[name]
+
+    def set_snapshot(self, name, value):
+        """
+        Memoizes @value under @name for the current simulation state, as if it had been computed by get_snapshot().
+        This lets callers that already hold a value for the current state (e.g.: the observations returned by step())
+        seed the memo instead of having it recomputed.
+
+        Args:
+            name (str): Name under which to memoize the value
+            value (any): Value to memoize
+        """
+        self._validate_snapshots()
+        self._snapshots[name] = value
+
+    def _validate_snapshots(self):
+        """
+        Clears all memoized snapshots if the simulation state changed since they were memoized. The state is compared
+        against copies taken when the snapshots were last cleared, which are only re-allocated if the model changes.
+        """
+        data = self.sim.data
+        if (
+            self._snapshot_version == self._state_version
+            and self._snapshot_time == data.time
+            and all(
+                np.array_equal(saved, getattr(data, field))
+                for field, saved in zip(SNAPSHOT_STATE_FIELDS, self._snapshot_state)
+            )
+        ):
+            return
+
+        self._snapshot_version = self._state_version
+        self._snapshot_time = data.time
+        for i, field in enumerate(SNAPSHOT_STATE_FIELDS):
+            value = getattr(data, field)
+            if self._snapshot_state[i].shape == value.shape:
+                np.copyto(self._snapshot_state[i], value)
+            else:
+                self._snapshot_state[i] = np.array(value)
+        self._snapshots = {}
+
     def step(self, action):
         """
         Takes a step in simulation with control command @action.
@@ -391,7 +557,28 @@ class MujocoEnv(metaclass=EnvMeta):
         if self.done:
             raise ValueError("executing action in terminated episode")
 
+        if macros.DEBUG_NAME_LOOKUPS:
+            if self._name_lookup_monitor is None:
+                self._name_lookup_monitor = NameLookupMonitor()
+            with self._name_lookup_monitor:
+                return self._step(action)
+        return self._step(action)
+
+    def _step(self, action):
+        """
+        Runs the simulation loop of step() for control command @action.
+        Args:
+            action (np.array): Action to execute within the environment
+        Returns:
+            4-tuple:
+                - (OrderedDict) observations from the environment
+                - (float) reward from the environment
+                - (bool) whether the current episode is completed or not
+                - (dict) misc information
+        """
+
         self.timestep += 1
+        self._state_version += 1
 
         # Since the env.step frequency is slower than the mjsim timestep frequency, the internal controller will output
         # multiple torque commands in between new high level action commands. Therefore, we need to denote via
@@ -541,6 +728,87 @@ class MujocoEnv(metaclass=EnvMeta):
         # Turn off deterministic reset
         self.deterministic_reset = False
 
+    def _get_geom_mask(self, geoms):
+        """
+        Resolves a geom group into a boolean mask over all geom ids in the simulation. Masks are cached until the next
+        call to _setup_references(), so that each group only needs to be resolved from names to ids once.
+
+        Args:
+            geoms (str or list of str or MujocoModel): an individual geom name or list of geom names or a model. If a
+                MujocoModel is specified, the geoms resolved will be its contact_geoms
+
+        Returns:
+            np.array: (ngeom,) boolean array that is True for the id of every geom in @geoms
+        """
+        key = geoms if isinstance(geoms, (str, MujocoModel)) else tuple(geoms)
+        mask = self._geom_masks.get(key, None)
+        if mask is None:
+            if type(geoms) is str:
+                geoms = [geoms]
+            elif isinstance(geoms, MujocoModel):
+                geoms = geoms.contact_geoms
+            mask = np.zeros(self.sim.model.ngeom, dtype=bool)
+            for geom in geoms:
+                # Geoms that do not exist in the simulation can never be in contact
+                try:
+                    mask[self.sim.model.geom_name2id(geom)] = True
+                except ValueError:
+                    pass
+            self._geom_masks[key] = mask
+        return mask
+
+    def _get_ref_id(self, name, obj_type="body"):
+        """
+        Resolves the name of a simulation element into its id. Ids are cached until the next call to
+        _setup_references(), so that hot code paths (e.g.: rewards) only need to resolve each name once.
+
+        Args:
+            name (str): Name of the element in the simulation
+            obj_type (str): Type of the element, e.g.: "body", "geom", "site", "joint", "sensor", or "camera"
+
+        Returns:
+            int: Id of @name in the simulation
+
+        Raises:
+            ValueError: [Invalid element name]
+        """
+        key = (obj_type, name)
+        ref_id = self._ref_ids.get(key, None)
+        if ref_id is None:
+            ref_id = getattr(self.sim.model, "{}_name2id".format(obj_type))(name)
+            self._ref_ids[key] = ref_id
+        return ref_id
+
+    def _index_contacts(self):
+        """
+        Grabs the geom ids of all active contacts in the simulation.
+
+        Returns:
+            2-tuple:
+
+                - (np.array) (ncon,) ids of the first geom of each contact
+                - (np.array) (ncon,) ids of the second geom of each contact
+        """
+        ncon = self.sim.data.ncon
+        contacts = self.sim.data.contact[:ncon]
+        geom1 = np.fromiter((contact.geom1 for contact in contacts), dtype=int, count=ncon)
+        geom2 = np.fromiter((contact.geom2 for contact in contacts), dtype=int, count=ncon)
+        return geom1, geom2
+
+    def get_contact_index(self):
+        """
+        Returns the geom ids of all active contacts. This is only indexed once per simulation state, so that any number
+        of contact queries in between steps share a single pass over the contacts.
+
+        Returns:
+            2-tuple: See _index_contacts()
+        """
+        index = self.get_snapshot("contact_index", self._index_contacts)
+        if len(index[0]) != self.sim.data.ncon:
+            # Contacts were recomputed (e.g.: via sim.forward()) without the simulation state changing
+            index = self._snapshots["contact_index"] = self._index_contacts()
+        return index
+
     def check_contact(self, geoms_1, geoms_2=None):
         """
         Finds contact between two geom groups.
@@ -553,25 +821,24 @@ class MujocoEnv(metaclass=EnvMeta):
         Returns:
             bool: True if any geom in @geoms_1 is in contact with any geom in @geoms_2.
         """
-        # Check if either geoms_1 or geoms_2 is a string, convert to list if so
-        if type(geoms_1) is str:
-            geoms_1 = [geoms_1]
-        elif isinstance(geoms_1, MujocoModel):
-            geoms_1 = geoms_1.contact_geoms
-        if type(geoms_2) is str:
-            geoms_2 = [geoms_2]
-        elif isinstance(geoms_2, MujocoModel):
-            geoms_2 = geoms_2.contact_geoms
-        for contact in self.sim.data.contact[: self.sim.data.ncon]:
-            # check contact geom in geoms
-            c1_in_g1 = self.sim.model.geom_id2name(contact.geom1) in geoms_1
-            c2_in_g2 = self.sim.model.geom_id2name(contact.geom2) in geoms_2 if geoms_2 is not None else True
-            # check contact geom in geoms (flipped)
-            c2_in_g1 = self.sim.model.geom_id2name(contact.geom2) in geoms_1
-            c1_in_g2 = self.sim.model.geom_id2name(contact.geom1) in geoms_2 if geoms_2 is not None else True
-            if (c1_in_g1 and c2_in_g2) or (c1_in_g2 and c2_in_g1):
-                return True
-        return False
+        mask_2 = self._get_geom_mask(geoms_2) if geoms_2 is not None else None
+        return self._check_contact_masks(self._get_geom_mask(geoms_1), mask_2)
+
+    def _check_contact_masks(self, mask_1, mask_2=None):
+        """
+        Finds contact between two geom groups that have already been resolved via _get_geom_mask().
+        Args:
+            mask_1 (np.array): (ngeom,) boolean mask of the first geom group
+            mask_2 (None or np.array): (ngeom,) boolean mask of the second geom group. If None, will check any
+                collision with @mask_1 to any other geom in the environment
+        Returns:
+            bool: True if any geom in @mask_1 is in contact with any geom in @mask_2.
+        """
+        geom1, geom2 = self.get_contact_index()
+        if mask_2 is None:
+            return bool(np.any(mask_1[geom1]) or np.any(mask_1[geom2]))
+        # check contact geoms in geom groups (in either order)
+        return bool(np.any((mask_1[geom1] & mask_2[geom2]) | (mask_1[geom2] & mask_2[geom1])))
 
     def get_contacts(self, model):
         """
@@ -588,15 +855,12 @@ class MujocoEnv(metaclass=EnvMeta):
         assert isinstance(
             model, MujocoModel
         ), "Inputted model must be of type MujocoModel; got type {} instead!".format(type(model))
-        contact_set = set()
-        for contact in self.sim.data.contact[: self.sim.data.ncon]:
-            # check contact geom in geoms; add to contact set if match is found
-            g1, g2 = self.sim.model.geom_id2name(contact.geom1), self.sim.model.geom_id2name(contact.geom2)
-            if g1 in model.contact_geoms and g2 not in model.contact_geoms:
-                contact_set.add(g2)
-            elif g2 in model.contact_geoms and g1 not in model.contact_geoms:
-                contact_set.add(g1)
-        return contact_set
+        geom1, geom2 = self.get_contact_index()
+        mask = self._get_geom_mask(model)
+        in_1, in_2 = mask[geom1], mask[geom2]
+        # add the other geom of every contact involving exactly one of the model's geoms
+        contact_ids = np.concatenate([geom2[in_1 & ~in_2], geom1[in_2 & ~in_1]])
+        return set(self.sim.model.geom_id2name(int(geom_id)) for geom_id in contact_ids)
 
     def add_observable(self, observable):
         """
@@ -609,6 +873,7 @@ class MujocoEnv(metaclass=EnvMeta):
             "to modify a pre-existing observable.".format(observable.name)
         )
         self._observables[observable.name] = observable
+        self._compiled_observables = None
 
     def modify_observable(self, observable_name, attribute, modifier):
         """
@@ -626,6 +891,8 @@ class MujocoEnv(metaclass=EnvMeta):
             observable_name, self.observation_names
         )
         obs = self._observables[observable_name]
+        # Any modification may change which observables are consumed, so they get recompiled on the next update
+        self._compiled_observables = None
         # replace attribute accordingly
         if attribute == "sensor":
             obs.set_sensor(modifier)
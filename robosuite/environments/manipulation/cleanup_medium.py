@@ -982,6 +982,12 @@ class CleanUpMediumSmallInitDObjectTrain(CleanUpMediumSmallInitD):
                          right_mat_obj_ids=[],
                          **kwargs)
 
+    def _requires_model_rebuild(self):
+        """
+        Objects are randomly selected in _load_objects(), so the model must be re-loaded on every reset
+        """
+        return True
+
     def _load_objects(self):
         """
         Loads an xml model, puts it in self.model
@@ -1075,6 +1081,12 @@ class CleanUpMediumSmallInitDObjectTest(CleanUpMediumSmallInitD):
                          right_mat_obj_ids=[],
                          **kwargs)
 
+    def _requires_model_rebuild(self):
+        """
+        Objects are randomly selected in _load_objects(), so the model must be re-loaded on every reset
+        """
+        return True
+
     def _load_objects(self):
         """
         Loads an xml model, puts it in self.model
@@ -351,7 +351,7 @@ class Door(SingleArmEnv):
             def handle_pos(obs_cache):
                 return self._handle_xpos
 
-            @sensor(modality=modality)
+            @sensor(modality=modality, dependencies=["door_pos", f"{pf}eef_pos"])
             def door_to_eef_pos(obs_cache):
                 return (
                     obs_cache["door_pos"] - obs_cache[f"{pf}eef_pos"]
@@ -359,7 +359,7 @@ class Door(SingleArmEnv):
                     else np.zeros(3)
                 )
 
-            @sensor(modality=modality)
+            @sensor(modality=modality, dependencies=["handle_pos", f"{pf}eef_pos"])
             def handle_to_eef_pos(obs_cache):
                 return (
                     obs_cache["handle_pos"] - obs_cache[f"{pf}eef_pos"]
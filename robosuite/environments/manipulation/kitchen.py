@@ -461,7 +461,7 @@ class Kitchen(SingleArmEnv):
         pf = self.robots[0].robot_model.naming_prefix
         modality = f"{pf}proprio"
 
-        @sensor(modality="object")
+        @sensor(modality="object", dependencies=[f"{pf}eef_pos", f"{pf}eef_quat"])
         def world_pose_in_gripper(obs_cache):
             return T.pose_inv(T.pose2mat((obs_cache[f"{pf}eef_pos"], obs_cache[f"{pf}eef_quat"]))) if \
                 f"{pf}eef_pos" in obs_cache and f"{pf}eef_quat" in obs_cache else np.eye(4)
@@ -528,7 +528,7 @@ class Kitchen(SingleArmEnv):
         def obj_quat(obs_cache):
             return T.convert_quat(self.sim.data.body_xquat[self.obj_body_id[obj_name]], to="xyzw")
 
-        @sensor(modality=modality)
+        @sensor(modality=modality, dependencies=[f"{obj_name}_pos", f"{obj_name}_quat", "world_pose_in_gripper"])
         def obj_to_eef_pos(obs_cache):
             # Immediately return default value if cache is empty
             if any([name not in obs_cache for name in
@@ -540,7 +540,7 @@ class Kitchen(SingleArmEnv):
             obs_cache[f"{obj_name}_to_{pf}eef_quat"] = rel_quat
             return rel_pos
 
-        @sensor(modality=modality)
+        @sensor(modality=modality, dependencies=[f"{obj_name}_to_{pf}eef_pos"])
         def obj_to_eef_quat(obs_cache):
             return obs_cache[f"{obj_name}_to_{pf}eef_quat"] if \
                 f"{obj_name}_to_{pf}eef_quat" in obs_cache else np.zeros(4)
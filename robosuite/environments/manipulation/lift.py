@@ -374,7 +374,7 @@ class Lift(SingleArmEnv):
             def obj_quat(obs_cache):
                 return convert_quat(np.array(self.sim.data.body_xquat[self.cube_body_id]), to="xyzw")
 
-            @sensor(modality=modality)
+            @sensor(modality=modality, dependencies=[f"{pf}eef_pos", "cube_pos"])
             def object_centric(obs_cache):
                 return (
                     obs_cache[f"{pf}eef_pos"] - obs_cache["cube_pos"]
@@ -75,8 +75,9 @@ class ManipulationEnv(RobotEnv):
 
         ignore_done (bool): True if never terminating the environment (ignore @horizon).
 
-        hard_reset (bool): If True, re-loads model, sim, and render object upon a reset call, else,
-            only calls sim.reset and resets all robosuite-internal variables
+        hard_reset (bool or str): If True, re-loads model, sim, and render object upon a reset call, else,
+            only calls sim.reset and resets all robosuite-internal variables. "soft" is the same as False, except that
+            the model is re-loaded whenever the task requires it (see MujocoEnv._requires_model_rebuild())
 
         camera_names (str or list of str): name of camera to be rendered. Should either be single str if
             same name is to be used for all cameras' rendering or else it should be a list of cameras to render.
@@ -220,25 +221,57 @@ class ManipulationEnv(RobotEnv):
         Returns:
             bool: True if the gripper is grasping the given object
         """
-        # Convert object, gripper geoms into standardized form
-        if isinstance(object_geoms, MujocoModel):
-            o_geoms = object_geoms.contact_geoms
-        else:
-            o_geoms = [object_geoms] if type(object_geoms) is str else object_geoms
+        # Resolve object, gripper geoms into geom id masks
+        o_mask = self._get_geom_mask(object_geoms)
         if isinstance(gripper, GripperModel):
-            g_geoms = [gripper.important_geoms["left_fingerpad"], gripper.important_geoms["right_fingerpad"]]
+            g_masks = self._get_fingerpad_masks(gripper)
         elif type(gripper) is str:
-            g_geoms = [[gripper]]
+            g_masks = [self._get_geom_mask(gripper)]
         else:
             # Parse each element in the gripper_geoms list accordingly
-            g_geoms = [[g_group] if type(g_group) is str else g_group for g_group in gripper]
+            g_masks = [self._get_geom_mask(g_group) for g_group in gripper]
 
         # Search for collisions between each gripper geom group and the object geoms group
-        for g_group in g_geoms:
-            if not self.check_contact(g_group, o_geoms):
+        for g_mask in g_masks:
+            if not self._check_contact_masks(g_mask, o_mask):
                 return False
         return True
 
+    def _get_fingerpad_masks(self, gripper):
+        """
+        Grabs the geom id masks of the "left_fingerpad" and "right_fingerpad" geom groups of @gripper, which together
+        define a grasp. These are resolved once per call to _setup_references().
+
+        Args:
+            gripper (GripperModel): Gripper whose fingerpad geom groups should be grabbed
+
+        Returns:
+            list of np.array: (ngeom,) boolean masks of the left and right fingerpad geoms
+        """
+        key = (gripper, "fingerpads")
+        masks = self._geom_masks.get(key, None)
+        if masks is None:
+            masks = [
+                self._get_geom_mask(gripper.important_geoms[group]) for group in ("left_fingerpad", "right_fingerpad")
+            ]
+            self._geom_masks[key] = masks
+        return masks
+
+    def _setup_references(self):
+        """
+        Sets up references to important components. A reference is typically an
+        index or a list of indices that point to the corresponding elements
+        in a flatten array, which is how MuJoCo stores physical simulation data.
+        """
+        super()._setup_references()
+
+        # Pre-resolve gripper fingerpad geoms and grip sites, which are checked during every grasp check / reward
+        for robot in self.robots:
+            grippers = robot.gripper.values() if isinstance(robot.gripper, dict) else [robot.gripper]
+            for gripper in grippers:
+                self._get_fingerpad_masks(gripper)
+                self._get_ref_id(gripper.important_sites["grip_site"], "site")
+
     def _gripper_to_target(self, gripper, target, target_type="body", return_distance=False):
         """
         Calculates the (x,y,z) Cartesian distance (target_pos - gripper_pos) from the specified @gripper to the
@@ -256,16 +289,8 @@ class ManipulationEnv(RobotEnv):
             np.array or float: (Cartesian or Euclidean) distance from gripper to target
         """
         # Get gripper and target positions
-        gripper_pos = self.sim.data.get_site_xpos(gripper.important_sites["grip_site"])
-        # If target is MujocoModel, grab the correct body as the target and find the target position
-        if isinstance(target, MujocoModel):
-            target_pos = self.sim.data.get_body_xpos(target.root_body)
-        elif target_type == "body":
-            target_pos = self.sim.data.get_body_xpos(target)
-        elif target_type == "site":
-            target_pos = self.sim.data.get_site_xpos(target)
-        else:
-            target_pos = self.sim.data.get_geom_xpos(target)
+        gripper_pos = self.sim.data.site_xpos[self._get_ref_id(gripper.important_sites["grip_site"], "site")]
+        target_pos = self._get_target_xpos(target, target_type)
         # Calculate distance
         diff = target_pos - gripper_pos
         # Return appropriate value
@@ -284,16 +309,8 @@ class ManipulationEnv(RobotEnv):
                 refers to.
         """
         # Get gripper and target positions
-        gripper_pos = self.sim.data.get_site_xpos(gripper.important_sites["grip_site"])
-        # If target is MujocoModel, grab the correct body as the target and find the target position
-        if isinstance(target, MujocoModel):
-            target_pos = self.sim.data.get_body_xpos(target.root_body)
-        elif target_type == "body":
-            target_pos = self.sim.data.get_body_xpos(target)
-        elif target_type == "site":
-            target_pos = self.sim.data.get_site_xpos(target)
-        else:
-            target_pos = self.sim.data.get_geom_xpos(target)
+        gripper_pos = self.sim.data.site_xpos[self._get_ref_id(gripper.important_sites["grip_site"], "site")]
+        target_pos = self._get_target_xpos(target, target_type)
         # color the gripper site appropriately based on (squared) distance to target
         dist = np.sum(np.square((target_pos - gripper_pos)))
         max_dist = 0.1
@@ -301,7 +318,30 @@ class ManipulationEnv(RobotEnv):
         rgba = np.zeros(3)
         rgba[0] = 1 - scaled
         rgba[1] = scaled
-        self.sim.model.site_rgba[self.sim.model.site_name2id(gripper.important_sites["grip_site"])][:3] = rgba
+        self.sim.model.site_rgba[self._get_ref_id(gripper.important_sites["grip_site"], "site")][:3] = rgba
+
+    def _get_target_xpos(self, target, target_type="body"):
+        """
+        Grabs the (x,y,z) Cartesian position of the specified @target, using ids cached by _get_ref_id().
+
+        Args:
+            target (MujocoModel or str): Either a site / geom / body name, or a model that serves as the target.
+                If a model is given, then the root body will be used as the target.
+            target_type (str): One of {"body", "geom", or "site"}, corresponding to the type of element @target
+                refers to.
+
+        Returns:
+            np.array: (x,y,z) position of the target
+        """
+        # If target is MujocoModel, grab the correct body as the target and find the target position
+        if isinstance(target, MujocoModel):
+            return self.sim.data.body_xpos[self._get_ref_id(target.root_body, "body")]
+        elif target_type == "body":
+            return self.sim.data.body_xpos[self._get_ref_id(target, "body")]
+        elif target_type == "site":
+            return self.sim.data.site_xpos[self._get_ref_id(target, "site")]
+        else:
+            return self.sim.data.geom_xpos[self._get_ref_id(target, "geom")]
 
     def _check_robot_configuration(self, robots):
         """
@@ -518,7 +518,7 @@ class NutAssembly(SingleArmEnv):
             self.nut_id_to_sensors = {}
 
             # for conversion to relative gripper frame
-            @sensor(modality=modality)
+            @sensor(modality=modality, dependencies=[f"{pf}eef_pos", f"{pf}eef_quat"])
             def world_pose_in_gripper(obs_cache):
                 return (
                     T.pose_inv(T.pose2mat((obs_cache[f"{pf}eef_pos"], obs_cache[f"{pf}eef_quat"])))
@@ -610,7 +610,7 @@ class NutAssembly(SingleArmEnv):
         def nut_quat(obs_cache):
             return T.convert_quat(self.sim.data.body_xquat[self.obj_body_id[nut_name]], to="xyzw")
 
-        @sensor(modality=modality)
+        @sensor(modality=modality, dependencies=[f"{nut_name}_pos", f"{nut_name}_quat", "world_pose_in_gripper"])
         def nut_to_eef_pos(obs_cache):
             # Immediately return default value if cache is empty
             if any(
@@ -623,7 +623,7 @@ class NutAssembly(SingleArmEnv):
             obs_cache[f"{nut_name}_to_{pf}eef_quat"] = rel_quat
             return rel_pos
 
-        @sensor(modality=modality)
+        @sensor(modality=modality, dependencies=[f"{nut_name}_to_{pf}eef_pos"])
         def nut_to_eef_quat(obs_cache):
             return (
                 obs_cache[f"{nut_name}_to_{pf}eef_quat"] if f"{nut_name}_to_{pf}eef_quat" in obs_cache else np.zeros(4)
@@ -669,8 +669,8 @@ class NutAssembly(SingleArmEnv):
             for i, sensor_names in self.nut_id_to_sensors.items():
                 for name in sensor_names:
                     # Set all of these sensors to be enabled and active if this is the active nut, else False
-                    self._observables[name].set_enabled(i == self.nut_id)
-                    self._observables[name].set_active(i == self.nut_id)
+                    self.modify_observable(observable_name=name, attribute="enabled", modifier=i == self.nut_id)
+                    self.modify_observable(observable_name=name, attribute="active", modifier=i == self.nut_id)
 
     def _check_success(self):
         """
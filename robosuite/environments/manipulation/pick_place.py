@@ -578,7 +578,7 @@ class PickPlace(SingleArmEnv):
             self.object_id_to_sensors = {}
 
             # for conversion to relative gripper frame
-            @sensor(modality=modality)
+            @sensor(modality=modality, dependencies=[f"{pf}eef_pos", f"{pf}eef_quat"])
             def world_pose_in_gripper(obs_cache):
                 return (
                     T.pose_inv(T.pose2mat((obs_cache[f"{pf}eef_pos"], obs_cache[f"{pf}eef_quat"])))
@@ -648,7 +648,7 @@ class PickPlace(SingleArmEnv):
         def obj_quat(obs_cache):
             return T.convert_quat(self.sim.data.body_xquat[self.obj_body_id[obj_name]], to="xyzw")
 
-        @sensor(modality=modality)
+        @sensor(modality=modality, dependencies=[f"{obj_name}_pos", f"{obj_name}_quat", "world_pose_in_gripper"])
         def obj_to_eef_pos(obs_cache):
             # Immediately return default value if cache is empty
             if any(
@@ -661,7 +661,7 @@ class PickPlace(SingleArmEnv):
             obs_cache[f"{obj_name}_to_{pf}eef_quat"] = rel_quat
             return rel_pos
 
-        @sensor(modality=modality)
+        @sensor(modality=modality, dependencies=[f"{obj_name}_to_{pf}eef_pos"])
         def obj_to_eef_quat(obs_cache):
             return (
                 obs_cache[f"{obj_name}_to_{pf}eef_quat"] if f"{obj_name}_to_{pf}eef_quat" in obs_cache else np.zeros(4)
@@ -717,8 +717,8 @@ class PickPlace(SingleArmEnv):
             for i, sensor_names in self.object_id_to_sensors.items():
                 for name in sensor_names:
                     # Set all of these sensors to be enabled and active if this is the active object, else False
-                    self._observables[name].set_enabled(i == self.object_id)
-                    self._observables[name].set_active(i == self.object_id)
+                    self.modify_observable(observable_name=name, attribute="enabled", modifier=i == self.object_id)
+                    self.modify_observable(observable_name=name, attribute="active", modifier=i == self.object_id)
 
     def _check_success(self):
         """
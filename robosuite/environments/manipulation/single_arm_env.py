@@ -32,6 +32,21 @@ class SingleArmEnv(ManipulationEnv):
         if type(robots) is list:
             assert len(robots) == 1, "Error: Only one robot should be inputted for this task!"
 
+    def _setup_references(self):
+        """
+        Sets up references to important components. A reference is typically an
+        index or a list of indices that point to the corresponding elements
+        in a flatten array, which is how MuJoCo stores physical simulation data.
+        """
+        super()._setup_references()
+
+        # ID of the "ee" site, which defines the end effector orientation
+        pf = self.robots[0].robot_model.naming_prefix
+        if self.env_configuration == "bimanual":
+            self.eef_xmat_site_id = self.sim.model.site_name2id(pf + "right_ee")
+        else:
+            self.eef_xmat_site_id = self.sim.model.site_name2id(pf + "ee")
+
     @property
     def _eef_xpos(self):
         """
@@ -52,11 +67,7 @@ class SingleArmEnv(ManipulationEnv):
         Returns:
             np.array: (3,3) End Effector orientation matrix
         """
-        pf = self.robots[0].robot_model.naming_prefix
-        if self.env_configuration == "bimanual":
-            return np.array(self.sim.data.site_xmat[self.sim.model.site_name2id(pf + "right_ee")]).reshape(3, 3)
-        else:
-            return np.array(self.sim.data.site_xmat[self.sim.model.site_name2id(pf + "ee")]).reshape(3, 3)
+        return np.array(self.sim.data.site_xmat[self.eef_xmat_site_id]).reshape(3, 3)
 
     @property
     def _eef_xquat(self):
@@ -435,7 +435,7 @@ class Stack(SingleArmEnv):
             def cubeB_quat(obs_cache):
                 return convert_quat(np.array(self.sim.data.body_xquat[self.cubeB_body_id]), to="xyzw")
 
-            @sensor(modality=modality)
+            @sensor(modality=modality, dependencies=["cubeA_pos", f"{pf}eef_pos"])
             def gripper_to_cubeA(obs_cache):
                 return (
                     obs_cache["cubeA_pos"] - obs_cache[f"{pf}eef_pos"]
@@ -443,7 +443,7 @@ class Stack(SingleArmEnv):
                     else np.zeros(3)
                 )
 
-            @sensor(modality=modality)
+            @sensor(modality=modality, dependencies=["cubeB_pos", f"{pf}eef_pos"])
             def gripper_to_cubeB(obs_cache):
                 return (
                     obs_cache["cubeB_pos"] - obs_cache[f"{pf}eef_pos"]
@@ -451,7 +451,7 @@ class Stack(SingleArmEnv):
                     else np.zeros(3)
                 )
 
-            @sensor(modality=modality)
+            @sensor(modality=modality, dependencies=["cubeA_pos", "cubeB_pos"])
             def cubeA_to_cubeB(obs_cache):
                 return (
                     obs_cache["cubeB_pos"] - obs_cache["cubeA_pos"]
@@ -506,7 +506,7 @@ class Tidy(SingleArmEnv):
             def cubeB_quat(obs_cache):
                 return convert_quat(np.array(self.sim.data.body_xquat[self.cubeB_body_id]), to="xyzw")
 
-            @sensor(modality=modality)
+            @sensor(modality=modality, dependencies=["cubeA_pos", f"{pf}eef_pos"])
             def gripper_to_cubeA(obs_cache):
                 return (
                     obs_cache["cubeA_pos"] - obs_cache[f"{pf}eef_pos"]
@@ -514,7 +514,7 @@ class Tidy(SingleArmEnv):
                     else np.zeros(3)
                 )
 
-            @sensor(modality=modality)
+            @sensor(modality=modality, dependencies=["cubeB_pos", f"{pf}eef_pos"])
             def gripper_to_cubeB(obs_cache):
                 return (
                     obs_cache["cubeB_pos"] - obs_cache[f"{pf}eef_pos"]
@@ -522,7 +522,7 @@ class Tidy(SingleArmEnv):
                     else np.zeros(3)
                 )
 
-            @sensor(modality=modality)
+            @sensor(modality=modality, dependencies=["cubeA_pos", "cubeB_pos"])
             def cubeA_to_cubeB(obs_cache):
                 return (
                     obs_cache["cubeB_pos"] - obs_cache["cubeA_pos"]
@@ -538,7 +538,7 @@ class Tidy(SingleArmEnv):
             def pot_quat(obs_cache):
                 return convert_quat(np.array(self.sim.data.body_xquat[self.pot_body_id]), to="xyzw")
 
-            @sensor(modality=modality)
+            @sensor(modality=modality, dependencies=["pot_pos", f"{pf}eef_pos"])
             def gripper_to_pot(obs_cache):
                 return (
                     obs_cache["pot_pos"] - obs_cache[f"{pf}eef_pos"]
@@ -546,7 +546,7 @@ class Tidy(SingleArmEnv):
                     else np.zeros(3)
                 )
 
-            @sensor(modality=modality)
+            @sensor(modality=modality, dependencies=["cubeA_pos", "pot_pos"])
             def cubeA_to_pot(obs_cache):
                 return (
                     obs_cache["pot_pos"] - obs_cache["cubeA_pos"]
@@ -554,7 +554,7 @@ class Tidy(SingleArmEnv):
                     else np.zeros(3)
                 )
 
-            @sensor(modality=modality)
+            @sensor(modality=modality, dependencies=["cubeB_pos", "pot_pos"])
             def cubeB_to_pot(obs_cache):
                 return (
                     obs_cache["pot_pos"] - obs_cache["cubeB_pos"]
@@ -570,7 +570,7 @@ class Tidy(SingleArmEnv):
             def serving_quat(obs_cache):
                 return convert_quat(np.array(self.sim.data.body_xquat[self.serving_region_id]), to="xyzw")
 
-            @sensor(modality=modality)
+            @sensor(modality=modality, dependencies=["serving_pos", f"{pf}eef_pos"])
             def gripper_to_serving(obs_cache):
                 return (
                     obs_cache["serving_pos"] - obs_cache[f"{pf}eef_pos"]
@@ -578,7 +578,7 @@ class Tidy(SingleArmEnv):
                     else np.zeros(3)
                 )
 
-            @sensor(modality=modality)
+            @sensor(modality=modality, dependencies=["pot_pos", "serving_pos"])
             def pot_to_serving(obs_cache):
                 return (
                     obs_cache["serving_pos"] - obs_cache["pot_pos"]
@@ -50,6 +50,23 @@ class TwoArmEnv(ManipulationEnv):
                     "instead, got {}.".format(self.env_configuration, is_bimanual, check_bimanual(robot))
                 )
 
+    def _setup_references(self):
+        """
+        Sets up references to important components. A reference is typically an
+        index or a list of indices that point to the corresponding elements
+        in a flatten array, which is how MuJoCo stores physical simulation data.
+        """
+        super()._setup_references()
+
+        # IDs of the "ee" sites, which define the end effector orientations
+        if self.env_configuration == "bimanual":
+            pf = self.robots[0].robot_model.naming_prefix
+            self.eef0_xmat_site_id = self.sim.model.site_name2id(pf + "right_ee")
+            self.eef1_xmat_site_id = self.sim.model.site_name2id(pf + "left_ee")
+        else:
+            self.eef0_xmat_site_id = self.sim.model.site_name2id(self.robots[0].robot_model.naming_prefix + "ee")
+            self.eef1_xmat_site_id = self.sim.model.site_name2id(self.robots[1].robot_model.naming_prefix + "ee")
+
     @property
     def _eef0_xpos(self):
         """
@@ -86,11 +103,7 @@ class TwoArmEnv(ManipulationEnv):
         Returns:
             np.array: (3,3) orientation matrix for EEF0
         """
-        pf = self.robots[0].robot_model.naming_prefix
-        if self.env_configuration == "bimanual":
-            return np.array(self.sim.data.site_xmat[self.sim.model.site_name2id(pf + "right_ee")]).reshape(3, 3)
-        else:
-            return np.array(self.sim.data.site_xmat[self.sim.model.site_name2id(pf + "ee")]).reshape(3, 3)
+        return np.array(self.sim.data.site_xmat[self.eef0_xmat_site_id]).reshape(3, 3)
 
     @property
     def _eef1_xmat(self):
@@ -102,12 +115,7 @@ class TwoArmEnv(ManipulationEnv):
         Returns:
             np.array: (3,3) orientation matrix for EEF1
         """
-        if self.env_configuration == "bimanual":
-            pf = self.robots[0].robot_model.naming_prefix
-            return np.array(self.sim.data.site_xmat[self.sim.model.site_name2id(pf + "left_ee")]).reshape(3, 3)
-        else:
-            pf = self.robots[1].robot_model.naming_prefix
-            return np.array(self.sim.data.site_xmat[self.sim.model.site_name2id(pf + "ee")]).reshape(3, 3)
+        return np.array(self.sim.data.site_xmat[self.eef1_xmat_site_id]).reshape(3, 3)
 
     @property
     def _eef0_xquat(self):
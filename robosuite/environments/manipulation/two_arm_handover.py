@@ -424,7 +424,7 @@ class TwoArmHandover(TwoArmEnv):
             def handle_xpos(obs_cache):
                 return np.array(self._handle_xpos)
 
-            @sensor(modality=modality)
+            @sensor(modality=modality, dependencies=["handle_xpos", f"{pf0}eef_pos"])
             def gripper0_to_handle(obs_cache):
                 return (
                     obs_cache["handle_xpos"] - obs_cache[f"{pf0}eef_pos"]
@@ -432,7 +432,7 @@ class TwoArmHandover(TwoArmEnv):
                     else np.zeros(3)
                 )
 
-            @sensor(modality=modality)
+            @sensor(modality=modality, dependencies=["handle_xpos", f"{pf1}eef_pos"])
             def gripper1_to_handle(obs_cache):
                 return (
                     obs_cache["handle_xpos"] - obs_cache[f"{pf1}eef_pos"]
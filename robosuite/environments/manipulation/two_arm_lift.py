@@ -413,7 +413,7 @@ class TwoArmLift(TwoArmEnv):
             def handle1_xpos(obs_cache):
                 return np.array(self._handle1_xpos)
 
-            @sensor(modality=modality)
+            @sensor(modality=modality, dependencies=["handle0_xpos", f"{pf0}eef_pos"])
             def gripper0_to_handle0(obs_cache):
                 return (
                     obs_cache["handle0_xpos"] - obs_cache[f"{pf0}eef_pos"]
@@ -421,7 +421,7 @@ class TwoArmLift(TwoArmEnv):
                     else np.zeros(3)
                 )
 
-            @sensor(modality=modality)
+            @sensor(modality=modality, dependencies=["handle1_xpos", f"{pf1}eef_pos"])
             def gripper1_to_handle1(obs_cache):
                 return (
                     obs_cache["handle1_xpos"] - obs_cache[f"{pf1}eef_pos"]
@@ -400,7 +400,7 @@ class TwoArmPegInHole(TwoArmEnv):
             def hole_quat(obs_cache):
                 return T.convert_quat(self.sim.data.body_xquat[self.hole_body_id], to="xyzw")
 
-            @sensor(modality=modality)
+            @sensor(modality=modality, dependencies=["hole_pos"])
             def peg_to_hole(obs_cache):
                 return (
                     obs_cache["hole_pos"] - np.array(self.sim.data.body_xpos[self.peg_body_id])
@@ -420,11 +420,11 @@ class TwoArmPegInHole(TwoArmEnv):
                 obs_cache["d"] = d
                 return cos
 
-            @sensor(modality=modality)
+            @sensor(modality=modality, dependencies=["angle"])
             def t(obs_cache):
                 return obs_cache["t"] if "t" in obs_cache else 0.0
 
-            @sensor(modality=modality)
+            @sensor(modality=modality, dependencies=["angle"])
             def d(obs_cache):
                 return obs_cache["d"] if "d" in obs_cache else 0.0
 
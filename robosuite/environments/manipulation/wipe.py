@@ -346,15 +346,7 @@ class Wipe(SingleArmEnv):
             active_markers = []
 
             # Current 3D location of the corners of the wiping tool in world frame
-            c_geoms = self.robots[0].gripper.important_geoms["corners"]
-            corner1_id = self.sim.model.geom_name2id(c_geoms[0])
-            corner1_pos = np.array(self.sim.data.geom_xpos[corner1_id])
-            corner2_id = self.sim.model.geom_name2id(c_geoms[1])
-            corner2_pos = np.array(self.sim.data.geom_xpos[corner2_id])
-            corner3_id = self.sim.model.geom_name2id(c_geoms[2])
-            corner3_pos = np.array(self.sim.data.geom_xpos[corner3_id])
-            corner4_id = self.sim.model.geom_name2id(c_geoms[3])
-            corner4_pos = np.array(self.sim.data.geom_xpos[corner4_id])
+            corner1_pos, corner2_pos, corner3_pos, corner4_pos = self.sim.data.geom_xpos[self.corner_geom_ids]
 
             # Unit vectors on my plane
             v1 = corner1_pos - corner2_pos
@@ -383,11 +375,11 @@ class Wipe(SingleArmEnv):
             # Only go into this computation if there are contact points
             if self.sim.data.ncon != 0:
 
-                # Check each marker that is still active
-                for marker in self.model.mujoco_arena.markers:
+                # Current marker 3D locations in world frame
+                marker_positions = self.sim.data.body_xpos[self.marker_body_ids]
 
-                    # Current marker 3D location in world frame
-                    marker_pos = np.array(self.sim.data.body_xpos[self.sim.model.body_name2id(marker.root_body)])
+                # Check each marker that is still active
+                for marker, marker_pos in zip(self.model.mujoco_arena.markers, marker_positions):
 
                     # We use the second tool corner as point on the plane and define the vector connecting
                     # the marker position to that point
@@ -420,7 +412,7 @@ class Wipe(SingleArmEnv):
             # Loop through all new markers we are wiping at this step
             for new_active_marker in new_active_markers:
                 # Grab relevant marker id info
-                new_active_marker_geom_id = self.sim.model.geom_name2id(new_active_marker.visual_geoms[0])
+                new_active_marker_geom_id = self.marker_geom_ids[new_active_marker]
                 # Make this marker transparent since we wiped it (alpha = 0)
                 self.sim.model.geom_rgba[new_active_marker_geom_id][3] = 0
                 # Add this marker the wiped list
@@ -519,6 +511,25 @@ class Wipe(SingleArmEnv):
             mujoco_robots=[robot.robot_model for robot in self.robots],
         )
 
+    def _setup_references(self):
+        """
+        Sets up references to important components. A reference is typically an
+        index or a list of indices that point to the corresponding elements
+        in a flatten array, which is how MuJoCo stores physical simulation data.
+        """
+        super()._setup_references()
+
+        # Wiping tool corner geoms and marker ids, which are read during every reward computation
+        self.corner_geom_ids = [
+            self.sim.model.geom_name2id(geom) for geom in self.robots[0].gripper.important_geoms["corners"]
+        ]
+        self.marker_body_ids = [
+            self.sim.model.body_name2id(marker.root_body) for marker in self.model.mujoco_arena.markers
+        ]
+        self.marker_geom_ids = {
+            marker: self.sim.model.geom_name2id(marker.visual_geoms[0]) for marker in self.model.mujoco_arena.markers
+        }
+
     def _setup_observables(self):
         """
         Sets up observables to be used for this environment. Creates object-based observables if enabled
@@ -556,7 +567,7 @@ class Wipe(SingleArmEnv):
                     obs_cache["wipe_centroid"] = wipe_cent
                     return wipe_rad
 
-                @sensor(modality=modality)
+                @sensor(modality=modality, dependencies=["wipe_radius"])
                 def wipe_centroid(obs_cache):
                     return obs_cache["wipe_centroid"] if "wipe_centroid" in obs_cache else np.zeros(3)
 
@@ -569,7 +580,7 @@ class Wipe(SingleArmEnv):
 
                 if self.use_robot_obs:
                     # also use ego-centric obs
-                    @sensor(modality=modality)
+                    @sensor(modality=modality, dependencies=["wipe_centroid", f"{pf}eef_pos"])
                     def gripper_to_wipe_centroid(obs_cache):
                         return (
                             obs_cache["wipe_centroid"] - obs_cache[f"{pf}eef_pos"]
@@ -616,7 +627,7 @@ class Wipe(SingleArmEnv):
 
         @sensor(modality=modality)
         def marker_pos(obs_cache):
-            return np.array(self.sim.data.body_xpos[self.sim.model.body_name2id(marker.root_body)])
+            return np.array(self.sim.data.body_xpos[self.marker_body_ids[i]])
 
         @sensor(modality=modality)
         def marker_wiped(obs_cache):
@@ -627,7 +638,7 @@ class Wipe(SingleArmEnv):
 
         if self.use_robot_obs:
             # also use ego-centric obs
-            @sensor(modality=modality)
+            @sensor(modality=modality, dependencies=[f"marker{i}_pos", f"{pf}eef_pos"])
             def gripper_to_marker(obs_cache):
                 return (
                     obs_cache[f"marker{i}_pos"] - obs_cache[f"{pf}eef_pos"]
@@ -657,6 +668,10 @@ class Wipe(SingleArmEnv):
         self.ee_force_bias = np.zeros(3)
         self.ee_torque_bias = np.zeros(3)
 
+        # Subscribe to the eef histories read in the reward before the first step, so they're tracked from the start
+        for name in ("ee_forcetorques", "ee_acc"):
+            self.robots[0].subscribe_ee_history(name)
+
     def _check_success(self):
         """
         Checks if Task succeeds (all dirt wiped).
@@ -741,9 +756,10 @@ class Wipe(SingleArmEnv):
         marker_positions = []
         num_non_wiped_markers = 0
         if len(self.wiped_markers) < self.num_markers:
-            for marker in self.model.mujoco_arena.markers:
+            for marker, marker_pos in zip(
+                self.model.mujoco_arena.markers, self.sim.data.body_xpos[self.marker_body_ids]
+            ):
                 if marker not in self.wiped_markers:
-                    marker_pos = np.array(self.sim.data.body_xpos[self.sim.model.body_name2id(marker.root_body)])
                     wipe_centroid += marker_pos
                     marker_positions.append(marker_pos)
                     num_non_wiped_markers += 1
@@ -1,15 +1,24 @@
 from collections import OrderedDict
+from contextlib import contextmanager
 from copy import deepcopy
 
 import numpy as np
+from mujoco_py import MjRenderContextOffscreen
 
 import robosuite.utils.macros as macros
 from robosuite.controllers import reset_controllers
 from robosuite.environments.base import MujocoEnv
+from robosuite.renderers.mujoco.camera_renderer import BatchedCameraRenderer
 from robosuite.robots import ROBOT_CLASS_MAPPING
 from robosuite.utils.mjcf_utils import IMAGE_CONVENTION_MAPPING
 from robosuite.utils.observables import Observable, sensor
 
+# Observation cache entry holding the camera renders of the current observables update (see RobotEnv._render_camera)
+CAMERA_RENDER_CACHE_KEY = "camera_renders"
+
+# Supported camera render scheduling modes (see RobotEnv.set_camera_render_schedule)
+CAMERA_RENDER_MODES = {"sampling_rate", "policy_step", "on_request"}
+
 
 class RobotEnv(MujocoEnv):
     """
@@ -73,8 +82,9 @@ class RobotEnv(MujocoEnv):
 
         ignore_done (bool): True if never terminating the environment (ignore @horizon).
 
-        hard_reset (bool): If True, re-loads model, sim, and render object upon a reset call, else,
-            only calls sim.reset and resets all robosuite-internal variables
+        hard_reset (bool or str): If True, re-loads model, sim, and render object upon a reset call, else,
+            only calls sim.reset and resets all robosuite-internal variables. "soft" is the same as False, except that
+            the model is re-loaded whenever the task requires it (see MujocoEnv._requires_model_rebuild())
 
         camera_names (str or list of str): name of camera to be rendered. Should either be single str if
             same name is to be used for all cameras' rendering or else it should be a list of cameras to render.
@@ -188,6 +198,15 @@ class RobotEnv(MujocoEnv):
             if camera_s is not None:
                 self.camera_segmentations[i] = self._input2list(camera_s, 1) if seg_is_nested else deepcopy(camera_segs)
 
+        # Camera render schedule (maps camera name to (mode, period), defaults to ("sampling_rate", 1)), the names of
+        # the observables rendered from each camera, and the current simulation substep within the policy step
+        self._camera_render_schedule = {}
+        self._camera_observable_names = {}
+        self._substep = 0
+
+        # Renderer used to render all camera observations (lazily created once the offscreen render context exists)
+        self._camera_renderer = None
+
         # sanity checks for camera rendering
         if self.use_camera_obs and not self.has_offscreen_renderer:
             raise ValueError("Error: Camera observations require an offscreen renderer!")
@@ -332,6 +351,7 @@ class RobotEnv(MujocoEnv):
             observables.update(robot_obs)
 
         # Loop through cameras and update the observations if using camera obs
+        self._camera_observable_names = {}
         if self.use_camera_obs:
             # Create sensor information
             sensors = []
@@ -350,6 +370,7 @@ class RobotEnv(MujocoEnv):
                 )
                 sensors += cam_sensors
                 names += cam_sensor_names
+                self._camera_observable_names[cam_name] = cam_sensor_names
 
             # If any the camera segmentations are not None, then we shrink all the sites as a hacky way to
             # prevent them from being rendered in the segmentation mask
@@ -387,9 +408,6 @@ class RobotEnv(MujocoEnv):
                 sensors (list): Array of sensors for the given camera
                 names (list): array of corresponding observable names
         """
-        # Make sure we get correct convention
-        convention = IMAGE_CONVENTION_MAPPING[macros.IMAGE_CONVENTION]
-
         # Create sensor information
         sensors = []
         names = []
@@ -401,18 +419,8 @@ class RobotEnv(MujocoEnv):
 
         @sensor(modality=modality)
         def camera_rgb(obs_cache):
-            img = self.sim.render(
-                camera_name=cam_name,
-                width=cam_w,
-                height=cam_h,
-                depth=cam_d,
-            )
-            if cam_d:
-                rgb, depth = img
-                obs_cache[depth_sensor_name] = np.expand_dims(depth[::convention], axis=-1)
-                return rgb[::convention]
-            else:
-                return img[::convention]
+            img = self._render_camera(obs_cache, cam_name, cam_w, cam_h, cam_d=cam_d)
+            return img[0] if cam_d else img
 
         sensors.append(camera_rgb)
         names.append(rgb_sensor_name)
@@ -421,7 +429,8 @@ class RobotEnv(MujocoEnv):
 
             @sensor(modality=modality)
             def camera_depth(obs_cache):
-                return obs_cache[depth_sensor_name] if depth_sensor_name in obs_cache else np.zeros((cam_h, cam_w, 1))
+                # Depth is rendered in the same pass as rgb
+                return self._render_camera(obs_cache, cam_name, cam_w, cam_h, cam_d=cam_d)[1][..., None]
 
             sensors.append(camera_depth)
             names.append(depth_sensor_name)
@@ -465,9 +474,6 @@ class RobotEnv(MujocoEnv):
                 camera_segmentation (function): Generated sensor function for this segmentation sensor
                 name (str): Corresponding sensor name
         """
-        # Make sure we get correct convention
-        convention = IMAGE_CONVENTION_MAPPING[macros.IMAGE_CONVENTION]
-
         if cam_s == "instance":
             name2id = {inst: i for i, inst in enumerate(list(self.model.instances_to_ids.keys()))}
             mapping = {idn: name2id[inst] for idn, inst in self.model.geom_ids_to_instances.items()}
@@ -478,30 +484,255 @@ class RobotEnv(MujocoEnv):
             # No additional mapping needed
             mapping = None
 
+        # Precompute a dense lookup table from raw (geom) ID to grouped ID, so that remapping is a single gather.
+        # Raw IDs are offset by 1 so that the background (-1) maps to entry 0, and any ID that is not mapped (including
+        # IDs beyond the table, which get clipped to its trailing entry) maps to 0 as well
+        lut = None
+        if mapping is not None:
+            num_ids = max([self.sim.model.ngeom] + [idn + 1 for idn in mapping.keys()])
+            lut = np.zeros(num_ids + 2, dtype=np.int32)
+            for idn, grouped_id in mapping.items():
+                lut[idn + 1] = grouped_id + 1
+
+        raw = macros.RAW_SEGMENTATION
+
         @sensor(modality=modality)
         def camera_segmentation(obs_cache):
-            seg = self.sim.render(
-                camera_name=cam_name,
-                width=cam_w,
-                height=cam_h,
-                depth=False,
-                segmentation=True,
-            )
-            seg = np.expand_dims(seg[::convention, :, 1], axis=-1)
+            # All segmentation types of this camera share a single segmentation render
+            seg = self._render_camera(obs_cache, cam_name, cam_w, cam_h, segmentation=True)[:, :, 1]
             # Map raw IDs to grouped IDs if we're using instance or class-level segmentation
-            if mapping is not None:
-                seg = (
-                    np.fromiter(map(lambda x: mapping.get(x, -1), seg.flatten()), dtype=np.int32).reshape(
-                        cam_h, cam_w, 1
-                    )
-                    + 1
-                )
-            return seg
+            if lut is not None:
+                seg = np.take(lut, seg + 1, mode="clip")
+            return seg if raw else seg[..., None]
 
         name = f"{seg_name_root}_{cam_s}"
 
         return camera_segmentation, name
 
+    def _render_camera(self, obs_cache, cam_name, cam_w, cam_h, cam_d=False, segmentation=False):
+        """
+        Renders camera @cam_name, unless it has already been rendered with the same settings during the current
+        observables update, in which case the cached buffers from @obs_cache are returned. This way, all image
+        observables of a camera share as few render passes as possible: rgb and depth are rendered in a single pass,
+        and all segmentation types (instance, class, element) share a single segmentation pass.
+
+        Returned buffers are flipped to match macros.IMAGE_CONVENTION as views (i.e.: without copying), so they should
+        not be modified in-place.
+
+        Args:
+            obs_cache (dict): Observation cache in which renders are cached for the current observables update
+            cam_name (str): Name of camera to render
+            cam_w (int): Width of camera
+            cam_h (int): Height of camera
+            cam_d (bool): Whether to also render depth. Ignored if @segmentation is set
+            segmentation (bool): Whether to render a segmentation buffer instead of rgb (and depth)
+
+        Returns:
+            np.array or 2-tuple: (H, W, 2) segmentation buffer of (object type, object id) if @segmentation is set,
+                else either the (H, W, 3) rgb image if @cam_d is False, or a (rgb, depth) tuple with the (H, W) depth
+                map otherwise
+        """
+        renders = obs_cache.setdefault(CAMERA_RENDER_CACHE_KEY, {})
+        key = (cam_name, cam_w, cam_h, cam_d and not segmentation, segmentation)
+        if key not in renders:
+            self._render_cameras(obs_cache, [(cam_name, cam_w, cam_h)], depth=cam_d, segmentation=segmentation)
+        return renders[key]
+
+    def _render_cameras(self, obs_cache, cameras, depth=False, segmentation=False):
+        """
+        Renders all @cameras in a single batch (see BatchedCameraRenderer), and caches the resulting buffers in
+        @obs_cache for the current observables update (see @_render_camera).
+
+        Args:
+            obs_cache (dict): Observation cache in which renders are cached for the current observables update
+            cameras (list of 3-tuple): (camera_name, width, height) of each camera to render
+            depth (bool): Whether to also render depth. Ignored if @segmentation is set
+            segmentation (bool): Whether to render segmentation buffers instead of rgb (and depth)
+        """
+        renders = obs_cache.setdefault(CAMERA_RENDER_CACHE_KEY, {})
+        convention = IMAGE_CONVENTION_MAPPING[macros.IMAGE_CONVENTION]
+        depth = depth and not segmentation
+        images = self._get_camera_renderer().render(cameras, depth=depth, segmentation=segmentation)
+        for (cam_name, cam_w, cam_h), img in zip(cameras, images):
+            renders[(cam_name, cam_w, cam_h, depth, segmentation)] = (
+                (img[0][::convention], img[1][::convention]) if depth else img[::convention]
+            )
+
+    def _prerender_cameras(self, camera_names):
+        """
+        Renders all passes needed by the enabled image observables of cameras @camera_names, batching cameras with the
+        same passes together, so that their observables can then be updated from the observation cache.
+
+        Args:
+            camera_names (list of str): Cameras to render
+        """
+        rgb, rgbd, seg = [], [], []
+        for cam_name, cam_w, cam_h, cam_d, cam_segs in zip(
+            self.camera_names,
+            self.camera_widths,
+            self.camera_heights,
+            self.camera_depths,
+            self.camera_segmentations,
+        ):
+            if cam_name not in camera_names:
+                continue
+            enabled = [
+                name
+                for name in self._camera_observable_names.get(cam_name, ())
+                if name in self._observables and self._observables[name].is_enabled()
+            ]
+            if f"{cam_name}_image" in enabled or f"{cam_name}_depth" in enabled:
+                (rgbd if cam_d else rgb).append((cam_name, cam_w, cam_h))
+            if any(name.startswith(f"{cam_name}_segmentation") for name in enabled):
+                seg.append((cam_name, cam_w, cam_h))
+
+        for cameras, depth, segmentation in ((rgb, False, False), (rgbd, True, False), (seg, False, True)):
+            if cameras:
+                self._render_cameras(self._obs_cache, cameras, depth=depth, segmentation=segmentation)
+
+    def _get_camera_renderer(self):
+        """
+        Grabs the renderer used for camera observations, (re-)creating it if the offscreen render context changed
+        (e.g.: after a hard reset).
+
+        Returns:
+            BatchedCameraRenderer: Camera renderer for the current sim
+        """
+        render_context = self.sim._render_context_offscreen
+        if render_context is None:
+            render_context = MjRenderContextOffscreen(self.sim, device_id=self.render_gpu_device_id)
+            self.sim.add_render_context(render_context)
+        if self._camera_renderer is None or self._camera_renderer.render_context is not render_context:
+            self._camera_renderer = BatchedCameraRenderer(self.sim, render_context)
+            for cam_name, cam_w, cam_h in zip(self.camera_names, self.camera_widths, self.camera_heights):
+                self._camera_renderer.add_camera(cam_name, cam_w, cam_h)
+        return self._camera_renderer
+
+    def _update_observables(self, force=False):
+        """
+        Updates all observables in this environment. Camera renders cached during the last update are dropped first,
+        since they are only valid for the sim state they were rendered at.
+
+        Camera observables are only updated according to their camera's render schedule (see
+        @set_camera_render_schedule), unless @force is set.
+
+        Args:
+            force (bool): If True, will force all the observables to update their internal values to the newest
+                value.
+        """
+        self._obs_cache.pop(CAMERA_RENDER_CACHE_KEY, None)
+        if force or not self._camera_render_schedule:
+            if force and self.use_camera_obs:
+                # All cameras get rendered, so render them in as few batches as possible
+                self._prerender_cameras(self.camera_names)
+            super()._update_observables(force=force)
+            return
+
+        # Determine which cameras are skipped, and which are rendered (regardless of their sampling rate) this update
+        skipped, rendered, rendered_cameras = set(), set(), []
+        last_substep = self._substep == int(self.control_timestep / self.model_timestep) - 1
+        for cam_name, (mode, period) in self._camera_render_schedule.items():
+            if mode == "sampling_rate":
+                continue
+            names = self._camera_observable_names.get(cam_name, ())
+            if mode == "policy_step" and last_substep and self.timestep % period == 0:
+                rendered.update(names)
+                rendered_cameras.append(cam_name)
+            else:
+                skipped.update(names)
+        if rendered_cameras:
+            self._prerender_cameras(rendered_cameras)
+
+        for observable in self._get_compiled_observables():
+            if observable.name not in skipped:
+                observable.update(
+                    timestep=self.model_timestep, obs_cache=self._obs_cache, force=observable.name in rendered
+                )
+
+    def set_camera_render_schedule(self, mode="sampling_rate", period=1, camera_names=None):
+        """
+        Sets when the image observables of cameras @camera_names are rendered. Modes are:
+
+            :`'sampling_rate'`: (default) rendered whenever their observables are sampled, i.e.: at their sampling rate
+            :`'policy_step'`: only rendered on the final simulation substep of every @period-th policy step
+            :`'on_request'`: only rendered on explicit calls to @request_camera_render (or forced observable updates,
+                e.g.: at reset)
+
+        Image observables keep their last rendered value in between renders, so e.g.: skills that only need
+        proprioception while executing can skip rendering until they are done.
+
+        Args:
+            mode (str): Render scheduling mode
+            period (int): Only relevant for the "policy_step" mode. Number of policy steps between renders
+            camera_names (None or str or list of str): Cameras to schedule. If None, schedules all cameras
+
+        Raises:
+            AssertionError: [Invalid render mode or period]
+        """
+        assert mode in CAMERA_RENDER_MODES, "Error: Invalid camera render mode {}! Options are: {}".format(
+            mode, CAMERA_RENDER_MODES
+        )
+        assert int(period) >= 1, "Camera render period must be a positive integer, got: {}".format(period)
+        camera_names = self._get_camera_names(camera_names)
+        for cam_name in camera_names:
+            if mode == "sampling_rate":
+                self._camera_render_schedule.pop(cam_name, None)
+            else:
+                self._camera_render_schedule[cam_name] = (mode, int(period))
+
+    def request_camera_render(self, camera_names=None):
+        """
+        Renders the image observables of cameras @camera_names right away, regardless of their render schedule, so
+        that the next observations hold images of the current simulation state. This also invalidates any memoized
+        snapshots (see @get_snapshot), since observations memoized before the render hold stale images.
+
+        Args:
+            camera_names (None or str or list of str): Cameras to render. If None, renders all cameras
+        """
+        self._state_version += 1
+        self._obs_cache.pop(CAMERA_RENDER_CACHE_KEY, None)
+        camera_names = self._get_camera_names(camera_names)
+        self._prerender_cameras(camera_names)
+        for cam_name in camera_names:
+            for name in self._camera_observable_names.get(cam_name, ()):
+                self._observables[name].update(timestep=0, obs_cache=self._obs_cache, force=True)
+
+    @contextmanager
+    def deferred_camera_rendering(self, camera_names=None):
+        """
+        Context manager that defers rendering of cameras @camera_names until the end of the context, at which point
+        they are rendered once (see @request_camera_render) and their previous render schedule is restored.
+
+        Args:
+            camera_names (None or str or list of str): Cameras to defer rendering for. If None, defers all cameras
+        """
+        camera_names = self._get_camera_names(camera_names)
+        schedule = {cam_name: self._camera_render_schedule.get(cam_name) for cam_name in camera_names}
+        self.set_camera_render_schedule(mode="on_request", camera_names=camera_names)
+        try:
+            yield
+        finally:
+            for cam_name, cam_schedule in schedule.items():
+                if cam_schedule is None:
+                    self._camera_render_schedule.pop(cam_name, None)
+                else:
+                    self._camera_render_schedule[cam_name] = cam_schedule
+            self.request_camera_render(camera_names=camera_names)
+
+    def _get_camera_names(self, camera_names):
+        """
+        Helper function to standardize camera name inputs
+
+        Args:
+            camera_names (None or str or list of str): Camera name(s). If None, all cameras of this environment
+
+        Returns:
+            list of str: Camera names
+        """
+        if camera_names is None:
+            return list(self.camera_names)
+        return [camera_names] if isinstance(camera_names, str) else list(camera_names)
+
     def _reset_internal(self):
         """
         Resets simulation internal configurations.
@@ -576,6 +807,9 @@ class RobotEnv(MujocoEnv):
             self.action_dim, len(action)
         )
 
+        # Keep track of the simulation substep within this policy step (used for camera render scheduling)
+        self._substep = 0 if policy_step else self._substep + 1
+
         # Update robot joints based on controller actions
         cutoff = 0
         for idx, robot in enumerate(self.robots):
@@ -14,6 +14,7 @@ from robosuite.utils.mjcf_utils import (
     sort_elements,
     string_to_array,
 )
+from robosuite.utils.xml_cache import get_xml_tree_cache
 
 
 class MujocoXML(object):
@@ -31,7 +32,10 @@ class MujocoXML(object):
     def __init__(self, fname):
         self.file = fname
         self.folder = os.path.dirname(fname)
-        self.tree = ET.parse(fname)
+
+        # Re-use the already post-processed tree for this file if it has been loaded before
+        root = get_xml_tree_cache().get(fname) if macros.CACHE_XML_TREES else None
+        self.tree = ET.parse(fname) if root is None else ET.ElementTree(root)
         self.root = self.tree.getroot()
         self.worldbody = self.create_default_element("worldbody")
         self.actuator = self.create_default_element("actuator")
@@ -41,15 +45,19 @@ class MujocoXML(object):
         self.equality = self.create_default_element("equality")
         self.contact = self.create_default_element("contact")
 
-        # Parse any default classes and replace them inline
-        default = self.create_default_element("default")
-        default_classes = self._get_default_classes(default)
-        self._replace_defaults_inline(default_dic=default_classes)
+        if root is None:
+            # Parse any default classes and replace them inline
+            default = self.create_default_element("default")
+            default_classes = self._get_default_classes(default)
+            self._replace_defaults_inline(default_dic=default_classes)
+
+            # Remove original default classes
+            self.root.remove(default)
 
-        # Remove original default classes
-        self.root.remove(default)
+            self.resolve_asset_dependency()
 
-        self.resolve_asset_dependency()
+            if macros.CACHE_XML_TREES:
+                get_xml_tree_cache().put(fname, self.root)
 
     def resolve_asset_dependency(self):
         """
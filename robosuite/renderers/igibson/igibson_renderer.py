@@ -350,7 +350,7 @@ class iGibsonRenderer(Renderer):
         # Below modes are only applicable for iG renderer.
         if "seg" in self.modes:
 
-            @sensor(modality=modality)
+            @sensor(modality=modality, dependencies=[rgb_sensor_name])
             def camera_seg(obs_cache):
                 return obs_cache[seg_sensor_name] if seg_sensor_name in obs_cache else np.zeros((cam_h, cam_w, 1))
 
@@ -359,7 +359,7 @@ class iGibsonRenderer(Renderer):
 
         if "3d" in self.modes or cam_d:
 
-            @sensor(modality=modality)
+            @sensor(modality=modality, dependencies=[rgb_sensor_name])
             def camera_depth(obs_cache):
                 return obs_cache[depth_sensor_name] if depth_sensor_name in obs_cache else np.zeros((cam_h, cam_w, 1))
 
@@ -368,7 +368,7 @@ class iGibsonRenderer(Renderer):
 
         if "normal" in self.modes:
 
-            @sensor(modality=modality)
+            @sensor(modality=modality, dependencies=[rgb_sensor_name])
             def camera_normal(obs_cache):
                 return obs_cache[normal_sensor_name] if normal_sensor_name in obs_cache else np.zeros((cam_h, cam_w, 1))
 
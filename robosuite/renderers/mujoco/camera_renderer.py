@@ -0,0 +1,68 @@
+class BatchedCameraRenderer:
+    """
+    Renders several cameras of a simulation with a single offscreen render context.
+
+    Each camera is still rendered and read back separately (mujoco_py does not expose reading pixels into caller-owned
+    buffers), and the arrays returned by the render context are handed out as is, without any further copies. Compared
+    to calling sim.render() once per camera, this:
+
+        - resolves camera ids once, instead of looking them up by name on every render
+        - sizes the offscreen framebuffer once for the largest registered resolution up front, instead of growing it
+          whenever a larger camera gets rendered
+
+    Args:
+        sim (MjSim): Simulator instance whose cameras should be rendered
+        render_context (MjRenderContextOffscreen): Offscreen render context of @sim to render with
+    """
+
+    def __init__(self, sim, render_context):
+        self.sim = sim
+        self.render_context = render_context
+
+        # Maps (camera name, width, height) to the camera id
+        self._cameras = {}
+
+    def add_camera(self, camera_name, width, height):
+        """
+        Registers camera @camera_name to be rendered at resolution (@width, @height), growing the offscreen framebuffer
+        if needed so that it fits.
+
+        Args:
+            camera_name (str): Name of camera to register
+            width (int): Width of rendered images
+            height (int): Height of rendered images
+        """
+        key = (camera_name, width, height)
+        if key in self._cameras:
+            return
+        self._cameras[key] = self.sim.model.camera_name2id(camera_name)
+
+        # Grow (but never shrink) the offscreen framebuffer once, instead of whenever a larger camera gets rendered
+        vis = self.sim.model.vis.global_
+        self.render_context.update_offscreen_size(max(width, vis.offwidth), max(height, vis.offheight))
+
+    def render(self, cameras, depth=False, segmentation=False):
+        """
+        Renders all @cameras, one after the other, and reads back their pixels.
+
+        Args:
+            cameras (list of 3-tuple): (camera_name, width, height) of each camera to render. Cameras that haven't been
+                registered via @add_camera yet are registered first
+            depth (bool): Whether to also read depth maps. Ignored if @segmentation is set
+            segmentation (bool): Whether to render segmentation buffers instead of rgb images (and depth maps)
+
+        Returns:
+            list: Rendered buffers, one per camera in @cameras. Each entry is a (H, W, 2) int32 segmentation buffer of
+                (object type, object id) if @segmentation is set, else a (H, W, 3) uint8 rgb image if @depth is False,
+                or a (rgb, depth) tuple with the (H, W) float32 depth map otherwise. Buffers are freshly allocated by
+                every render, so they can be kept without copying
+        """
+        depth = depth and not segmentation
+        outputs = []
+        for camera_name, width, height in cameras:
+            self.add_camera(camera_name, width, height)
+            camera_id = self._cameras[(camera_name, width, height)]
+
+            self.render_context.render(width=width, height=height, camera_id=camera_id, segmentation=segmentation)
+            outputs.append(self.render_context.read_pixels(width, height, depth=depth, segmentation=segmentation))
+        return outputs
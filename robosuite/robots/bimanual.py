@@ -9,6 +9,7 @@ from robosuite.controllers import controller_factory, load_controller_config
 from robosuite.models.grippers import gripper_factory
 from robosuite.robots.manipulator import Manipulator
 from robosuite.utils.buffers import DeltaBuffer, RingBuffer
+from robosuite.utils.control_utils import MassMatrixProvider
 from robosuite.utils.observables import Observable, sensor
 
 
@@ -72,6 +73,8 @@ class Bimanual(Manipulator):
 
         self.controller = self._input2dict(None)
         self.controller_config = self._input2dict(copy.deepcopy(controller_config))
+        self._controller_schedule = self._input2dict(None)
+        self._mass_matrix_provider = None
         self.gripper = self._input2dict(None)
         self.gripper_type = self._input2dict(gripper_type)
         self.has_gripper = self._input2dict([gripper_type is not None for _, gripper_type in self.gripper_type.items()])
@@ -85,13 +88,10 @@ class Bimanual(Manipulator):
         self.eef_rot_offset = self._input2dict(None)  # rotation offsets from final arm link to gripper (quat)
         self.eef_site_id = self._input2dict(None)  # xml element id for eef in mjsim
         self.eef_cylinder_id = self._input2dict(None)  # xml element id for eef cylinder in mjsim
+        self._ref_eef_body_id = self._input2dict(None)  # xml element id for eef body in mjsim
         self.torques = None  # Current torques being applied
 
-        self.recent_ee_forcetorques = self._input2dict(None)  # Current and last forces / torques sensed at eef
-        self.recent_ee_pose = self._input2dict(None)  # Current and last eef pose (pos + ori (quat))
-        self.recent_ee_vel = self._input2dict(None)  # Current and last eef velocity
-        self.recent_ee_vel_buffer = self._input2dict(None)  # RingBuffer holding prior 10 values of velocity values
-        self.recent_ee_acc = self._input2dict(None)  # Current and last eef acceleration
+        self._ee_histories = {}  # Arm-specific buffers holding recent eef values, for each subscribed history
 
         super().__init__(
             robot_type=robot_type,
@@ -109,6 +109,9 @@ class Bimanual(Manipulator):
         # Flag for loading urdf once (only applicable for IK controllers)
         urdf_loaded = False
 
+        # Both arms extract their mass matrix blocks with a single shared provider, updated once per substep in control
+        self._mass_matrix_provider = MassMatrixProvider(self.sim, self._ref_joint_vel_indexes)
+
         # Load controller configs for both left and right arm
         for arm in self.arms:
             # First, load the default controller if none is specified
@@ -150,6 +153,11 @@ class Bimanual(Manipulator):
                 self.torque_limits[1][start:end],
             )
 
+            self.controller_config[arm]["mass_matrix_provider"] = self._mass_matrix_provider
+
+            # Hand the ik solver (and its warm-start state) of the previous controller over to the new one
+            self.controller_config[arm]["dls_solver"] = getattr(self.controller[arm], "dls_solver", None)
+
             # Only load urdf the first time this controller gets called
             self.controller_config[arm]["load_urdf"] = True if not urdf_loaded else False
             urdf_loaded = True
@@ -157,6 +165,9 @@ class Bimanual(Manipulator):
             # Instantiate the relevant controller
             self.controller[arm] = controller_factory(self.controller_config[arm]["type"], self.controller_config[arm])
 
+            # Schedule of controller evaluations within each policy step
+            self._controller_schedule[arm] = self._make_controller_schedule(self.controller_config[arm])
+
     def load_model(self):
         """
         Loads robot and optionally add grippers.
@@ -213,12 +224,9 @@ class Bimanual(Manipulator):
         for arm in self.arms:
             # Update base pos / ori references in controller (technically only needs to be called once)
             self.controller[arm].update_base_pose(self.base_pos, self.base_ori)
-            # Setup buffers for eef values
-            self.recent_ee_forcetorques[arm] = DeltaBuffer(dim=6)
-            self.recent_ee_pose[arm] = DeltaBuffer(dim=7)
-            self.recent_ee_vel[arm] = DeltaBuffer(dim=6)
-            self.recent_ee_vel_buffer[arm] = RingBuffer(dim=6, length=10)
-            self.recent_ee_acc[arm] = DeltaBuffer(dim=6)
+            # Clear buffers for eef values
+            for bufs in self._ee_histories.values():
+                bufs[arm].clear()
 
     def setup_references(self):
         """
@@ -248,6 +256,11 @@ class Bimanual(Manipulator):
             self.eef_site_id[arm] = self.sim.model.site_name2id(self.gripper[arm].important_sites["grip_site"])
             self.eef_cylinder_id[arm] = self.sim.model.site_name2id(self.gripper[arm].important_sites["grip_cylinder"])
 
+            # ID of eef body, and eef sensors which are read during every control step
+            self._ref_eef_body_id[arm] = self.sim.model.body_name2id(self.robot_model.eef_name[arm])
+            for sensor in ("force_ee", "torque_ee"):
+                self._get_sensor_slice(self.gripper[arm].important_sensors[sensor])
+
     def control(self, action, policy_step=False):
         """
         Actuate the robot with the
@@ -271,6 +284,9 @@ class Bimanual(Manipulator):
             self.action_dim, len(action)
         )
 
+        # Update the mass matrix shared by both arms once for this substep, before either arm's controller reads it
+        self._mass_matrix_provider.update()
+
         self.torques = np.array([])
         # Now execute actions for each arm
         for arm in self.arms:
@@ -288,8 +304,10 @@ class Bimanual(Manipulator):
             if policy_step:
                 self.controller[arm].set_goal(sub_action)
 
-            # Now run the controller for a step and add it to the torques
-            self.torques = np.concatenate((self.torques, self.controller[arm].run_controller()))
+            # Now run the controller for a step (or hold its last torques, depending on its update period) and add it
+            # to the torques
+            arm_torques = self._run_controller(self.controller[arm], self._controller_schedule[arm], policy_step)
+            self.torques = np.concatenate((self.torques, arm_torques))
 
             # Get gripper action, if applicable
             if self.has_gripper[arm]:
@@ -309,28 +327,67 @@ class Bimanual(Manipulator):
             self.recent_actions.push(action)
             self.recent_torques.push(self.torques)
 
+            # Update arm-specific eef values, only for histories that have been subscribed to
+            # (eef pose / velocity are read from the sim, since not every controller tracks the eef state)
+            histories = self._ee_histories
+            if "ee_forcetorques" in histories:
+                ee_force, ee_torque = self.ee_force, self.ee_torque
             for arm in self.arms:
-                # Update arm-specific proprioceptive values
-                self.recent_ee_forcetorques[arm].push(np.concatenate((self.ee_force[arm], self.ee_torque[arm])))
-                self.recent_ee_pose[arm].push(
-                    np.concatenate((self.controller[arm].ee_pos, T.mat2quat(self.controller[arm].ee_ori_mat)))
-                )
-                self.recent_ee_vel[arm].push(
-                    np.concatenate((self.controller[arm].ee_pos_vel, self.controller[arm].ee_ori_vel))
-                )
+                if "ee_forcetorques" in histories:
+                    histories["ee_forcetorques"][arm].push(np.concatenate((ee_force[arm], ee_torque[arm])))
+                eef_site_id = self.eef_site_id[arm]
+                if "ee_pose" in histories:
+                    ee_ori_mat = self.sim.data.site_xmat[eef_site_id].reshape(3, 3)
+                    histories["ee_pose"][arm].push(
+                        np.concatenate((self.sim.data.site_xpos[eef_site_id], T.mat2quat(ee_ori_mat)))
+                    )
+                if "ee_vel" in histories or "ee_vel_buffer" in histories:
+                    ee_vel = np.concatenate(
+                        (self.sim.data.site_xvelp[eef_site_id], self.sim.data.site_xvelr[eef_site_id])
+                    )
+                    if "ee_vel" in histories:
+                        histories["ee_vel"][arm].push(ee_vel)
+                    if "ee_vel_buffer" in histories:
+                        histories["ee_vel_buffer"][arm].push(ee_vel)
 
                 # Estimation of eef acceleration (averaged derivative of recent velocities)
-                self.recent_ee_vel_buffer[arm].push(
-                    np.concatenate((self.controller[arm].ee_pos_vel, self.controller[arm].ee_ori_vel))
-                )
-                diffs = np.vstack(
-                    [
-                        self.recent_ee_acc[arm].current,
-                        self.control_freq * np.diff(self.recent_ee_vel_buffer[arm].buf, axis=0),
-                    ]
-                )
-                ee_acc = np.array([np.convolve(col, np.ones(10) / 10.0, mode="valid")[0] for col in diffs.transpose()])
-                self.recent_ee_acc[arm].push(ee_acc)
+                if "ee_acc" in histories:
+                    ee_vel_buffer = histories["ee_vel_buffer"][arm]
+                    ee_acc = (
+                        histories["ee_acc"][arm].current + self.control_freq * ee_vel_buffer.delta
+                    ) / ee_vel_buffer.length
+                    histories["ee_acc"][arm].push(ee_acc)
+
+    def subscribe_ee_history(self, name):
+        """
+        Subscribes to the arm-specific histories of recent eef values @name, so that they get updated at every policy
+        step from now on. Histories are only computed once subscribed to, so that robots whose eef histories are never
+        read don't pay for them. Accessing any of the recent_ee_* properties automatically subscribes to the
+        corresponding history.
+
+        Note that histories are cleared at every reset, so subscribing before the first step of an episode (e.g.: in
+        an environment's _reset_internal) makes them identical to always-on histories. Histories first subscribed to
+        mid-episode start out zero-filled.
+
+        Args:
+            name (str): Which history to subscribe to. Can be {"ee_forcetorques", "ee_pose", "ee_vel",
+                "ee_vel_buffer", "ee_acc"}
+
+        Returns:
+            dict: Each arm-specific entry is the DeltaBuffer or RingBuffer holding the requested history for that arm
+        """
+        if name not in self._ee_histories:
+            if name == "ee_acc":
+                # Acceleration is estimated from the window of recent velocities
+                self.subscribe_ee_history("ee_vel_buffer")
+                self._ee_histories[name] = {arm: DeltaBuffer(dim=6) for arm in self.arms}
+            elif name == "ee_vel_buffer":
+                self._ee_histories[name] = {arm: RingBuffer(dim=6, length=10) for arm in self.arms}
+            elif name in {"ee_forcetorques", "ee_pose", "ee_vel"}:
+                self._ee_histories[name] = {arm: DeltaBuffer(dim=7 if name == "ee_pose" else 6) for arm in self.arms}
+            else:
+                raise ValueError("Error: Unknown eef history {}!".format(name))
+        return self._ee_histories[name]
 
     def _visualize_grippers(self, visible):
         """
@@ -468,6 +525,46 @@ class Bimanual(Manipulator):
             low, high = np.concatenate([low, low_c, low_g]), np.concatenate([high, high_c, high_g])
         return low, high
 
+    @property
+    def recent_ee_forcetorques(self):
+        """
+        Returns:
+            dict: each arm-specific entry specifies the DeltaBuffer of current and last forces / torques sensed at eef
+        """
+        return self.subscribe_ee_history("ee_forcetorques")
+
+    @property
+    def recent_ee_pose(self):
+        """
+        Returns:
+            dict: each arm-specific entry specifies the DeltaBuffer of current and last eef pose (pos + ori (quat))
+        """
+        return self.subscribe_ee_history("ee_pose")
+
+    @property
+    def recent_ee_vel(self):
+        """
+        Returns:
+            dict: each arm-specific entry specifies the DeltaBuffer of current and last eef velocity
+        """
+        return self.subscribe_ee_history("ee_vel")
+
+    @property
+    def recent_ee_vel_buffer(self):
+        """
+        Returns:
+            dict: each arm-specific entry specifies the RingBuffer of prior 10 values of eef velocity
+        """
+        return self.subscribe_ee_history("ee_vel_buffer")
+
+    @property
+    def recent_ee_acc(self):
+        """
+        Returns:
+            dict: each arm-specific entry specifies the DeltaBuffer of current and last eef acceleration
+        """
+        return self.subscribe_ee_history("ee_acc")
+
     @property
     def ee_ft_integral(self):
         """
@@ -509,7 +606,7 @@ class Bimanual(Manipulator):
         """
         vals = {}
         for arm in self.arms:
-            vals[arm] = self.pose_in_base_from_name(self.robot_model.eef_name[arm])
+            vals[arm] = self.pose_in_base_from_id(self._ref_eef_body_id[arm])
         return vals
 
     @property
@@ -537,10 +634,8 @@ class Bimanual(Manipulator):
             (start, end) = (None, self._joint_split_idx) if arm == "right" else (self._joint_split_idx, None)
 
             # Use jacobian to translate joint velocities to end effector velocities.
-            Jp = self.sim.data.get_body_jacp(self.robot_model.eef_name[arm]).reshape((3, -1))
+            Jp, Jr = self._get_body_jacobian(self._ref_eef_body_id[arm])
             Jp_joint = Jp[:, self._ref_joint_vel_indexes[start:end]]
-
-            Jr = self.sim.data.get_body_jacr(self.robot_model.eef_name[arm]).reshape((3, -1))
             Jr_joint = Jr[:, self._ref_joint_vel_indexes[start:end]]
 
             eef_lin_vel = Jp_joint.dot(self._joint_velocities)
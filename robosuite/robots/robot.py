@@ -1,5 +1,6 @@
 from collections import OrderedDict
 
+import mujoco_py
 import numpy as np
 from mujoco_py import MjSim
 
@@ -78,6 +79,8 @@ class Robot(object):
         self._ref_joint_pos_indexes = None  # xml joint position indexes in mjsim
         self._ref_joint_vel_indexes = None  # xml joint velocity indexes in mjsim
         self._ref_joint_actuator_indexes = None  # xml joint (torq) actuator indexes for robot in mjsim
+        self._ref_root_body_id = None  # xml element id for robot root body in mjsim
+        self._ref_sensor_slices = {}  # sensordata slices for each sensor name read by this robot
 
         self.recent_qpos = None  # Current and last robot arm qpos
         self.recent_actions = None  # Current and last action applied
@@ -168,6 +171,16 @@ class Robot(object):
             self.sim.model.actuator_name2id(actuator) for actuator in self.robot_model.actuators
         ]
 
+        # id of the root body, which defines the base frame of this robot
+        self._ref_root_body_id = self.sim.model.body_name2id(self.robot_model.root_body)
+
+        # slices into sensordata for each sensor (see _get_sensor_slice())
+        self._ref_sensor_slices = {}
+
+        # buffers for computing body jacobians (see _get_body_jacobian())
+        self._jacp = np.zeros(3 * self.sim.model.nv)
+        self._jacr = np.zeros(3 * self.sim.model.nv)
+
     def setup_observables(self):
         """
         Sets up observables to be used for this robot
@@ -185,11 +198,11 @@ class Robot(object):
         def joint_pos(obs_cache):
             return np.array([self.sim.data.qpos[x] for x in self._ref_joint_pos_indexes])
 
-        @sensor(modality=modality)
+        @sensor(modality=modality, dependencies=[pre_compute])
         def joint_pos_cos(obs_cache):
             return np.cos(obs_cache[pre_compute]) if pre_compute in obs_cache else np.zeros(self.robot_model.dof)
 
-        @sensor(modality=modality)
+        @sensor(modality=modality, dependencies=[pre_compute])
         def joint_pos_sin(obs_cache):
             return np.sin(obs_cache[pre_compute]) if pre_compute in obs_cache else np.zeros(self.robot_model.dof)
 
@@ -228,6 +241,66 @@ class Robot(object):
         """
         raise NotImplementedError
 
+    @staticmethod
+    def _make_controller_schedule(controller_config):
+        """
+        Creates the state used to (optionally) evaluate a controller less often than the simulation is stepped.
+
+        The schedule is read from the optional "update_period" and "zero_order_hold" entries of @controller_config:
+        with an update period of N, the controller is only evaluated every N-th simulation substep of a policy step
+        (always including the first), and its last torques are re-applied in between. If "zero_order_hold" is False,
+        only the task-space portion of the held torques is kept constant, and gravity / coriolis compensation is
+        recomputed at every substep.
+
+        :NOTE: Interpolators (if any) are stepped once per controller evaluation, so with an update period of N they
+            take N times as many simulation substeps to reach their goal.
+
+        Args:
+            controller_config (dict): Controller config for the arm being scheduled
+
+        Returns:
+            dict: Schedule state to be passed to @self._run_controller
+
+        Raises:
+            AssertionError: [Invalid update period]
+        """
+        period = int(controller_config.get("update_period", 1))
+        assert period >= 1, "Controller update period must be a positive integer, got: {}".format(period)
+        return {
+            "period": period,
+            "zero_order_hold": controller_config.get("zero_order_hold", True),
+            "substep": 0,
+            "torques": None,
+            "compensation": None,
+        }
+
+    @staticmethod
+    def _run_controller(controller, schedule, policy_step):
+        """
+        Runs @controller for a step, or re-uses its last torques if this simulation substep falls between two
+        controller updates (see @_make_controller_schedule).
+
+        Args:
+            controller (Controller): Controller to run
+            schedule (dict): Schedule state for this controller, as created by @_make_controller_schedule
+            policy_step (bool): Whether a new policy step (action) is being taken
+
+        Returns:
+            np.array: (unclipped) torques to apply for this substep
+        """
+        schedule["substep"] = 0 if policy_step else schedule["substep"] + 1
+        if schedule["substep"] % schedule["period"] == 0:
+            schedule["torques"] = controller.run_controller()
+            if not schedule["zero_order_hold"]:
+                schedule["compensation"] = controller.torque_compensation
+            return schedule["torques"]
+
+        if schedule["zero_order_hold"]:
+            return schedule["torques"]
+
+        # The env forwards the sim before every substep, so the compensation is already that of the current state
+        return schedule["torques"] - schedule["compensation"] + controller.torque_compensation
+
     def check_q_limits(self):
         """
         Check if this robot is either very close or at the joint limits
@@ -312,13 +385,25 @@ class Robot(object):
         Returns:
             np.array: (4,4) array corresponding to the pose of @name in the base frame
         """
+        return self.pose_in_base_from_id(self.sim.model.body_name2id(name))
 
-        pos_in_world = self.sim.data.get_body_xpos(name)
-        rot_in_world = self.sim.data.get_body_xmat(name).reshape((3, 3))
+    def pose_in_base_from_id(self, body_id):
+        """
+        A helper function that takes in a body id and returns the pose of that body in the base frame.
+
+        Args:
+            body_id (int): Id of body in sim to grab pose
+
+        Returns:
+            np.array: (4,4) array corresponding to the pose of @body_id in the base frame
+        """
+
+        pos_in_world = self.sim.data.body_xpos[body_id]
+        rot_in_world = self.sim.data.body_xmat[body_id].reshape((3, 3))
         pose_in_world = T.make_pose(pos_in_world, rot_in_world)
 
-        base_pos_in_world = self.sim.data.get_body_xpos(self.robot_model.root_body)
-        base_rot_in_world = self.sim.data.get_body_xmat(self.robot_model.root_body).reshape((3, 3))
+        base_pos_in_world = self.sim.data.body_xpos[self._ref_root_body_id]
+        base_rot_in_world = self.sim.data.body_xmat[self._ref_root_body_id].reshape((3, 3))
         base_pose_in_world = T.make_pose(base_pos_in_world, base_rot_in_world)
         world_pose_in_base = T.pose_inv(base_pose_in_world)
 
@@ -381,6 +466,41 @@ class Robot(object):
         Returns:
             np.array: sensor values
         """
-        sensor_idx = np.sum(self.sim.model.sensor_dim[: self.sim.model.sensor_name2id(sensor_name)])
-        sensor_dim = self.sim.model.sensor_dim[self.sim.model.sensor_name2id(sensor_name)]
-        return np.array(self.sim.data.sensordata[sensor_idx : sensor_idx + sensor_dim])
+        return np.array(self.sim.data.sensordata[self._get_sensor_slice(sensor_name)])
+
+    def _get_sensor_slice(self, sensor_name):
+        """
+        Grabs the slice of the sim's sensordata corresponding to sensor @sensor_name. Slices are cached until the next
+        call to setup_references(), so that each sensor only needs to be resolved from its name once.
+
+        Args:
+            sensor_name (str): name of the sensor
+
+        Returns:
+            slice: indexes of the sensor values in sensordata
+        """
+        sensor_slice = self._ref_sensor_slices.get(sensor_name, None)
+        if sensor_slice is None:
+            sensor_id = self.sim.model.sensor_name2id(sensor_name)
+            sensor_idx = int(np.sum(self.sim.model.sensor_dim[:sensor_id]))
+            sensor_slice = slice(sensor_idx, sensor_idx + int(self.sim.model.sensor_dim[sensor_id]))
+            self._ref_sensor_slices[sensor_name] = sensor_slice
+        return sensor_slice
+
+    def _get_body_jacobian(self, body_id):
+        """
+        Computes the translational and rotational jacobians of the body with id @body_id
+
+        Args:
+            body_id (int): Id of body in sim
+
+        Returns:
+            2-tuple:
+
+                - (np.array) (3, nv) translational jacobian
+                - (np.array) (3, nv) rotational jacobian
+
+            Note that these are views into internal buffers, which get overwritten on the next call
+        """
+        mujoco_py.cymj._mj_jacBody(self.sim.model, self.sim.data, self._jacp, self._jacr, body_id)
+        return self._jacp.reshape((3, -1)), self._jacr.reshape((3, -1))
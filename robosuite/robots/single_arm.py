@@ -66,6 +66,7 @@ class SingleArm(Manipulator):
 
         self.controller = None
         self.controller_config = copy.deepcopy(controller_config)
+        self._controller_schedule = None  # state for evaluating the controller every "update_period" substeps
         self.gripper_type = gripper_type
         self.has_gripper = self.gripper_type is not None
 
@@ -77,13 +78,10 @@ class SingleArm(Manipulator):
         self.eef_rot_offset = None  # rotation offsets from final arm link to gripper (quat)
         self.eef_site_id = None  # xml element id for eef in mjsim
         self.eef_cylinder_id = None  # xml element id for eef cylinder in mjsim
+        self._ref_eef_body_id = None  # xml element id for eef body in mjsim
         self.torques = None  # Current torques being applied
 
-        self.recent_ee_forcetorques = None  # Current and last forces / torques sensed at eef
-        self.recent_ee_pose = None  # Current and last eef pose (pos + ori (quat))
-        self.recent_ee_vel = None  # Current and last eef velocity
-        self.recent_ee_vel_buffer = None  # RingBuffer holding prior 10 values of velocity values
-        self.recent_ee_acc = None  # Current and last eef acceleration
+        self._ee_histories = {}  # Buffers holding recent eef values, for each subscribed history (see recent_ee_*)
 
         super().__init__(
             robot_type=robot_type,
@@ -131,9 +129,15 @@ class SingleArm(Manipulator):
         self.controller_config["policy_freq"] = self.control_freq
         self.controller_config["ndim"] = len(self.robot_joints)
 
+        # Hand the ik solver (and its warm-start state) of the previous controller over to the new one
+        self.controller_config["dls_solver"] = getattr(self.controller, "dls_solver", None)
+
         # Instantiate the relevant controller
         self.controller = controller_factory(self.controller_config["type"], self.controller_config)
 
+        # Schedule of controller evaluations within each policy step
+        self._controller_schedule = self._make_controller_schedule(self.controller_config)
+
     def load_model(self):
         """
         Loads robot and optionally add grippers.
@@ -183,12 +187,9 @@ class SingleArm(Manipulator):
         # Update base pos / ori references in controller
         self.controller.update_base_pose(self.base_pos, self.base_ori)
 
-        # # Setup buffers to hold recent values
-        self.recent_ee_forcetorques = DeltaBuffer(dim=6)
-        self.recent_ee_pose = DeltaBuffer(dim=7)
-        self.recent_ee_vel = DeltaBuffer(dim=6)
-        self.recent_ee_vel_buffer = RingBuffer(dim=6, length=10)
-        self.recent_ee_acc = DeltaBuffer(dim=6)
+        # Clear buffers holding recent eef values
+        for buf in self._ee_histories.values():
+            buf.clear()
 
     def setup_references(self):
         """
@@ -213,6 +214,11 @@ class SingleArm(Manipulator):
         self.eef_site_id = self.sim.model.site_name2id(self.gripper.important_sites["grip_site"])
         self.eef_cylinder_id = self.sim.model.site_name2id(self.gripper.important_sites["grip_cylinder"])
 
+        # ID of eef body, and eef sensors which are read during every control step
+        self._ref_eef_body_id = self.sim.model.body_name2id(self.robot_model.eef_name)
+        for sensor in ("force_ee", "torque_ee"):
+            self._get_sensor_slice(self.gripper.important_sensors[sensor])
+
     def control(self, action, policy_step=False):
         """
         Actuate the robot with the
@@ -244,8 +250,8 @@ class SingleArm(Manipulator):
         if policy_step:
             self.controller.set_goal(arm_action)
 
-        # Now run the controller for a step
-        torques = self.controller.run_controller()
+        # Now run the controller for a step (or hold its last torques, depending on its update period)
+        torques = self._run_controller(self.controller, self._controller_schedule, policy_step)
 
         # Clip the torques
         low, high = self.torque_limits
@@ -264,17 +270,61 @@ class SingleArm(Manipulator):
             self.recent_qpos.push(self._joint_positions)
             self.recent_actions.push(action)
             self.recent_torques.push(self.torques)
-            self.recent_ee_forcetorques.push(np.concatenate((self.ee_force, self.ee_torque)))
-            self.recent_ee_pose.push(np.concatenate((self.controller.ee_pos, T.mat2quat(self.controller.ee_ori_mat))))
-            self.recent_ee_vel.push(np.concatenate((self.controller.ee_pos_vel, self.controller.ee_ori_vel)))
+
+            # Update eef values, only for histories that have been subscribed to
+            # (eef pose / velocity are read from the sim, since not every controller tracks the eef state)
+            histories = self._ee_histories
+            if "ee_forcetorques" in histories:
+                histories["ee_forcetorques"].push(np.concatenate((self.ee_force, self.ee_torque)))
+            if "ee_pose" in histories:
+                ee_ori_mat = self.sim.data.site_xmat[self.eef_site_id].reshape(3, 3)
+                histories["ee_pose"].push(
+                    np.concatenate((self.sim.data.site_xpos[self.eef_site_id], T.mat2quat(ee_ori_mat)))
+                )
+            if "ee_vel" in histories or "ee_vel_buffer" in histories:
+                ee_vel = np.concatenate(
+                    (self.sim.data.site_xvelp[self.eef_site_id], self.sim.data.site_xvelr[self.eef_site_id])
+                )
+                if "ee_vel" in histories:
+                    histories["ee_vel"].push(ee_vel)
+                if "ee_vel_buffer" in histories:
+                    histories["ee_vel_buffer"].push(ee_vel)
 
             # Estimation of eef acceleration (averaged derivative of recent velocities)
-            self.recent_ee_vel_buffer.push(np.concatenate((self.controller.ee_pos_vel, self.controller.ee_ori_vel)))
-            diffs = np.vstack(
-                [self.recent_ee_acc.current, self.control_freq * np.diff(self.recent_ee_vel_buffer.buf, axis=0)]
-            )
-            ee_acc = np.array([np.convolve(col, np.ones(10) / 10.0, mode="valid")[0] for col in diffs.transpose()])
-            self.recent_ee_acc.push(ee_acc)
+            if "ee_acc" in histories:
+                ee_vel_buffer = histories["ee_vel_buffer"]
+                ee_acc = (histories["ee_acc"].current + self.control_freq * ee_vel_buffer.delta) / ee_vel_buffer.length
+                histories["ee_acc"].push(ee_acc)
+
+    def subscribe_ee_history(self, name):
+        """
+        Subscribes to the history of recent eef values @name, so that it gets updated at every policy step from now on.
+        Histories are only computed once subscribed to, so that robots whose eef histories are never read don't pay
+        for them. Accessing any of the recent_ee_* properties automatically subscribes to the corresponding history.
+
+        Note that histories are cleared at every reset, so subscribing before the first step of an episode (e.g.: in
+        an environment's _reset_internal) makes them identical to always-on histories. Histories first subscribed to
+        mid-episode start out zero-filled.
+
+        Args:
+            name (str): Which history to subscribe to. Can be {"ee_forcetorques", "ee_pose", "ee_vel",
+                "ee_vel_buffer", "ee_acc"}
+
+        Returns:
+            DeltaBuffer or RingBuffer: Buffer holding the requested history
+        """
+        if name not in self._ee_histories:
+            if name == "ee_acc":
+                # Acceleration is estimated from the window of recent velocities
+                self.subscribe_ee_history("ee_vel_buffer")
+                self._ee_histories[name] = DeltaBuffer(dim=6)
+            elif name == "ee_vel_buffer":
+                self._ee_histories[name] = RingBuffer(dim=6, length=10)
+            elif name in {"ee_forcetorques", "ee_pose", "ee_vel"}:
+                self._ee_histories[name] = DeltaBuffer(dim=7 if name == "ee_pose" else 6)
+            else:
+                raise ValueError("Error: Unknown eef history {}!".format(name))
+        return self._ee_histories[name]
 
     def _visualize_grippers(self, visible):
         """
@@ -354,6 +404,46 @@ class SingleArm(Manipulator):
 
         return low, high
 
+    @property
+    def recent_ee_forcetorques(self):
+        """
+        Returns:
+            DeltaBuffer: Current and last forces / torques sensed at eef
+        """
+        return self.subscribe_ee_history("ee_forcetorques")
+
+    @property
+    def recent_ee_pose(self):
+        """
+        Returns:
+            DeltaBuffer: Current and last eef pose (pos + ori (quat))
+        """
+        return self.subscribe_ee_history("ee_pose")
+
+    @property
+    def recent_ee_vel(self):
+        """
+        Returns:
+            DeltaBuffer: Current and last eef velocity
+        """
+        return self.subscribe_ee_history("ee_vel")
+
+    @property
+    def recent_ee_vel_buffer(self):
+        """
+        Returns:
+            RingBuffer: Prior 10 values of eef velocity
+        """
+        return self.subscribe_ee_history("ee_vel_buffer")
+
+    @property
+    def recent_ee_acc(self):
+        """
+        Returns:
+            DeltaBuffer: Current and last eef acceleration
+        """
+        return self.subscribe_ee_history("ee_acc")
+
     @property
     def ee_ft_integral(self):
         """
@@ -383,7 +473,7 @@ class SingleArm(Manipulator):
         Returns:
             np.array: (4,4) array corresponding to the eef pose in base frame of robot.
         """
-        return self.pose_in_base_from_name(self.robot_model.eef_name)
+        return self.pose_in_base_from_id(self._ref_eef_body_id)
 
     @property
     def _hand_quat(self):
@@ -401,10 +491,8 @@ class SingleArm(Manipulator):
         """
 
         # Use jacobian to translate joint velocities to end effector velocities.
-        Jp = self.sim.data.get_body_jacp(self.robot_model.eef_name).reshape((3, -1))
+        Jp, Jr = self._get_body_jacobian(self._ref_eef_body_id)
         Jp_joint = Jp[:, self._ref_joint_vel_indexes]
-
-        Jr = self.sim.data.get_body_jacr(self.robot_model.eef_name).reshape((3, -1))
         Jr_joint = Jr[:, self._ref_joint_vel_indexes]
 
         eef_lin_vel = Jp_joint.dot(self._joint_velocities)
@@ -0,0 +1,121 @@
+"""
+Micro-benchmark of the per-policy-step proprioceptive buffer updates done in SingleArm.control.
+
+The legacy path reproduces the previous buffer implementations (allocating a new array on every push, and estimating
+the eef acceleration by stacking, differencing and convolving the whole velocity history), while the current path uses
+the in-place buffers from robosuite.utils.buffers with their running statistics. Both are fed the same random robot
+state, so the difference in timings is the per-step overhead saved in SingleArm.control.
+
+Example:
+    $ python benchmark_buffers.py --iterations 20000
+"""
+
+import argparse
+import time
+
+import numpy as np
+
+from robosuite.utils.buffers import DeltaBuffer, RingBuffer
+
+
+class LegacyRingBuffer:
+    def __init__(self, dim, length):
+        self.length = length
+        self.ptr = length - 1
+        self.buf = np.zeros((length, dim))
+
+    def push(self, value):
+        self.ptr = (self.ptr + 1) % self.length
+        self.buf[self.ptr] = np.array(value)
+
+
+class LegacyDeltaBuffer:
+    def __init__(self, dim):
+        self.last = np.zeros(dim)
+        self.current = np.zeros(dim)
+
+    def push(self, value):
+        self.last = self.current
+        self.current = np.array(value)
+
+
+def make_buffers(ring_cls, delta_cls, dof):
+    return {
+        "qpos": delta_cls(dim=dof),
+        "actions": delta_cls(dim=dof + 1),
+        "torques": delta_cls(dim=dof),
+        "ee_forcetorques": delta_cls(dim=6),
+        "ee_pose": delta_cls(dim=7),
+        "ee_vel": delta_cls(dim=6),
+        "ee_vel_buffer": ring_cls(dim=6, length=10),
+        "ee_acc": delta_cls(dim=6),
+    }
+
+
+def legacy_step(buffers, state, control_freq):
+    qpos, action, torques, force, torque, ee_pos, ee_quat, ee_pos_vel, ee_ori_vel = state
+    buffers["qpos"].push(qpos)
+    buffers["actions"].push(action)
+    buffers["torques"].push(torques)
+    buffers["ee_forcetorques"].push(np.concatenate((force, torque)))
+    buffers["ee_pose"].push(np.concatenate((ee_pos, ee_quat)))
+    buffers["ee_vel"].push(np.concatenate((ee_pos_vel, ee_ori_vel)))
+    buffers["ee_vel_buffer"].push(np.concatenate((ee_pos_vel, ee_ori_vel)))
+    diffs = np.vstack([buffers["ee_acc"].current, control_freq * np.diff(buffers["ee_vel_buffer"].buf, axis=0)])
+    ee_acc = np.array([np.convolve(col, np.ones(10) / 10.0, mode="valid")[0] for col in diffs.transpose()])
+    buffers["ee_acc"].push(ee_acc)
+
+
+def current_step(buffers, state, control_freq):
+    qpos, action, torques, force, torque, ee_pos, ee_quat, ee_pos_vel, ee_ori_vel = state
+    buffers["qpos"].push(qpos)
+    buffers["actions"].push(action)
+    buffers["torques"].push(torques)
+    buffers["ee_forcetorques"].push(np.concatenate((force, torque)))
+    buffers["ee_pose"].push(np.concatenate((ee_pos, ee_quat)))
+    buffers["ee_vel"].push(np.concatenate((ee_pos_vel, ee_ori_vel)))
+    buffers["ee_vel_buffer"].push(buffers["ee_vel"].current)
+    ee_acc = (buffers["ee_acc"].current + control_freq * buffers["ee_vel_buffer"].delta) / buffers[
+        "ee_vel_buffer"
+    ].length
+    buffers["ee_acc"].push(ee_acc)
+
+
+def benchmark(step_fn, buffers, states, control_freq):
+    start = time.perf_counter()
+    for state in states:
+        step_fn(buffers, state, control_freq)
+    return (time.perf_counter() - start) / len(states)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--dof", type=int, default=7, help="Number of robot arm joints")
+    parser.add_argument("--iterations", type=int, default=20000, help="Number of simulated policy steps")
+    parser.add_argument("--control-freq", type=float, default=20, help="Policy frequency (Hz)")
+    args = parser.parse_args()
+
+    np.random.seed(0)
+    states = [
+        (
+            np.random.randn(args.dof),
+            np.random.randn(args.dof + 1),
+            np.random.randn(args.dof),
+            np.random.randn(3),
+            np.random.randn(3),
+            np.random.randn(3),
+            np.random.randn(4),
+            np.random.randn(3),
+            np.random.randn(3),
+        )
+        for _ in range(args.iterations)
+    ]
+
+    t_legacy = benchmark(
+        legacy_step, make_buffers(LegacyRingBuffer, LegacyDeltaBuffer, args.dof), states, args.control_freq
+    )
+    t_current = benchmark(current_step, make_buffers(RingBuffer, DeltaBuffer, args.dof), states, args.control_freq)
+
+    print("legacy:  {:8.2f} us / step".format(t_legacy * 1e6))
+    print("current: {:8.2f} us / step".format(t_current * 1e6))
+    print("speedup: {:8.2f}x".format(t_legacy / t_current))
@@ -0,0 +1,81 @@
+"""
+Benchmark of offscreen camera rendering, comparing one sim.render() call per camera (as previously done by the camera
+observables) against the BatchedCameraRenderer used by RobotEnv, which renders the cameras with pre-resolved camera ids
+and an offscreen framebuffer that is sized once for all of them.
+
+Each configuration renders the rgb (and optionally depth) images of 1, 2, or 4 cameras at each of the requested
+resolutions, plus a "mixed" configuration where the cameras have different resolutions.
+
+Example:
+    $ python benchmark_camera_rendering.py --cameras 1 2 4 --resolutions 84 128 256 --iterations 200
+"""
+
+import argparse
+import time
+
+import numpy as np
+
+import robosuite as suite
+from robosuite.renderers.mujoco.camera_renderer import BatchedCameraRenderer
+
+CAMERA_NAMES = ["agentview", "frontview", "birdview", "sideview"]
+
+
+def benchmark_sim_render(sim, cameras, depth, iterations):
+    start = time.perf_counter()
+    for _ in range(iterations):
+        for camera_name, width, height in cameras:
+            sim.render(camera_name=camera_name, width=width, height=height, depth=depth)
+    return (time.perf_counter() - start) / iterations
+
+
+def benchmark_batched_render(renderer, cameras, depth, iterations):
+    # Warm-up render, so that the initial framebuffer allocation is excluded
+    renderer.render(cameras, depth=depth)
+    start = time.perf_counter()
+    for _ in range(iterations):
+        renderer.render(cameras, depth=depth)
+    return (time.perf_counter() - start) / iterations
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--environment", type=str, default="Lift")
+    parser.add_argument("--cameras", type=int, nargs="+", default=[1, 2, 4], help="Numbers of cameras to render")
+    parser.add_argument("--resolutions", type=int, nargs="+", default=[84, 128, 256], help="Square resolutions")
+    parser.add_argument("--iterations", type=int, default=200, help="Number of renders per configuration")
+    parser.add_argument("--depth", action="store_true", help="Also render depth")
+    args = parser.parse_args()
+
+    env = suite.make(
+        args.environment,
+        robots="Panda",
+        has_renderer=False,
+        has_offscreen_renderer=True,
+        use_camera_obs=False,
+    )
+    env.reset()
+
+    configs = []
+    for num_cameras in args.cameras:
+        names = CAMERA_NAMES[:num_cameras]
+        for res in args.resolutions:
+            configs.append(("{}x{}".format(res, res), [(name, res, res) for name in names]))
+        configs.append(
+            ("mixed", [(name, res, res) for name, res in zip(names, np.resize(args.resolutions, num_cameras))])
+        )
+
+    print("{:>8} {:>10} {:>14} {:>14} {:>9}".format("cameras", "res", "sim.render ms", "batched ms", "speedup"))
+    for res_name, cameras in configs:
+        # Fresh renderer per configuration, as RobotEnv would create for its set of cameras
+        renderer = BatchedCameraRenderer(env.sim, env.sim._render_context_offscreen)
+        for camera in cameras:
+            renderer.add_camera(*camera)
+        t_batched = benchmark_batched_render(renderer, cameras, args.depth, args.iterations)
+        t_sim = benchmark_sim_render(env.sim, cameras, args.depth, args.iterations)
+        print(
+            "{:>8d} {:>10} {:>14.3f} {:>14.3f} {:>8.2f}x".format(
+                len(cameras), res_name, t_sim * 1e3, t_batched * 1e3, t_sim / t_batched
+            )
+        )
+    env.close()
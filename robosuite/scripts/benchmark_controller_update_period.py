@@ -0,0 +1,88 @@
+"""
+Benchmark of simulation throughput vs. tracking error when evaluating the arm controller less often than the
+simulation is stepped (see the "update_period" and "zero_order_hold" controller config entries).
+
+For each update period, the same seeded environment is rolled out with the same random (smoothed) action sequence,
+and the following are reported:
+    - steps / sec: environment (policy) steps per second of wall-clock time
+    - goal error: mean distance between the controller's eef goal position and the achieved eef position at the end
+        of every policy step
+    - traj dev: mean distance between the achieved eef positions and those achieved when evaluating the controller at
+        every substep (update period of 1)
+
+Example:
+    $ python benchmark_controller_update_period.py --environment Lift --robots Panda --periods 1 2 5 10
+"""
+
+import argparse
+import time
+
+import numpy as np
+
+import robosuite as suite
+from robosuite import load_controller_config
+
+
+def rollout(args, update_period, zero_order_hold, actions):
+    controller_config = load_controller_config(default_controller=args.controller)
+    controller_config["update_period"] = update_period
+    controller_config["zero_order_hold"] = zero_order_hold
+    env = suite.make(
+        args.environment,
+        robots=args.robots,
+        controller_configs=controller_config,
+        has_renderer=False,
+        has_offscreen_renderer=False,
+        use_camera_obs=False,
+        use_object_obs=False,
+        ignore_done=True,
+        control_freq=args.control_freq,
+    )
+    np.random.seed(args.seed)
+    env.reset()
+    robot = env.robots[0]
+
+    eef_pos = np.zeros((len(actions), 3))
+    goal_errors = np.zeros(len(actions))
+    start = time.perf_counter()
+    for i, action in enumerate(actions):
+        env.step(action)
+        eef_pos[i] = robot.controller.ee_pos
+        goal_errors[i] = np.linalg.norm(robot.controller.goal_pos - robot.controller.ee_pos)
+    steps_per_sec = len(actions) / (time.perf_counter() - start)
+    env.close()
+    return steps_per_sec, goal_errors.mean(), eef_pos
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--environment", type=str, default="Lift")
+    parser.add_argument("--robots", type=str, default="Panda", help="Single-arm robot to benchmark")
+    parser.add_argument("--controller", type=str, default="OSC_POSE", help="Choice of OSC_POSE or OSC_POSITION")
+    parser.add_argument("--periods", type=int, nargs="+", default=[1, 2, 5, 10], help="Update periods to compare")
+    parser.add_argument("--steps", type=int, default=500, help="Number of policy steps per rollout")
+    parser.add_argument("--control-freq", type=float, default=20, help="Policy frequency (Hz)")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    # Smoothed random actions, so that the eef actually tracks a trajectory instead of jittering in place
+    np.random.seed(args.seed)
+    action_dim = 7 if args.controller == "OSC_POSE" else 4
+    noise = np.random.uniform(-1, 1, (args.steps, action_dim))
+    actions = np.zeros_like(noise)
+    for i in range(1, args.steps):
+        actions[i] = 0.9 * actions[i - 1] + 0.1 * noise[i]
+    actions = np.clip(actions * 3.0, -1, 1)
+
+    _, _, reference_pos = rollout(args, 1, True, actions)
+
+    print("{:>8} {:>6} {:>12} {:>12} {:>12}".format("period", "hold", "steps / sec", "goal error", "traj dev"))
+    for period in args.periods:
+        for zero_order_hold in (True, False) if period > 1 else (True,):
+            steps_per_sec, goal_error, eef_pos = rollout(args, period, zero_order_hold, actions)
+            traj_dev = np.linalg.norm(eef_pos - reference_pos, axis=-1).mean()
+            print(
+                "{:>8d} {:>6} {:>12.1f} {:>12.5f} {:>12.5f}".format(
+                    period, "zoh" if zero_order_hold else "comp", steps_per_sec, goal_error, traj_dev
+                )
+            )
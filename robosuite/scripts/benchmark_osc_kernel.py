@@ -0,0 +1,113 @@
+"""
+Micro-benchmark comparing the fused OSC torque kernel against the unfused OSC path.
+
+The unfused path chains opspace_matrices, nullspace_torques, and the NumPy glue between them (as done by
+OperationalSpaceController with fused_kernel=False), while the fused path makes a single call to opspace_torques.
+Both are run on the same random inputs, after a warm-up call so that numba compilation time is excluded.
+
+Also times the fused path with cached opspace matrices (as done with opspace_cache_tol set), both on a cache hit
+(opspace_torques_from_matrices only) and on a cache miss (opspace_matrices followed by opspace_torques_from_matrices),
+and reports the cache hit rate above which caching beats the plain fused kernel.
+
+Example:
+    $ python benchmark_osc_kernel.py --dof 7 --iterations 20000
+"""
+
+import argparse
+import time
+
+import numpy as np
+
+import robosuite.utils.macros as macros
+from robosuite.utils.control_utils import (
+    nullspace_torques,
+    opspace_matrices,
+    opspace_torques,
+    opspace_torques_from_matrices,
+)
+
+
+def unfused_torques(
+    mass_matrix, J_full, position_error, ori_error, ee_vel, kp, kd, initial_joint, joint_pos, joint_vel
+):
+    lambda_full, lambda_pos, lambda_ori, nullspace_matrix = opspace_matrices(
+        mass_matrix, J_full, np.array(J_full[:3]), np.array(J_full[3:])
+    )
+    desired_force = np.multiply(position_error, kp[0:3]) + np.multiply(-ee_vel[:3], kd[0:3])
+    desired_torque = np.multiply(ori_error, kp[3:6]) + np.multiply(-ee_vel[3:], kd[3:6])
+    decoupled_wrench = np.concatenate([np.dot(lambda_pos, desired_force), np.dot(lambda_ori, desired_torque)])
+    torques = np.dot(J_full.T, decoupled_wrench)
+    torques += nullspace_torques(mass_matrix, nullspace_matrix, initial_joint, joint_pos, joint_vel)
+    return torques
+
+
+def fused_torques(mass_matrix, J_full, position_error, ori_error, ee_vel, kp, kd, initial_joint, joint_pos, joint_vel):
+    return opspace_torques(
+        mass_matrix, J_full, position_error, ori_error, ee_vel, kp, kd, initial_joint, joint_pos, joint_vel, True
+    )
+
+
+def cached_torques(matrices):
+    def torques(mass_matrix, J_full, *args):
+        return opspace_torques_from_matrices(mass_matrix, J_full, *matrices, *args, True)
+
+    return torques
+
+
+def cache_miss_torques(mass_matrix, J_full, *args):
+    matrices = opspace_matrices(mass_matrix, J_full, np.array(J_full[:3]), np.array(J_full[3:]))
+    return opspace_torques_from_matrices(mass_matrix, J_full, *matrices, *args, True)
+
+
+def benchmark(fn, args, iterations):
+    # Warm up (triggers numba compilation, if enabled)
+    fn(*args)
+    start = time.perf_counter()
+    for _ in range(iterations):
+        fn(*args)
+    return (time.perf_counter() - start) / iterations
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--dof", type=int, default=7, help="Number of robot arm joints")
+    parser.add_argument("--iterations", type=int, default=20000, help="Number of timed calls per path")
+    args = parser.parse_args()
+
+    np.random.seed(0)
+    A = np.random.randn(args.dof, args.dof)
+    kp = np.ones(6) * 150.0
+    inputs = (
+        A.dot(A.T) + args.dof * np.eye(args.dof),
+        np.random.randn(6, args.dof),
+        np.random.randn(3),
+        np.random.randn(3),
+        np.random.randn(6),
+        kp,
+        2 * np.sqrt(kp),
+        np.random.randn(args.dof),
+        np.random.randn(args.dof),
+        np.random.randn(args.dof),
+    )
+
+    t_unfused = benchmark(unfused_torques, inputs, args.iterations)
+    t_fused = benchmark(fused_torques, inputs, args.iterations)
+    t_hit = benchmark(
+        cached_torques(opspace_matrices(inputs[0], inputs[1], np.array(inputs[1][:3]), np.array(inputs[1][3:]))),
+        inputs,
+        args.iterations,
+    )
+    t_miss = benchmark(cache_miss_torques, inputs, args.iterations)
+    max_diff = np.max(np.abs(unfused_torques(*inputs) - fused_torques(*inputs)))
+    max_cached_diff = np.max(np.abs(cache_miss_torques(*inputs) - fused_torques(*inputs)))
+
+    print("numba enabled: {}".format(macros.ENABLE_NUMBA))
+    print("unfused: {:8.2f} us / call".format(t_unfused * 1e6))
+    print("fused:   {:8.2f} us / call".format(t_fused * 1e6))
+    print("speedup: {:8.2f}x".format(t_unfused / t_fused))
+    print("max abs torque difference: {:.3e}".format(max_diff))
+    print("fused, cache hit:  {:8.2f} us / call".format(t_hit * 1e6))
+    print("fused, cache miss: {:8.2f} us / call".format(t_miss * 1e6))
+    # Caching pays off once hit_rate * t_hit + (1 - hit_rate) * t_miss < t_fused
+    print("break-even cache hit rate: {:.1%}".format(max(0.0, (t_miss - t_fused) / (t_miss - t_hit))))
+    print("max abs cached torque difference: {:.3e}".format(max_cached_diff))
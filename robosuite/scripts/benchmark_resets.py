@@ -0,0 +1,62 @@
+"""
+Benchmark of environment resets per second for each reset mode (see the "hard_reset" environment argument).
+
+For each reset mode, the same seeded environment is reset repeatedly (taking a single random step in between, so that
+every reset starts from a perturbed state), and the following are reported:
+    - resets / sec: env.reset() calls per second of wall-clock time
+    - rebuilds: fraction of resets that re-loaded the model (i.e.: created a new MjModel)
+
+Example:
+    $ python benchmark_resets.py --environment Lift --robots Panda --modes hard soft none
+"""
+
+import argparse
+import time
+
+import numpy as np
+
+import robosuite as suite
+
+RESET_MODES = {"hard": True, "soft": "soft", "none": False}
+
+
+def benchmark(args, hard_reset):
+    env = suite.make(
+        args.environment,
+        robots=args.robots,
+        hard_reset=hard_reset,
+        has_renderer=False,
+        has_offscreen_renderer=False,
+        use_camera_obs=False,
+        ignore_done=True,
+    )
+    np.random.seed(args.seed)
+    env.reset()
+
+    duration, rebuilds = 0.0, 0
+    for _ in range(args.resets):
+        env.step(np.random.uniform(*env.action_spec))
+        model = env.sim.model
+        start = time.perf_counter()
+        env.reset()
+        duration += time.perf_counter() - start
+        rebuilds += env.sim.model is not model
+    env.close()
+    return args.resets / duration, rebuilds / args.resets
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--environment", type=str, default="Lift")
+    parser.add_argument("--robots", nargs="+", type=str, default="Panda", help="Which robot(s) to use in the env")
+    parser.add_argument(
+        "--modes", type=str, nargs="+", default=list(RESET_MODES), choices=list(RESET_MODES), help="Modes to compare"
+    )
+    parser.add_argument("--resets", type=int, default=50, help="Number of resets per mode")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    print("{:>8} {:>14} {:>10}".format("mode", "resets / sec", "rebuilds"))
+    for mode in args.modes:
+        resets_per_sec, rebuild_fraction = benchmark(args, RESET_MODES[mode])
+        print("{:>8} {:>14.1f} {:>10.2f}".format(mode, resets_per_sec, rebuild_fraction))
@@ -29,7 +29,8 @@ class RingBuffer(Buffer):
     Simple RingBuffer object to hold values to average (useful for, e.g.: filtering D component in PID control)
 
     Note that the buffer object is a 2D numpy array, where each row corresponds to
-    individual entries into the buffer
+    individual entries into the buffer. Values are written in-place, and a running sum is maintained so that
+    @average is O(1); arrays returned by @current are views into the buffer and will be overwritten by later pushes
 
     Args:
         dim (int): Size of entries being added. This is, e.g.: the size of a state vector that is to be stored
@@ -50,6 +51,9 @@ class RingBuffer(Buffer):
         # Construct ring buffer
         self.buf = np.zeros((length, dim))
 
+        # Running sum of all elements in buffer
+        self._sum = np.zeros(dim)
+
     def push(self, value):
         """
         Pushes a new value into the buffer
@@ -59,7 +63,14 @@ class RingBuffer(Buffer):
         """
         # Increment pointer, then add value (also increment size if necessary)
         self.ptr = (self.ptr + 1) % self.length
-        self.buf[self.ptr] = np.array(value)
+        if self.ptr == 0:
+            # Recompute the running sum from scratch once per cycle so that round-off errors don't accumulate
+            self.buf[self.ptr] = value
+            np.sum(self.buf, axis=0, out=self._sum)
+        else:
+            self._sum -= self.buf[self.ptr]
+            self.buf[self.ptr] = value
+            self._sum += self.buf[self.ptr]
         if self._size < self.length:
             self._size += 1
 
@@ -67,7 +78,8 @@ class RingBuffer(Buffer):
         """
         Clears buffer and reset pointer
         """
-        self.buf = np.zeros((self.length, self.dim))
+        self.buf.fill(0.0)
+        self._sum.fill(0.0)
         self.ptr = self.length - 1
         self._size = 0
 
@@ -89,13 +101,28 @@ class RingBuffer(Buffer):
         Returns:
             float or np.array: Averaged value of all elements in buffer
         """
-        return np.mean(self.buf[: self._size], axis=0)
+        return self._sum / self._size
+
+    @property
+    def delta(self):
+        """
+        Gets the difference between the most recent and the oldest value in the buffer (where unfilled entries count as
+        zeros). Scaled by the push frequency and divided by (length - 1), this is the average finite-difference
+        derivative over the buffer's window
+
+        Returns:
+            float or np.array: Most recent value minus oldest value in buffer
+        """
+        return self.buf[self.ptr] - self.buf[(self.ptr + 1) % self.length]
 
 
 class DeltaBuffer(Buffer):
     """
     Simple 2-length buffer object to streamline grabbing delta values between "current" and "last" values
 
+    Values are written in-place, so arrays returned by @current and @last are views into the buffer and will be
+    overwritten by later pushes
+
     Constructs delta object.
 
     Args:
@@ -107,7 +134,7 @@ class DeltaBuffer(Buffer):
     def __init__(self, dim, init_value=None):
         # Setup delta object
         self.dim = dim
-        self.last = np.zeros(self.dim) if init_value is None else np.array(init_value)
+        self.last = np.zeros(self.dim) if init_value is None else np.array(init_value, dtype=np.float64)
         self.current = np.zeros(self.dim)
 
     def push(self, value):
@@ -117,14 +144,15 @@ class DeltaBuffer(Buffer):
         Args:
             value (int or float or array): Value(s) to push into the array (taken as a single new element)
         """
-        self.last = self.current
-        self.current = np.array(value)
+        self.last, self.current = self.current, self.last
+        self.current[:] = value
 
     def clear(self):
         """
         Clears last and current value
         """
-        self.last, self.current = np.zeros(self.dim), np.zeros(self.dim)
+        self.last.fill(0.0)
+        self.current.fill(0.0)
 
     @property
     def delta(self, abs_value=False):
@@ -82,6 +82,220 @@ def opspace_matrices(mass_matrix, J_full, J_pos, J_ori):
     return lambda_full, lambda_pos, lambda_ori, nullspace_matrix
 
 
+@jit_decorator
+def opspace_torques(
+    mass_matrix,
+    J_full,
+    position_error,
+    ori_error,
+    ee_vel,
+    kp,
+    kd,
+    initial_joint,
+    joint_pos,
+    joint_vel,
+    uncoupling,
+    joint_kp=10.0,
+):
+    """
+    Fused operational space control kernel. Computes the same torques (pre gravity compensation) as chaining
+    @opspace_matrices and @nullspace_torques in the OSC controller, but in a single call, so that the Python / NumPy
+    dispatch overhead of the many small matrix operations is only paid once when compiled with numba.
+
+    Since J_pos and J_ori are the top and bottom rows of J_full, their lambda inverses are simply the diagonal blocks of
+    the full lambda inverse, and M^-1 is never formed explicitly.
+
+    Args:
+        mass_matrix (np.array): 2d array representing the mass matrix of the robot
+        J_full (np.array): 2d array representing the full Jacobian matrix of the robot
+        position_error (np.array): 3d array of the desired minus current eef position
+        ori_error (np.array): 3d array of the eef orientation error (see @orientation_error)
+        ee_vel (np.array): 6d array of the current linear and angular eef velocity
+        kp (np.array): 6d array of proportional gains
+        kd (np.array): 6d array of derivative gains
+        initial_joint (np.array): Joint configuration to be used for calculating nullspace torques
+        joint_pos (np.array): Current joint positions
+        joint_vel (np.array): Current joint velocities
+        uncoupling (bool): Whether to decouple torques meant to control pos and torques meant to control ori
+        joint_kp (float): Proportional control gain when calculating nullspace torques
+
+    Returns:
+        np.array: Command torques (without gravity compensation)
+    """
+    # Desired wrench: kp * err - kd * vel
+    desired_wrench = np.empty(6)
+    desired_wrench[:3] = kp[:3] * position_error - kd[:3] * ee_vel[:3]
+    desired_wrench[3:] = kp[3:] * ori_error - kd[3:] * ee_vel[3:]
+
+    # M^-1 J^T and J M^-1 J^T
+    mass_matrix_inv_J_T = np.linalg.solve(mass_matrix, np.ascontiguousarray(J_full.transpose()))
+    lambda_full_inv = np.dot(J_full, mass_matrix_inv_J_T)
+
+    # take the inverses, but zero out small singular values for stability
+    lambda_full = np.linalg.pinv(lambda_full_inv)
+    if uncoupling:
+        decoupled_wrench = np.empty(6)
+        decoupled_wrench[:3] = np.dot(np.linalg.pinv(np.ascontiguousarray(lambda_full_inv[:3, :3])), desired_wrench[:3])
+        decoupled_wrench[3:] = np.dot(np.linalg.pinv(np.ascontiguousarray(lambda_full_inv[3:, 3:])), desired_wrench[3:])
+    else:
+        decoupled_wrench = np.dot(lambda_full, desired_wrench)
+
+    # Gamma (without null torques) = J^T * F
+    torques = np.dot(J_full.transpose(), decoupled_wrench)
+
+    # nullspace matrix (I - Jbar * J), with Jbar = M^-1 J^T lambda
+    Jbar = np.dot(mass_matrix_inv_J_T, lambda_full)
+    nullspace_matrix = np.eye(J_full.shape[-1]) - np.dot(Jbar, J_full)
+
+    # Nullspace torques maintaining the initial joint configuration, with critical damping
+    joint_kv = np.sqrt(joint_kp) * 2
+    pose_torques = np.dot(mass_matrix, (joint_kp * (initial_joint - joint_pos) - joint_kv * joint_vel))
+    torques += np.dot(nullspace_matrix.transpose(), pose_torques)
+
+    return torques
+
+
+@jit_decorator
+def opspace_torques_from_matrices(
+    mass_matrix,
+    J_full,
+    lambda_full,
+    lambda_pos,
+    lambda_ori,
+    nullspace_matrix,
+    position_error,
+    ori_error,
+    ee_vel,
+    kp,
+    kd,
+    initial_joint,
+    joint_pos,
+    joint_vel,
+    uncoupling,
+    joint_kp=10.0,
+):
+    """
+    Variant of the fused operational space control kernel @opspace_torques that takes precomputed lambda and nullspace
+    matrices (see @opspace_matrices), e.g.: ones cached across controller updates. This skips the linear solves and
+    pseudo-inverses, which make up most of the cost of @opspace_torques, while still computing all remaining torque
+    terms in a single call.
+
+    Args:
+        mass_matrix (np.array): 2d array representing the mass matrix of the robot
+        J_full (np.array): 2d array representing the full Jacobian matrix of the robot
+        lambda_full (np.array): 2d array representing the full lambda matrix
+        lambda_pos (np.array): 2d array representing the position components of the lambda matrix
+        lambda_ori (np.array): 2d array representing the orientation components of the lambda matrix
+        nullspace_matrix (np.array): 2d array representing the nullspace matrix of the robot
+        position_error (np.array): 3d array of the desired minus current eef position
+        ori_error (np.array): 3d array of the eef orientation error (see @orientation_error)
+        ee_vel (np.array): 6d array of the current linear and angular eef velocity
+        kp (np.array): 6d array of proportional gains
+        kd (np.array): 6d array of derivative gains
+        initial_joint (np.array): Joint configuration to be used for calculating nullspace torques
+        joint_pos (np.array): Current joint positions
+        joint_vel (np.array): Current joint velocities
+        uncoupling (bool): Whether to decouple torques meant to control pos and torques meant to control ori
+        joint_kp (float): Proportional control gain when calculating nullspace torques
+
+    Returns:
+        np.array: Command torques (without gravity compensation)
+    """
+    # Desired wrench: kp * err - kd * vel
+    desired_wrench = np.empty(6)
+    desired_wrench[:3] = kp[:3] * position_error - kd[:3] * ee_vel[:3]
+    desired_wrench[3:] = kp[3:] * ori_error - kd[3:] * ee_vel[3:]
+
+    if uncoupling:
+        decoupled_wrench = np.empty(6)
+        decoupled_wrench[:3] = np.dot(lambda_pos, desired_wrench[:3])
+        decoupled_wrench[3:] = np.dot(lambda_ori, desired_wrench[3:])
+    else:
+        decoupled_wrench = np.dot(lambda_full, desired_wrench)
+
+    # Gamma (without null torques) = J^T * F
+    torques = np.dot(J_full.transpose(), decoupled_wrench)
+
+    # Nullspace torques maintaining the initial joint configuration, with critical damping
+    joint_kv = np.sqrt(joint_kp) * 2
+    pose_torques = np.dot(mass_matrix, (joint_kp * (initial_joint - joint_pos) - joint_kv * joint_vel))
+    torques += np.dot(nullspace_matrix.transpose(), pose_torques)
+
+    return torques
+
+
+def opspace_torques_batch(
+    mass_matrix,
+    J_full,
+    position_error,
+    ori_error,
+    ee_vel,
+    kp,
+    kd,
+    initial_joint,
+    joint_pos,
+    joint_vel,
+    uncoupling,
+    joint_kp=10.0,
+):
+    """
+    Batched version of @opspace_torques, which computes the OSC torques (pre gravity compensation) of B robots at once
+    using NumPy's stacked linear algebra routines. All robots must have the same number of joints n.
+
+    Args:
+        mass_matrix (np.array): (B, n, n) array of mass matrices
+        J_full (np.array): (B, 6, n) array of full Jacobian matrices
+        position_error (np.array): (B, 3) array of desired minus current eef positions
+        ori_error (np.array): (B, 3) array of eef orientation errors (see @orientation_error)
+        ee_vel (np.array): (B, 6) array of current linear and angular eef velocities
+        kp (np.array): (B, 6) array of proportional gains
+        kd (np.array): (B, 6) array of derivative gains
+        initial_joint (np.array): (B, n) array of joint configurations used for calculating nullspace torques
+        joint_pos (np.array): (B, n) array of current joint positions
+        joint_vel (np.array): (B, n) array of current joint velocities
+        uncoupling (bool or np.array): Whether to decouple torques meant to control pos and torques meant to control
+            ori. Can also be a (B,) boolean array to specify this per robot
+        joint_kp (float): Proportional control gain when calculating nullspace torques
+
+    Returns:
+        np.array: (B, n) command torques (without gravity compensation)
+    """
+    # Desired wrench: kp * err - kd * vel
+    desired_wrench = kp * np.concatenate([position_error, ori_error], axis=-1) - kd * ee_vel
+
+    # M^-1 J^T and J M^-1 J^T
+    J_full_T = np.swapaxes(J_full, -1, -2)
+    mass_matrix_inv_J_T = np.linalg.solve(mass_matrix, J_full_T)
+    lambda_full_inv = np.matmul(J_full, mass_matrix_inv_J_T)
+
+    # take the inverses, but zero out small singular values for stability
+    lambda_full = np.linalg.pinv(lambda_full_inv)
+    decoupled_wrench = np.matmul(lambda_full, desired_wrench[..., None])[..., 0]
+    uncoupling = np.broadcast_to(uncoupling, desired_wrench.shape[:1])
+    if np.any(uncoupling):
+        idx = np.nonzero(uncoupling)[0]
+        decoupled_wrench[idx, :3] = np.matmul(
+            np.linalg.pinv(lambda_full_inv[idx, :3, :3]), desired_wrench[idx, :3, None]
+        )[..., 0]
+        decoupled_wrench[idx, 3:] = np.matmul(
+            np.linalg.pinv(lambda_full_inv[idx, 3:, 3:]), desired_wrench[idx, 3:, None]
+        )[..., 0]
+
+    # Gamma (without null torques) = J^T * F
+    torques = np.matmul(J_full_T, decoupled_wrench[..., None])[..., 0]
+
+    # nullspace matrix (I - Jbar * J), with Jbar = M^-1 J^T lambda
+    Jbar = np.matmul(mass_matrix_inv_J_T, lambda_full)
+    nullspace_matrix = np.eye(J_full.shape[-1]) - np.matmul(Jbar, J_full)
+
+    # Nullspace torques maintaining the initial joint configuration, with critical damping
+    joint_kv = np.sqrt(joint_kp) * 2
+    pose_torques = np.matmul(mass_matrix, (joint_kp * (initial_joint - joint_pos) - joint_kv * joint_vel)[..., None])
+    torques += np.matmul(np.swapaxes(nullspace_matrix, -1, -2), pose_torques)[..., 0]
+
+    return torques
+
+
 @jit_decorator
 def orientation_error(desired, current):
     """
@@ -111,6 +325,112 @@ def orientation_error(desired, current):
     return error
 
 
+@jit_decorator
+def damped_least_squares_ik(
+    J_full, pose_error, joint_pos, initial_guess, joint_lower, joint_upper, damping, iterations
+):
+    """
+    Solves for the joint positions that achieve a desired eef pose using damped least squares, linearized about the
+    current joint positions (i.e.: using the Jacobian already computed for the current simulation state).
+
+    Each iteration takes a damped Gauss-Newton step on the remaining (linearized) pose error, and then projects the
+    solution back into the joint limits. Warm-starting from a previous solution (@initial_guess) lets the solver
+    converge in fewer iterations when the target changes little between calls.
+
+    Args:
+        J_full (np.array): 2d array representing the full (position + orientation) Jacobian at @joint_pos
+        pose_error (np.array): 6d array representing the desired minus current eef position and orientation
+            (see @orientation_error)
+        joint_pos (np.array): current joint positions
+        initial_guess (np.array): joint positions to start iterating from
+        joint_lower (np.array): lower joint position limits
+        joint_upper (np.array): upper joint position limits
+        damping (float): damping factor; larger values trade off accuracy for robustness near singularities
+        iterations (int): number of iterations to run
+
+    Returns:
+        np.array: joint positions solution
+    """
+    # Damped pseudo-inverse J^T (J J^T + lambda^2 I)^-1 (J J^T is symmetric, so solve for its transpose instead)
+    damped = np.dot(J_full, J_full.T) + damping * damping * np.eye(J_full.shape[0])
+    J_pinv = np.linalg.solve(damped, J_full).T
+
+    solution = initial_guess.copy()
+    for _ in range(iterations):
+        residual = pose_error - np.dot(J_full, solution - joint_pos)
+        solution = np.minimum(np.maximum(solution + np.dot(J_pinv, residual), joint_lower), joint_upper)
+
+    return solution
+
+
+class DampedLeastSquaresIKSolver:
+    """
+    Stateful damped least squares IK solver for a single arm (see @damped_least_squares_ik), which warm-starts every
+    solve from the previous one.
+
+    Rather than starting from the previous solution itself (which would carry forward any drift of the arm away from
+    it, e.g.: in the nullspace), each solve starts from the measured joint positions plus the offset of the previous
+    solution from the joint positions it was solved at. This offset is only applied while it is small (no joint offset
+    by more than @warm_start_tol), and is otherwise dropped in favor of a cold start from the measured joint positions.
+
+    Since the solver only holds joint-space state, it can outlive the controller using it, e.g.: robots hand it over
+    to the IK controllers they re-create on every reset.
+
+    Args:
+        joint_lower (np.array): lower joint position limits
+        joint_upper (np.array): upper joint position limits
+        damping (float): damping factor; larger values trade off accuracy for robustness near singularities
+        iterations (int): number of iterations to run per solve
+        warm_start_tol (float): maximum absolute joint offset (rad) of the previous solution that is still used to
+            warm-start the next solve
+    """
+
+    def __init__(self, joint_lower, joint_upper, damping, iterations, warm_start_tol=0.1):
+        self.joint_lower = np.array(joint_lower, dtype=np.float64)
+        self.joint_upper = np.array(joint_upper, dtype=np.float64)
+        self.damping = damping
+        self.iterations = iterations
+        self.warm_start_tol = warm_start_tol
+
+        # Offset of the last solution from the joint positions it was solved at
+        self.offset = None
+
+    def solve(self, J_full, pose_error, joint_pos):
+        """
+        Solves for the joint positions that achieve @pose_error from the current joint positions @joint_pos, and
+        records the solution's offset to warm-start the next solve.
+
+        Args:
+            J_full (np.array): 2d array representing the full (position + orientation) Jacobian at @joint_pos
+            pose_error (np.array): 6d array representing the desired minus current eef position and orientation
+            joint_pos (np.array): current (measured) joint positions
+
+        Returns:
+            np.array: joint positions solution
+        """
+        initial_guess = joint_pos
+        if self.offset is not None and np.max(np.abs(self.offset)) <= self.warm_start_tol:
+            initial_guess = joint_pos + self.offset
+        solution = damped_least_squares_ik(
+            J_full,
+            pose_error,
+            joint_pos,
+            initial_guess,
+            self.joint_lower,
+            self.joint_upper,
+            self.damping,
+            self.iterations,
+        )
+        self.offset = solution - joint_pos
+        return solution
+
+    def reset(self):
+        """
+        Drops the warm-start state, so that the next solve starts from the measured joint positions.
+        """
+        self.offset = None
+
+
 def set_goal_position(delta, current_position, position_limit=None, set_pos=None):
     """
     Calculates and returns the desired goal position, clipping the result accordingly to @position_limits.
@@ -234,3 +554,93 @@ def set_goal_orientation(delta, current_orientation, orientation_limit=None, set
         if limited:
             goal_orientation = trans.euler2mat(np.array([euler[0], euler[1], euler[2]]))
     return goal_orientation
+
+
+class MassMatrixProvider:
+    """
+    Extracts the (dense) joint-space mass matrix block of a subset of dofs directly from MuJoCo's sparse qM array.
+
+    MuJoCo stores the lower triangle of the mass matrix sparsely: the entries of row i (dof i and each of its ancestor
+    dofs, in order) are stored contiguously starting at address dof_Madr[i]. Expanding the full (nv, nv) matrix costs
+    O(nv^2) per call, which is dominated by the free joints of the objects in the scene. Instead, we precompute the
+    qM address of every nonzero entry of the requested block once, so that each update only touches those entries
+    and writes them into a preallocated buffer.
+
+    A single provider can be shared by several controllers (e.g.: both arms of a bimanual robot), each of which reads
+    its own sub-block via @get_block. In that case, the owner of the provider should @update it once per simulation
+    substep, and the controllers should read their blocks without updating it.
+
+    Args:
+        sim (MjSim): Simulator instance whose mass matrix should be extracted
+        qvel_index (list of int): Dof (qvel) indexes whose mass matrix block should be extracted
+    """
+
+    def __init__(self, sim, qvel_index):
+        self.sim = sim
+        self.qvel_index = [int(dof) for dof in qvel_index]
+
+        # Map every nonzero entry (row, col) of the block (with row >= col in tree order) to its address in qM
+        local_index = {dof: i for i, dof in enumerate(self.qvel_index)}
+        rows, cols, addrs = [], [], []
+        for i, dof in enumerate(self.qvel_index):
+            adr = self.sim.model.dof_Madr[dof]
+            ancestor = dof
+            while ancestor >= 0:
+                if ancestor in local_index:
+                    rows.append(i)
+                    cols.append(local_index[ancestor])
+                    addrs.append(adr)
+                ancestor = self.sim.model.dof_parentid[ancestor]
+                adr += 1
+        self._rows = np.array(rows, dtype=int)
+        self._cols = np.array(cols, dtype=int)
+        self._addrs = np.array(addrs, dtype=int)
+
+        # Preallocated block. Entries between dofs that are not ancestors of each other are always zero
+        self.mass_matrix = np.zeros((len(self.qvel_index), len(self.qvel_index)))
+
+    def update(self):
+        """
+        Updates the mass matrix block from the current simulation state. Note that this only reads qM, so the
+        sim should have already been forwarded.
+
+        Returns:
+            np.array: (n, n) mass matrix block of the dofs specified by self.qvel_index. Note that this is an internal
+                buffer that gets overwritten on the next update
+        """
+        values = self.sim.data.qM[self._addrs]
+        self.mass_matrix[self._rows, self._cols] = values
+        self.mass_matrix[self._cols, self._rows] = values
+        return self.mass_matrix
+
+    def get_index(self, qvel_index):
+        """
+        Computes the index into self.mass_matrix of the sub-block corresponding to dofs @qvel_index
+
+        Args:
+            qvel_index (list of int): Dof (qvel) indexes, all of which must be part of self.qvel_index
+
+        Returns:
+            tuple: Index that can be used to read the sub-block from self.mass_matrix. If the dofs are contiguous
+                within self.qvel_index, this is a pair of slices so that reading the sub-block returns a view
+        """
+        local = [self.qvel_index.index(int(dof)) for dof in qvel_index]
+        if local == list(range(local[0], local[0] + len(local))):
+            block = slice(local[0], local[0] + len(local))
+            return block, block
+        return np.ix_(local, local)
+
+    def get_block(self, index, update=True):
+        """
+        Grabs a sub-block of the mass matrix
+
+        Args:
+            index (tuple): Index of the sub-block, as computed by @get_index
+            update (bool): If True, will first update the mass matrix from the current simulation state
+
+        Returns:
+            np.array: Requested sub-block of the mass matrix
+        """
+        if update:
+            self.update()
+        return self.mass_matrix[index]
@@ -47,4 +47,75 @@ def get_target_quat(cur_quat, axisangle_error):
     current_orientation = T.quat2mat(cur_quat)
     goal_orientation = np.dot(rotation_mat_error, current_orientation)
     goal_quat = T.mat2quat(goal_orientation)
-    return goal_quat
\ No newline at end of file
+    return goal_quat
+def _quat2mat_batch(quats):
+    # Batched version of T.quat2mat, following the same float32 arithmetic
+    q = np.asarray(quats, dtype=np.float32)[:, [3, 0, 1, 2]]
+    n = np.einsum("ij,ij->i", q, q)
+    valid = n >= T.EPS
+    scale = np.ones_like(n)
+    scale[valid] = np.sqrt((np.float32(2.0) / n[valid]).astype(np.float64))
+    q = q * scale[:, None]
+    q2 = q[:, :, None] * q[:, None, :]
+    mats = np.empty((q.shape[0], 3, 3), dtype=np.float32)
+    mats[:, 0, 0] = 1.0 - q2[:, 2, 2] - q2[:, 3, 3]
+    mats[:, 0, 1] = q2[:, 1, 2] - q2[:, 3, 0]
+    mats[:, 0, 2] = q2[:, 1, 3] + q2[:, 2, 0]
+    mats[:, 1, 0] = q2[:, 1, 2] + q2[:, 3, 0]
+    mats[:, 1, 1] = 1.0 - q2[:, 1, 1] - q2[:, 3, 3]
+    mats[:, 1, 2] = q2[:, 2, 3] - q2[:, 1, 0]
+    mats[:, 2, 0] = q2[:, 1, 3] - q2[:, 2, 0]
+    mats[:, 2, 1] = q2[:, 2, 3] + q2[:, 1, 0]
+    mats[:, 2, 2] = 1.0 - q2[:, 1, 1] - q2[:, 2, 2]
+    mats[~valid] = np.identity(3)
+    return mats
+
+def _mat2quat_batch(mats):
+    # Batched version of T.mat2quat, following the same float32 arithmetic
+    M = np.asarray(mats, dtype=np.float32)
+    K = np.zeros((M.shape[0], 4, 4), dtype=np.float32)
+    K[:, 0, 0] = M[:, 0, 0] - M[:, 1, 1] - M[:, 2, 2]
+    K[:, 1, 0] = M[:, 0, 1] + M[:, 1, 0]
+    K[:, 1, 1] = M[:, 1, 1] - M[:, 0, 0] - M[:, 2, 2]
+    K[:, 2, 0] = M[:, 0, 2] + M[:, 2, 0]
+    K[:, 2, 1] = M[:, 1, 2] + M[:, 2, 1]
+    K[:, 2, 2] = M[:, 2, 2] - M[:, 0, 0] - M[:, 1, 1]
+    K[:, 3, 0] = M[:, 2, 1] - M[:, 1, 2]
+    K[:, 3, 1] = M[:, 0, 2] - M[:, 2, 0]
+    K[:, 3, 2] = M[:, 1, 0] - M[:, 0, 1]
+    K[:, 3, 3] = M[:, 0, 0] + M[:, 1, 1] + M[:, 2, 2]
+    K /= 3.0
+    w, V = np.linalg.eigh(K)
+    q1 = V[np.arange(M.shape[0]), :, np.argmax(w, axis=1)][:, [3, 0, 1, 2]]
+    q1[q1[:, 0] < 0.0] *= -1
+    return q1[:, [1, 2, 3, 0]]
+
+def _quat2axisangle_batch(quats):
+    # Batched version of T.quat2axisangle
+    quats = np.array(quats, copy=True)
+    quats[:, 3] = np.clip(quats[:, 3], -1.0, 1.0)
+    den = np.sqrt(1.0 - quats[:, 3] * quats[:, 3])
+    axisangles = np.zeros((quats.shape[0], 3), dtype=quats.dtype)
+    nonzero = den != 0.0
+    angles = np.arccos(quats[nonzero, 3].astype(np.float64)).astype(quats.dtype)
+    axisangles[nonzero] = (quats[nonzero, :3] * 2.0 * angles[:, None]) / den[nonzero, None]
+    return axisangles
+
+def get_eef_yaw_batch(quats):
+    # Batched equivalent of T.mat2euler(T.quat2mat(quat), axes='rxyz')[-1] for (N, 4) quaternions
+    M = _quat2mat_batch(quats)
+    cy = np.sqrt((M[:, 2, 2] * M[:, 2, 2] + M[:, 1, 2] * M[:, 1, 2]).astype(np.float64))
+    yaw = np.where(
+        cy > T.EPS,
+        np.arctan2(M[:, 0, 1].astype(np.float64), M[:, 0, 0].astype(np.float64)),
+        np.arctan2(-M[:, 1, 0].astype(np.float64), M[:, 1, 1].astype(np.float64)),
+    )
+    return (-yaw).astype(np.float32)
+
+def get_axisangle_error_batch(cur_quats, target_quats):
+    # Batched version of get_axisangle_error for (N, 4) quaternions
+    cur_orn = _quat2mat_batch(cur_quats)
+    goal_orn = _quat2mat_batch(target_quats)
+    rot_error = goal_orn @ np.swapaxes(cur_orn, 1, 2)
+    quat_error = _mat2quat_batch(rot_error)
+    return _quat2axisangle_batch(quat_error)
@@ -0,0 +1,80 @@
+"""
+Debugging utilities for finding string-based simulation lookups in hot code paths.
+
+mujoco_py resolves element names to ids on every call to e.g. `sim.model.site_name2id(name)` or
+`sim.data.get_body_xpos(name)`. These lookups are cheap individually, but add up when they are made multiple times
+per simulation substep. Hot code paths should instead resolve ids once during `_setup_references()` and index the
+simulation arrays directly.
+
+Setting `macros.DEBUG_NAME_LOOKUPS = True` makes every environment run its step() under a NameLookupMonitor, which
+warns (once per call site) about every remaining name-based lookup made during the step loop.
+"""
+import re
+import sys
+import warnings
+
+# Matches the names of mujoco_py methods that resolve an element name to an id on every call
+NAME_LOOKUP_PATTERN = re.compile(r"^(\w+_name2id|get_(body|geom|site|joint|camera|light|mocap)_\w+)$")
+
+
+class NameLookupMonitor:
+    """
+    Context manager that flags every name-based simulation lookup made while it is active.
+
+    Lookups are detected through the interpreter's profiling hook, so this is meant for debugging only and adds
+    substantial overhead. Since profiling hooks cannot be nested, the monitor does nothing if another profiler (e.g.:
+    cProfile) is already active.
+
+    Args:
+        warn (bool): If True, a RuntimeWarning is issued the first time each call site performs a lookup
+    """
+
+    def __init__(self, warn=True):
+        self.warn = warn
+
+        # Maps (lookup function name, filename, line number) to the number of times that lookup occurred
+        self.lookups = {}
+
+        self._active = False
+
+    def __enter__(self):
+        if sys.getprofile() is None:
+            sys.setprofile(self._profile)
+            self._active = True
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if self._active:
+            sys.setprofile(None)
+            self._active = False
+
+    def clear(self):
+        """
+        Clears all recorded lookups. Call sites that have already been warned about will be warned about again.
+        """
+        self.lookups = {}
+
+    def _profile(self, frame, event, arg):
+        """
+        Profiling hook. Compiled (mujoco_py) methods show up as "c_call" events whose @arg is the called function,
+        while Python functions show up as "call" events for their own @frame.
+        """
+        if event == "c_call":
+            name = getattr(arg, "__name__", "")
+        elif event == "call":
+            name = frame.f_code.co_name
+            frame = frame.f_back
+        else:
+            return
+        if frame is None or NAME_LOOKUP_PATTERN.match(name) is None:
+            return
+
+        key = (name, frame.f_code.co_filename, frame.f_lineno)
+        count = self.lookups.get(key, 0)
+        self.lookups[key] = count + 1
+        if count == 0 and self.warn:
+            warnings.warn(
+                "Name-based lookup {}() during step() at {}:{}. Consider resolving this id during "
+                "_setup_references() instead.".format(*key),
+                RuntimeWarning,
+            )
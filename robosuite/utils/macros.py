@@ -20,6 +20,30 @@ USING_INSTANCE_RANDOMIZATION = False
 ENABLE_NUMBA = True
 CACHE_NUMBA = True
 
+# Compiled model cache
+# If True, compiled MjModels are cached (keyed by their MJCF xml string) and re-used whenever an environment re-compiles
+# an identical xml, e.g.: during hard resets or reset_from_xml_string(). Models are restored from MuJoCo's binary format
+# on a cache hit, so MjModel.get_xml() (which re-saves the most recently *compiled* xml) may not match a cached model if
+# a different xml was compiled in the meantime. COMPILED_MODEL_CACHE_DIR optionally persists compiled models to disk.
+# See robosuite/utils/model_cache.py for details
+CACHE_COMPILED_MODELS = False
+COMPILED_MODEL_CACHE_SIZE = 16  # Maximum number of compiled models held in memory
+COMPILED_MODEL_CACHE_DIR = None  # If set, directory in which to persist compiled models across processes / runs
+
+# XML tree cache
+# If True, the post-processed element tree of every MJCF file loaded by a MujocoXML (robots, grippers, mounts, arenas,
+# objects) is cached and deep-copied on subsequent loads instead of being re-parsed. XML_TREE_CACHE_DIR optionally
+# pickles these trees to disk so that they can be shared across processes / runs.
+# See robosuite/utils/xml_cache.py for details
+CACHE_XML_TREES = False
+XML_TREE_CACHE_DIR = None  # If set, directory in which to persist parsed trees across processes / runs
+
+# Name lookup debugging
+# If True, every env.step() call warns about each name-based sim lookup (e.g.: sim.model.site_name2id(name) or
+# sim.data.get_body_xpos(name)) it makes, so that these can be replaced with ids resolved in _setup_references().
+# This adds substantial overhead and should only be enabled for debugging. See robosuite/utils/lookup_utils.py
+DEBUG_NAME_LOOKUPS = False
+
 # Image Convention
 # Robosuite (Mujoco)-rendered images are based on the OpenGL coordinate frame convention, whereas many downstream
 # applications assume an OpenCV coordinate frame convention. For consistency, you can set the image convention
@@ -27,6 +51,11 @@ CACHE_NUMBA = True
 # See the figure at the bottom of https://amytabb.com/ts/2019_06_28/ for an informative overview.
 IMAGE_CONVENTION = "opengl"  # Options are {"opengl", "opencv"}
 
+# Raw segmentation
+# By default, segmentation observables are (H, W, 1) arrays. If True, they are instead returned as (H, W) arrays, which
+# for element-level segmentation are views into the rendered id buffer (no channel dimension is added and no copy made)
+RAW_SEGMENTATION = False
+
 # Image concatenation
 # In general, observations are concatenated together by modality. However, image observations are expensive memory-wise,
 # so we skip concatenating all images together by default, unless this flag is set to True
@@ -0,0 +1,194 @@
+"""
+LRU cache of compiled MjModels, keyed by the MJCF xml string they were compiled from.
+
+Compiling an MJCF xml string (parsing, loading meshes / textures, and building the low-level model) is one of the most
+expensive parts of a hard reset. Since many resets re-compile an identical xml (e.g.: deterministic resets from
+a recorded task instance), we cache MuJoCo's binary (MJB) representation of each compiled model. Every lookup returns
+a brand new MjModel, so in-place modifications of one model (e.g.: domain randomization) never leak into another.
+
+To enable the cache for all environments, set `macros.CACHE_COMPILED_MODELS = True` before creating them.
+"""
+import hashlib
+import os
+import tempfile
+from collections import OrderedDict
+
+import mujoco_py
+from mujoco_py import load_model_from_mjb, load_model_from_xml
+
+import robosuite.utils.macros as macros
+
+
+class MjModelCache:
+    """
+    LRU cache mapping a hash of an MJCF xml string to the binary (MJB) representation of its compiled MjModel.
+
+    Args:
+        max_size (int): Maximum number of compiled models to hold in memory. Least recently used models are evicted
+            first
+
+        cache_dir (None or str): If set, compiled models are additionally persisted to this directory as .mjb files,
+            so that they can be shared across processes and runs. Note that these files are not invalidated if any
+            mesh or texture file referenced by the xml changes on disk
+    """
+
+    def __init__(self, max_size=16, cache_dir=None):
+        assert max_size > 0, "Cache size must be positive!"
+        self.max_size = max_size
+        self.cache_dir = cache_dir
+        if self.cache_dir is not None:
+            os.makedirs(self.cache_dir, exist_ok=True)
+        self._cache = OrderedDict()
+
+        # Cache statistics
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def get_key(xml_string):
+        """
+        Computes the cache key for a given xml string. The MuJoCo version is included since MJB files are
+        version-specific.
+
+        Args:
+            xml_string (str): MJCF xml string
+
+        Returns:
+            str: Hex digest uniquely identifying @xml_string
+        """
+        version = getattr(mujoco_py, "__version__", "")
+        return hashlib.sha1((version + xml_string).encode("utf-8")).hexdigest()
+
+    def get_model(self, xml_string):
+        """
+        Returns a new MjModel compiled from @xml_string, re-using a cached compilation if one exists.
+
+        Args:
+            xml_string (str): MJCF xml string to compile
+
+        Returns:
+            MjModel: Newly instantiated model
+        """
+        key = self.get_key(xml_string)
+
+        # Check the in-memory cache first
+        mjb = self._cache.get(key, None)
+        if mjb is not None:
+            self._cache.move_to_end(key)
+            self.hits += 1
+            return load_model_from_mjb(mjb)
+
+        # Then check the on-disk cache
+        mjb = self._read_from_disk(key)
+        if mjb is not None:
+            self.disk_hits += 1
+            self._insert(key, mjb)
+            return load_model_from_mjb(mjb)
+
+        # Otherwise, we need to compile the model from scratch
+        self.misses += 1
+        model = load_model_from_xml(xml_string)
+        mjb = model.get_mjb()
+        self._insert(key, mjb)
+        self._write_to_disk(key, mjb)
+        return model
+
+    def clear(self):
+        """
+        Clears the in-memory cache and resets all statistics. Does not delete any on-disk files.
+        """
+        self._cache = OrderedDict()
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+
+    def _insert(self, key, mjb):
+        """
+        Inserts @mjb into the in-memory cache, evicting the least recently used entry if the cache is full
+
+        Args:
+            key (str): Cache key
+            mjb (bytes): Binary representation of the compiled model
+        """
+        self._cache[key] = mjb
+        self._cache.move_to_end(key)
+        while len(self._cache) > self.max_size:
+            self._cache.popitem(last=False)
+
+    def _read_from_disk(self, key):
+        """
+        Reads the compiled model corresponding to @key from the on-disk cache, if it exists
+
+        Args:
+            key (str): Cache key
+
+        Returns:
+            None or bytes: Binary representation of the compiled model, or None if not found
+        """
+        if self.cache_dir is None:
+            return None
+        fpath = os.path.join(self.cache_dir, "{}.mjb".format(key))
+        if not os.path.exists(fpath):
+            return None
+        with open(fpath, "rb") as f:
+            return f.read()
+
+    def _write_to_disk(self, key, mjb):
+        """
+        Writes a compiled model to the on-disk cache. The file is written atomically so that concurrent processes
+        never read a partially written file.
+
+        Args:
+            key (str): Cache key
+            mjb (bytes): Binary representation of the compiled model
+        """
+        if self.cache_dir is None:
+            return
+        fd, tmp_fpath = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+        with os.fdopen(fd, "wb") as f:
+            f.write(mjb)
+        os.replace(tmp_fpath, os.path.join(self.cache_dir, "{}.mjb".format(key)))
+
+    @property
+    def stats(self):
+        """
+        Returns:
+            dict: Cache hit / miss counters and current number of in-memory entries
+        """
+        return dict(hits=self.hits, disk_hits=self.disk_hits, misses=self.misses, size=len(self._cache))
+
+
+# Global cache shared by all environments in this process
+_MODEL_CACHE = None
+
+
+def get_model_cache():
+    """
+    Returns the process-wide MjModelCache, creating it from the macro settings on first use.
+
+    Returns:
+        MjModelCache: Global model cache
+    """
+    global _MODEL_CACHE
+    if _MODEL_CACHE is None:
+        _MODEL_CACHE = MjModelCache(
+            max_size=macros.COMPILED_MODEL_CACHE_SIZE,
+            cache_dir=macros.COMPILED_MODEL_CACHE_DIR,
+        )
+    return _MODEL_CACHE
+
+
+def load_model(xml_string):
+    """
+    Compiles @xml_string into a new MjModel, going through the global model cache if it is enabled.
+
+    Args:
+        xml_string (str): MJCF xml string to compile
+
+    Returns:
+        MjModel: Newly instantiated model
+    """
+    if macros.CACHE_COMPILED_MODELS:
+        return get_model_cache().get_model(xml_string)
+    return load_model_from_xml(xml_string)
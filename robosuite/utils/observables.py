@@ -1,7 +1,7 @@
 import numpy as np
 
 
-def sensor(modality):
+def sensor(modality, dependencies=None):
     """
     Decorator that should be added to any sensors that will be an observable.
 
@@ -12,6 +12,11 @@ def sensor(modality):
     Where @obs_cache is a dictionary mapping observable keys to pre-computed values, and @any is either a scalar
     or array. This function should also handle the case if obs_cache is either None or an empty dict.
 
+    Sensors that read other observables' values from @obs_cache must declare them in @dependencies. Environments
+    use these to update dependencies before the sensors that read them, and to only compute inactive observables
+    (e.g.: shared intermediate values) while some enabled observable depends on them. Inactive observables that no
+    sensor declares as a dependency are not computed, so undeclared reads fall back to their default value.
+
     An example use case is shown below:
 
         >>> @sensor(modality="proprio")
@@ -26,14 +31,16 @@ def sensor(modality):
 
     Args:
         modality (str): Modality for this sensor
+        dependencies (None or list of str): Names of the observables whose values this sensor reads from obs_cache
 
     Returns:
         function: decorator function
     """
     # Define standard decorator (with no args)
     def decorator(func):
-        # Add modality attribute
+        # Add modality and dependencies attributes
         func.__modality__ = modality
+        func.__dependencies__ = tuple(dependencies) if dependencies is not None else ()
         # Return function
         return func
 
@@ -179,6 +186,10 @@ class Observable:
             observed value is returned from self.obs, otherwise self.obs returns None.
     """
 
+    # Incremented whenever the sensor, enabled or active state of any observable changes, so that environments know
+    # to recompile the observables they update (see MujocoEnv._get_compiled_observables)
+    graph_version = 0
+
     def __init__(
         self,
         name,
@@ -295,6 +306,7 @@ class Observable:
             enabled (bool): True if this observable should be enabled
         """
         self._enabled = enabled
+        Observable.graph_version += 1
         # Reset values
         self.reset()
 
@@ -307,6 +319,7 @@ class Observable:
             active (bool): True if this observable should be active
         """
         self._active = active
+        Observable.graph_version += 1
 
     def set_sensor(self, sensor):
         """
@@ -320,6 +333,7 @@ class Observable:
         """
         self._sensor = sensor
         self._check_sensor_validity()
+        Observable.graph_version += 1
 
     def set_corrupter(self, corrupter):
         """
@@ -398,3 +412,13 @@ class Observable:
             str: Modality name for this observable
         """
         return self._sensor.__modality__
+
+    @property
+    def dependencies(self):
+        """
+        Names of the observables this sensor reads from the observation cache
+
+        Returns:
+            tuple: Observable names declared as dependencies by this observable's sensor
+        """
+        return getattr(self._sensor, "__dependencies__", ())
@@ -0,0 +1,170 @@
+"""
+Process-wide cache of post-processed MJCF element trees.
+
+Every MujocoXML instance parses its source file, inlines its default classes, and resolves its asset paths. Since the
+same robot / gripper / mount / arena / object files are loaded on every environment construction (and hard reset), we
+cache the resulting element tree per source file and hand out deep copies of it. The cache is keyed by the absolute
+path of the source file along with its modification time and size, so that edited files are always re-parsed.
+
+Trees can optionally also be pickled to disk (see macros.XML_TREE_CACHE_DIR), so that many processes loading the same
+assets (e.g.: VectorEnv workers) only parse each file once.
+"""
+import copy
+import hashlib
+import os
+import pickle
+import tempfile
+
+import robosuite.utils.macros as macros
+
+
+class XMLTreeCache:
+    """
+    Cache mapping MJCF source files to their post-processed root elements.
+
+    Args:
+        cache_dir (None or str): If set, trees are additionally pickled to this directory so that they can be shared
+            across processes and runs
+    """
+
+    def __init__(self, cache_dir=None):
+        self.cache_dir = cache_dir
+        if self.cache_dir is not None:
+            os.makedirs(self.cache_dir, exist_ok=True)
+        self._cache = {}
+
+        # Cache statistics
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def get_key(fname):
+        """
+        Computes the cache key for source file @fname.
+
+        Args:
+            fname (str): Path to the MJCF xml file
+
+        Returns:
+            3-tuple: (absolute path, modification time (ns), size (bytes)) of @fname
+        """
+        stat = os.stat(fname)
+        return os.path.abspath(fname), stat.st_mtime_ns, stat.st_size
+
+    def get(self, fname):
+        """
+        Grabs a copy of the cached tree for @fname, if it exists.
+
+        Args:
+            fname (str): Path to the MJCF xml file
+
+        Returns:
+            None or ET.Element: Deep copy of the cached root element, or None if @fname has not been cached
+        """
+        key = self.get_key(fname)
+        root = self._cache.get(key, None)
+        if root is not None:
+            self.hits += 1
+            return copy.deepcopy(root)
+
+        root = self._read_from_disk(key)
+        if root is not None:
+            self.disk_hits += 1
+            self._cache[key] = root
+            return copy.deepcopy(root)
+
+        self.misses += 1
+        return None
+
+    def put(self, fname, root):
+        """
+        Caches a copy of the post-processed tree for @fname. Any subsequent modification of @root does not affect the
+        cached tree.
+
+        Args:
+            fname (str): Path to the MJCF xml file that @root was loaded from
+            root (ET.Element): Post-processed root element
+        """
+        key = self.get_key(fname)
+        root = copy.deepcopy(root)
+        self._cache[key] = root
+        self._write_to_disk(key, root)
+
+    def clear(self):
+        """
+        Clears the in-memory cache and resets all statistics. Does not delete any on-disk files.
+        """
+        self._cache = {}
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+
+    def _get_fpath(self, key):
+        """
+        Args:
+            key (tuple): Cache key
+
+        Returns:
+            str: Path to the on-disk pickle corresponding to @key
+        """
+        return os.path.join(self.cache_dir, "{}.pkl".format(hashlib.sha1(repr(key).encode("utf-8")).hexdigest()))
+
+    def _read_from_disk(self, key):
+        """
+        Reads the tree corresponding to @key from the on-disk cache, if it exists
+
+        Args:
+            key (tuple): Cache key
+
+        Returns:
+            None or ET.Element: Cached root element, or None if not found
+        """
+        if self.cache_dir is None:
+            return None
+        fpath = self._get_fpath(key)
+        if not os.path.exists(fpath):
+            return None
+        with open(fpath, "rb") as f:
+            return pickle.load(f)
+
+    def _write_to_disk(self, key, root):
+        """
+        Pickles a tree to the on-disk cache. The file is written atomically so that concurrent processes never read a
+        partially written file.
+
+        Args:
+            key (tuple): Cache key
+            root (ET.Element): Root element to write
+        """
+        if self.cache_dir is None:
+            return
+        fd, tmp_fpath = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+        with os.fdopen(fd, "wb") as f:
+            pickle.dump(root, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_fpath, self._get_fpath(key))
+
+    @property
+    def stats(self):
+        """
+        Returns:
+            dict: Cache hit / miss counters and current number of in-memory entries
+        """
+        return dict(hits=self.hits, disk_hits=self.disk_hits, misses=self.misses, size=len(self._cache))
+
+
+# Global cache shared by all models in this process
+_XML_TREE_CACHE = None
+
+
+def get_xml_tree_cache():
+    """
+    Returns the process-wide XMLTreeCache, creating it from the macro settings on first use.
+
+    Returns:
+        XMLTreeCache: Global xml tree cache
+    """
+    global _XML_TREE_CACHE
+    if _XML_TREE_CACHE is None:
+        _XML_TREE_CACHE = XMLTreeCache(cache_dir=macros.XML_TREE_CACHE_DIR)
+    return _XML_TREE_CACHE
@@ -0,0 +1,2 @@
+from .shared_memory import SharedObservationBuffer
+from .vector_env import VectorEnv, make_vector
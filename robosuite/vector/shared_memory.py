@@ -0,0 +1,112 @@
+"""
+Shared-memory transport for passing observations from VectorEnv worker processes to the parent process without
+pickling them.
+"""
+from collections import OrderedDict
+from multiprocessing import resource_tracker, shared_memory
+
+import numpy as np
+
+
+class SharedObservationBuffer:
+    """
+    Preallocates one shared-memory block per observable, each holding that observable for all N environments.
+    Workers write their environments' observations in place, and the parent reads them through zero-copy numpy views.
+
+    Buffers should be created in the parent process via the constructor and attached to in workers via attach().
+
+    Args:
+        observation_spec (OrderedDict): Observations from a single environment, used to determine the shape and dtype
+            of each observable (e.g.: the output of MujocoEnv.observation_spec())
+        num_envs (int): Number of environments that will write into this buffer
+    """
+
+    def __init__(self, observation_spec, num_envs):
+        self.num_envs = num_envs
+        self._owner = True
+        self._shms = OrderedDict()
+        self._arrays = OrderedDict()
+        for name, value in observation_spec.items():
+            value = np.asarray(value)
+            shape = (num_envs,) + value.shape
+            # SharedMemory does not allow zero-sized blocks
+            shm = shared_memory.SharedMemory(create=True, size=max(1, int(np.prod(shape)) * value.dtype.itemsize))
+            self._shms[name] = shm
+            self._arrays[name] = np.ndarray(shape, dtype=value.dtype, buffer=shm.buf)
+
+    @classmethod
+    def attach(cls, descriptor):
+        """
+        Attaches to a buffer that was previously created in another process.
+
+        Args:
+            descriptor (dict): The @descriptor of the buffer created in the owning process
+
+        Returns:
+            SharedObservationBuffer: Buffer backed by the same shared memory as the owning process
+        """
+        buf = cls.__new__(cls)
+        buf.num_envs = descriptor["num_envs"]
+        buf._owner = False
+        buf._shms = OrderedDict()
+        buf._arrays = OrderedDict()
+        for name, (shm_name, shape, dtype) in descriptor["observables"].items():
+            shm = shared_memory.SharedMemory(name=shm_name)
+            # Only the owning process should ever unlink the block, so stop this process's resource tracker from
+            # claiming it as well (otherwise it gets unlinked as soon as any worker exits)
+            try:
+                resource_tracker.unregister(shm._name, "shared_memory")
+            except Exception:
+                pass
+            buf._shms[name] = shm
+            buf._arrays[name] = np.ndarray(shape, dtype=dtype, buffer=shm.buf)
+        return buf
+
+    def write(self, index, observations):
+        """
+        Copies a single environment's observations into this buffer in place.
+
+        Args:
+            index (int): Global index of the environment being written
+            observations (OrderedDict): Observations from that environment
+        """
+        for name, array in self._arrays.items():
+            array[index] = observations[name]
+
+    def close(self):
+        """
+        Releases this process's handles to the shared memory. The owning process also frees the memory.
+        """
+        # Views must be dropped before the underlying buffers can be released
+        self._arrays = OrderedDict()
+        for shm in self._shms.values():
+            shm.close()
+            if self._owner:
+                shm.unlink()
+        self._shms = OrderedDict()
+
+    @property
+    def descriptor(self):
+        """
+        Picklable description of this buffer that can be sent to other processes and passed to attach()
+
+        Returns:
+            dict: Number of environments and observable names mapped to (shared memory name, shape, dtype)
+        """
+        return dict(
+            num_envs=self.num_envs,
+            observables=OrderedDict(
+                (name, (self._shms[name].name, array.shape, array.dtype.str)) for name, array in self._arrays.items()
+            ),
+        )
+
+    @property
+    def views(self):
+        """
+        Zero-copy views into the shared observations. Note that these are overwritten in place by subsequent writes,
+        so they should be copied if they need to persist.
+
+        Returns:
+            OrderedDict: Observation names mapped to arrays of shape (N, ...)
+        """
+        return self._arrays
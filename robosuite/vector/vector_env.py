@@ -0,0 +1,384 @@
+"""
+Vectorized environment runner that shards multiple robosuite environments across worker processes.
+
+Each worker process owns a contiguous shard of environments and steps them serially, so N environments can be
+distributed over W <= N processes. All batched quantities (actions, rewards, dones, observations) are ordered by
+global environment index.
+"""
+import multiprocessing as mp
+from collections import OrderedDict
+from functools import partial
+
+import numpy as np
+
+from robosuite.vector.shared_memory import SharedObservationBuffer
+
+
+def _stack_observations(obs_list):
+    """
+    Stacks a list of per-environment observation dicts into a single dict of batched arrays
+
+    Args:
+        obs_list (list of OrderedDict): Observations, one per environment, each keyed like MujocoEnv._get_observations()
+
+    Returns:
+        OrderedDict: Observation names mapped to arrays of shape (N, ...)
+    """
+    return OrderedDict((k, np.stack([np.asarray(obs[k]) for obs in obs_list])) for k in obs_list[0].keys())
+
+
+def _worker(remote, parent_remote, env_fns, seed, auto_reset):
+    """
+    Main loop run inside each worker process. Instantiates its shard of environments and then services commands
+    sent from the parent VectorEnv until "close" is received.
+
+    Args:
+        remote (Connection): Worker end of the pipe
+        parent_remote (Connection): Parent end of the pipe (closed immediately in the worker)
+        env_fns (list of function): Functions that each create a single environment when called
+        seed (int): Seed for this worker's global numpy RNG, which robosuite uses for all randomization
+        auto_reset (bool): Whether to automatically reset environments whose episode has terminated
+    """
+    parent_remote.close()
+    np.random.seed(seed)
+    envs = [env_fn() for env_fn in env_fns]
+    last_obs = [env.reset() for env in envs]
+    # If set, observations are written into shared memory at @obs_offset + local env index instead of being sent
+    obs_buffer = None
+    obs_offset = 0
+    try:
+        while True:
+            cmd, data = remote.recv()
+            if cmd == "step":
+                results = []
+                for i, (env, action) in enumerate(zip(envs, data)):
+                    obs, reward, done, info = env.step(action)
+                    if done and auto_reset:
+                        # Keep the final observation of the finished episode before it is overwritten
+                        info["terminal_observation"] = obs
+                        obs = env.reset()
+                    last_obs[i] = obs
+                    if obs_buffer is not None:
+                        obs_buffer.write(obs_offset + i, obs)
+                        obs = None
+                    results.append((obs, reward, done, info))
+                remote.send(results)
+            elif cmd == "reset":
+                for i, (env, reset) in enumerate(zip(envs, data)):
+                    if reset:
+                        last_obs[i] = env.reset()
+                        if obs_buffer is not None:
+                            obs_buffer.write(obs_offset + i, last_obs[i])
+                remote.send(list(last_obs) if obs_buffer is None else None)
+            elif cmd == "attach":
+                descriptor, obs_offset = data
+                obs_buffer = SharedObservationBuffer.attach(descriptor)
+                for i, obs in enumerate(last_obs):
+                    obs_buffer.write(obs_offset + i, obs)
+                remote.send(None)
+            elif cmd == "call":
+                name, args, kwargs = data
+                remote.send([getattr(env, name)(*args, **kwargs) for env in envs])
+            elif cmd == "get_attr":
+                remote.send([getattr(env, data) for env in envs])
+            elif cmd == "spec":
+                remote.send(
+                    dict(
+                        action_spec=envs[0].action_spec,
+                        action_dim=envs[0].action_dim,
+                        observation_spec=last_obs[0],
+                    )
+                )
+            elif cmd == "close":
+                break
+            else:
+                raise ValueError("Unknown VectorEnv worker command: {}".format(cmd))
+    except KeyboardInterrupt:
+        pass
+    finally:
+        if obs_buffer is not None:
+            obs_buffer.close()
+        for env in envs:
+            env.close()
+        remote.close()
+
+
+class VectorEnv:
+    """
+    Runs N robosuite environments in parallel by sharding them across worker processes.
+
+    Environments whose episode terminates during step() are automatically reset (if @auto_reset is set), in which case
+    the returned observation for that environment is the first observation of the new episode, and the final
+    observation of the finished episode is stored in that environment's info dict under "terminal_observation".
+
+    Args:
+        env_fns (list of function): Functions that each create a single environment when called. Must be picklable
+            if a "spawn" or "forkserver" start method is used (e.g.: functools.partial(robosuite.make, ...))
+
+        num_workers (None or int): Number of worker processes to shard the environments across. If None, uses one
+            process per environment, capped at the number of available cpus
+
+        auto_reset (bool): If True, automatically resets any environment whose episode has terminated during step()
+
+        start_method (None or str): Multiprocessing start method to use. If None, uses the platform default. Note
+            that "fork" should not be used if an OpenGL context has already been created in the parent process
+
+        seed (None or int): Base seed used to seed each worker's numpy RNG. If None, seeds are drawn from fresh
+            entropy so that workers never produce identical rollouts
+
+        shared_memory (bool): If True, observations are transported through preallocated shared memory (one block per
+            observable, sized from the first environment's observation_spec()) instead of being pickled. Returned
+            observations are then zero-copy views that are overwritten in place by the next step() / reset() call,
+            so they should be copied if they need to persist
+
+    Raises:
+        ValueError: [Invalid number of workers]
+    """
+
+    def __init__(
+        self,
+        env_fns,
+        num_workers=None,
+        auto_reset=True,
+        start_method=None,
+        seed=None,
+        shared_memory=False,
+    ):
+        self.num_envs = len(env_fns)
+        if num_workers is None:
+            num_workers = min(self.num_envs, mp.cpu_count())
+        if not 0 < num_workers <= self.num_envs:
+            raise ValueError(
+                "Number of workers must be between 1 and the number of environments ({}), got {}".format(
+                    self.num_envs, num_workers
+                )
+            )
+        self.num_workers = num_workers
+        self.auto_reset = auto_reset
+        self.closed = False
+        self.waiting = False
+
+        # Split environments into contiguous shards, one per worker
+        self._shards = [shard.tolist() for shard in np.array_split(np.arange(self.num_envs), self.num_workers)]
+
+        # Draw a distinct seed for each worker
+        seeds = np.random.SeedSequence(seed).generate_state(self.num_workers)
+
+        ctx = mp.get_context(start_method)
+        self.remotes, self.work_remotes = zip(*[ctx.Pipe() for _ in range(self.num_workers)])
+        self.processes = []
+        for work_remote, remote, shard, worker_seed in zip(self.work_remotes, self.remotes, self._shards, seeds):
+            args = (work_remote, remote, [env_fns[i] for i in shard], int(worker_seed), self.auto_reset)
+            process = ctx.Process(target=_worker, args=args, daemon=True)
+            process.start()
+            self.processes.append(process)
+            work_remote.close()
+
+        # Grab specs from the first environment
+        self.remotes[0].send(("spec", None))
+        spec = self.remotes[0].recv()
+        self._action_spec = spec["action_spec"]
+        self._action_dim = spec["action_dim"]
+        self._observation_spec = spec["observation_spec"]
+
+        # Optionally setup shared memory for transporting observations
+        self._obs_buffer = None
+        if shared_memory:
+            self._obs_buffer = SharedObservationBuffer(self._observation_spec, self.num_envs)
+            for remote, shard in zip(self.remotes, self._shards):
+                remote.send(("attach", (self._obs_buffer.descriptor, shard[0])))
+            for remote in self.remotes:
+                remote.recv()
+
+    def step_async(self, actions):
+        """
+        Sends a batch of actions to the workers without waiting for the results. Must be followed by step_wait().
+
+        Args:
+            actions (np.array): (N, action_dim) array of actions, one row per environment
+
+        Raises:
+            AssertionError: [Invalid action shape]
+        """
+        actions = np.asarray(actions)
+        assert actions.shape == (self.num_envs, self.action_dim), "Expected actions of shape {}, got {}".format(
+            (self.num_envs, self.action_dim), actions.shape
+        )
+        for remote, shard in zip(self.remotes, self._shards):
+            remote.send(("step", actions[shard[0] : shard[-1] + 1]))
+        self.waiting = True
+
+    def step_wait(self):
+        """
+        Waits for the results of the most recent step_async() call.
+
+        Returns:
+            4-tuple:
+
+                - (OrderedDict) stacked observations, each of shape (N, ...)
+                - (np.array) (N,) rewards
+                - (np.array) (N,) done flags
+                - (list of dict) misc information, one per environment
+        """
+        results = [result for remote in self.remotes for result in remote.recv()]
+        self.waiting = False
+        obs, rewards, dones, infos = zip(*results)
+        obs = self._obs_buffer.views if self._obs_buffer is not None else _stack_observations(obs)
+        return obs, np.array(rewards, dtype=np.float64), np.array(dones, dtype=bool), list(infos)
+
+    def step(self, actions):
+        """
+        Takes a step in all environments with the batch of actions @actions.
+
+        Args:
+            actions (np.array): (N, action_dim) array of actions, one row per environment
+
+        Returns:
+            4-tuple: See step_wait()
+        """
+        self.step_async(actions)
+        return self.step_wait()
+
+    def reset(self, mask=None):
+        """
+        Resets environments.
+
+        Args:
+            mask (None or Iterable of bool): (N,) flags specifying which environments to reset. If None, resets all
+                environments. Environments that are not reset return their most recent observation.
+
+        Returns:
+            OrderedDict: Stacked observations, each of shape (N, ...)
+        """
+        mask = np.ones(self.num_envs, dtype=bool) if mask is None else np.asarray(mask, dtype=bool)
+        assert mask.shape == (self.num_envs,), "Expected reset mask of shape {}, got {}".format(
+            (self.num_envs,), mask.shape
+        )
+        for remote, shard in zip(self.remotes, self._shards):
+            remote.send(("reset", mask[shard[0] : shard[-1] + 1]))
+        results = [remote.recv() for remote in self.remotes]
+        if self._obs_buffer is not None:
+            return self._obs_buffer.views
+        return _stack_observations([obs for result in results for obs in result])
+
+    def env_method(self, name, *args, **kwargs):
+        """
+        Calls method @name with the given arguments on every environment.
+
+        Args:
+            name (str): Name of the environment method to call
+            *args: Positional arguments to pass to the method
+            **kwargs: Keyword arguments to pass to the method
+
+        Returns:
+            list: Return values, one per environment
+        """
+        for remote in self.remotes:
+            remote.send(("call", (name, args, kwargs)))
+        return [ret for remote in self.remotes for ret in remote.recv()]
+
+    def get_attr(self, name):
+        """
+        Grabs attribute @name from every environment.
+
+        Args:
+            name (str): Name of the environment attribute
+
+        Returns:
+            list: Attribute values, one per environment
+        """
+        for remote in self.remotes:
+            remote.send(("get_attr", name))
+        return [ret for remote in self.remotes for ret in remote.recv()]
+
+    def observation_spec(self):
+        """
+        Returns an (unbatched) observation from the first environment as observation specification.
+
+        Returns:
+            OrderedDict: Observations from a single environment
+        """
+        return self._observation_spec
+
+    def close(self):
+        """
+        Shuts down all worker processes
+        """
+        if self.closed:
+            return
+        if self.waiting:
+            for remote in self.remotes:
+                remote.recv()
+        for remote in self.remotes:
+            remote.send(("close", None))
+        for process in self.processes:
+            process.join()
+        if self._obs_buffer is not None:
+            self._obs_buffer.close()
+        self.closed = True
+
+    def __del__(self):
+        if not getattr(self, "closed", True):
+            self.close()
+
+    @property
+    def action_spec(self):
+        """
+        Action space (low, high) for a single environment
+
+        Returns:
+            2-tuple:
+
+                - (np.array) minimum (low) action values
+                - (np.array) maximum (high) action values
+        """
+        return self._action_spec
+
+    @property
+    def action_dim(self):
+        """
+        Size of the action space of a single environment
+
+        Returns:
+            int: Action space dimension
+        """
+        return self._action_dim
+
+
+def make_vector(
+    env_name,
+    num_envs,
+    num_workers=None,
+    auto_reset=True,
+    start_method=None,
+    seed=None,
+    shared_memory=False,
+    **kwargs,
+):
+    """
+    Instantiates a VectorEnv of @num_envs identical robosuite environments. Mirrors robosuite.make.
+
+    Args:
+        env_name (str): Name of the robosuite environment to initialize
+        num_envs (int): Number of environments to create
+        num_workers (None or int): Number of worker processes to shard the environments across
+        auto_reset (bool): If True, automatically resets any environment whose episode has terminated
+        start_method (None or str): Multiprocessing start method to use
+        seed (None or int): Base seed used to seed each worker's numpy RNG
+        shared_memory (bool): If True, transports observations through shared memory instead of pickling them
+        **kwargs: Additional arguments to pass to the specific environment class initializer
+
+    Returns:
+        VectorEnv: Vectorized environment
+    """
+    from robosuite.environments.base import make
+
+    env_fn = partial(make, env_name, **kwargs)
+    return VectorEnv(
+        env_fns=[env_fn] * num_envs,
+        num_workers=num_workers,
+        auto_reset=auto_reset,
+        start_method=start_method,
+        seed=seed,
+        shared_memory=shared_memory,
+    )
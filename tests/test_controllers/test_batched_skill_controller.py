@@ -0,0 +1,122 @@
+"""
+Test that BatchedSkillController matches sequential SkillController execution.
+
+This runs the same skills with the same parameters from the same initial states, once through N independent
+SkillController.execute() calls and once through a single BatchedSkillController.execute() call, and checks that
+for every skill type (both in uniform and in mixed batches):
+    - the executed actions and visited sim states match
+    - the final skill states, number of action calls, success and interaction flags match
+    - the final observations match
+"""
+import numpy as np
+
+import robosuite
+from robosuite import load_controller_config
+from robosuite.controllers.batched_skill_controller import BatchedSkillController
+from robosuite.controllers.skill_controller import SkillController
+
+NUM_ENVS = 3
+PRIMITIVE_SET = ["atomic", "reach", "grasp", "place", "push", "gripper_release"]
+
+
+class _SkillEnv:
+    """
+    Minimal wrapper exposing the interface that skills expect from their environment (as provided by e.g.: robomimic's
+    EnvRobosuite): the wrapped robosuite environment as @env, and get_observation(), get_state(), and step()
+    """
+
+    def __init__(self, env):
+        self.env = env
+
+    def get_observation(self):
+        return self.env._get_observations(force_update=True)
+
+    def get_state(self):
+        return dict(states=np.array(self.env.sim.get_state().flatten()))
+
+    def step(self, action):
+        return self.env.step(action)
+
+
+def _make_skill_controllers():
+    controllers = []
+    for _ in range(NUM_ENVS):
+        env = robosuite.make(
+            "CleanUpMediumSmallInitD",
+            robots="Panda",
+            controller_configs=load_controller_config(default_controller="OSC_POSE"),
+            has_renderer=False,
+            has_offscreen_renderer=False,
+            use_camera_obs=False,
+            hard_reset=False,
+            ignore_done=True,
+        )
+        controllers.append(
+            SkillController(_SkillEnv(env), primitive_set=PRIMITIVE_SET, controller_type="OSC_POSE", output_mode="max")
+        )
+    return controllers
+
+
+def _reset(controllers, seed):
+    for i, controller in enumerate(controllers):
+        np.random.seed(seed + i)
+        controller._env.env.reset()
+
+
+def _run(controllers, p_names, skill_args, seed, batched):
+    _reset(controllers, seed)
+    if batched:
+        rets = BatchedSkillController(controllers).execute(p_names, skill_args, norm=True)
+    else:
+        rets = [
+            controller.execute(p_name, args, norm=True)
+            for controller, p_name, args in zip(controllers, p_names, skill_args)
+        ]
+    skill_states = [controller.get_skill(p_name)._state for controller, p_name in zip(controllers, p_names)]
+    return rets, skill_states
+
+
+def _assert_same_results(sequential, batched):
+    for (seq, seq_state), (bat, bat_state) in zip(zip(*sequential), zip(*batched)):
+        assert seq_state == bat_state
+        seq_info, bat_info = seq["info"], bat["info"]
+        for key in (
+            "num_ac_calls",
+            "skill_success",
+            "env_success",
+            "env_done",
+            "interest_interaction",
+            "done_interaction",
+        ):
+            assert seq_info[key] == bat_info[key], key
+        for key in ("action_list", "state_list"):
+            assert len(seq_info[key]) == len(bat_info[key]), key
+            np.testing.assert_allclose(np.array(seq_info[key]), np.array(bat_info[key]), rtol=0, atol=1e-8)
+        for key, value in seq["obs"].items():
+            np.testing.assert_allclose(value, bat["obs"][key], rtol=0, atol=1e-8)
+
+
+def test_batched_skill_controller():
+    controllers = _make_skill_controllers()
+    batches = [[p_name] * NUM_ENVS for p_name in ("reach", "grasp", "place", "push")]
+    batches += [["reach", "atomic", "gripper_release"], ["grasp", "place", "push"]]
+    for seed, p_names in enumerate(batches):
+        rng = np.random.RandomState(seed)
+        skill_args = [
+            rng.uniform(-1, 1, controller.get_skill(p_name).get_param_dim())
+            for controller, p_name in zip(controllers, p_names)
+        ]
+        sequential = _run(controllers, p_names, skill_args, seed=10 * seed, batched=False)
+        batched = _run(controllers, p_names, skill_args, seed=10 * seed, batched=True)
+        _assert_same_results(sequential, batched)
+
+    for controller in controllers:
+        controller._env.env.close()
+
+    # Tests passed!
+    print("Batched skill controller tests passed successfully!")
+
+
+if __name__ == "__main__":
+
+    test_batched_skill_controller()
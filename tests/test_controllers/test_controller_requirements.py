@@ -0,0 +1,58 @@
+"""
+Test that controllers only compute the robot state quantities they declare in their requirements.
+
+This runs some basic sanity checks, namely, checking that:
+    - joint-space controllers skip the eef state, jacobian and (where unused) mass matrix computations
+    - the quantities they do require are updated at every step, and match the sim state
+    - the eef histories of the robot are still tracked when the controller doesn't track the eef state
+"""
+import numpy as np
+
+import robosuite
+from robosuite import load_controller_config
+
+
+def test_controller_requirements():
+    np.random.seed(0)
+    expected = {
+        "JOINT_POSITION": {"joint_state", "mass_matrix"},
+        "JOINT_VELOCITY": {"joint_state"},
+        "JOINT_TORQUE": {"joint_state"},
+        "OSC_POSE": {"ee_state", "joint_state", "jacobian", "mass_matrix"},
+    }
+    attrs = {
+        "ee_state": ("ee_pos", "ee_ori_mat", "ee_pos_vel", "ee_ori_vel"),
+        "joint_state": ("joint_pos", "joint_vel"),
+        "jacobian": ("J_pos", "J_ori", "J_full"),
+        "mass_matrix": ("mass_matrix",),
+    }
+    for controller_name, requirements in expected.items():
+        env = robosuite.make(
+            "Lift",
+            robots="Panda",
+            controller_configs=load_controller_config(default_controller=controller_name),
+            has_renderer=False,
+            has_offscreen_renderer=False,
+            use_camera_obs=False,
+        )
+        env.reset()
+        robot = env.robots[0]
+        controller = robot.controller
+        assert controller.requirements == requirements
+        ee_pose = robot.recent_ee_pose
+
+        env.step(np.random.uniform(*env.action_spec) * 0.1)
+        for requirement, names in attrs.items():
+            for name in names:
+                assert (getattr(controller, name) is not None) == (requirement in requirements), name
+        assert np.allclose(controller.joint_pos, env.sim.data.qpos[robot._ref_joint_pos_indexes])
+        assert np.allclose(ee_pose.current[:3], env.sim.data.site_xpos[robot.eef_site_id], atol=1e-2)
+        env.close()
+
+    # Tests passed!
+    print("Controller requirements tests passed successfully!")
+
+
+if __name__ == "__main__":
+
+    test_controller_requirements()
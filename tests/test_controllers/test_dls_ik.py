@@ -0,0 +1,105 @@
+"""
+Test the native damped least squares IK solver used by the IK controller.
+
+This runs some basic sanity checks on a planar 3-link arm, namely, checking that:
+    - repeatedly re-linearizing and warm-starting @damped_least_squares_ik converges to a nearby reachable target
+    - solutions always respect the joint limits
+    - DampedLeastSquaresIKSolver warm-starts each solve from the measured joint positions plus the previous solution's
+        offset while that offset is small, and cold-starts from the measured joint positions otherwise
+"""
+import numpy as np
+
+from robosuite.utils.control_utils import DampedLeastSquaresIKSolver, damped_least_squares_ik
+
+LINK_LENGTHS = np.array([0.4, 0.3, 0.2])
+
+
+def forward_kinematics(joint_pos):
+    angles = np.cumsum(joint_pos)
+    return np.array([np.sum(LINK_LENGTHS * np.cos(angles)), np.sum(LINK_LENGTHS * np.sin(angles))])
+
+
+def jacobian(joint_pos):
+    angles = np.cumsum(joint_pos)
+    J = np.zeros((2, 3))
+    for i in range(3):
+        J[0, i] = -np.sum(LINK_LENGTHS[i:] * np.sin(angles[i:]))
+        J[1, i] = np.sum(LINK_LENGTHS[i:] * np.cos(angles[i:]))
+    return J
+
+
+def test_dls_ik():
+    np.random.seed(0)
+    joint_lower = -np.ones(3) * 2.5
+    joint_upper = np.ones(3) * 2.5
+    for _ in range(20):
+        joint_pos = np.random.uniform(-1.5, 1.5, 3)
+        target = forward_kinematics(joint_pos + np.random.uniform(-0.3, 0.3, 3))
+        solution = None
+        for _ in range(50):
+            initial_guess = joint_pos if solution is None else solution
+            solution = damped_least_squares_ik(
+                jacobian(joint_pos),
+                target - forward_kinematics(joint_pos),
+                joint_pos,
+                initial_guess,
+                joint_lower,
+                joint_upper,
+                0.01,
+                5,
+            )
+            assert np.all(solution >= joint_lower) and np.all(solution <= joint_upper)
+            # Move fully to the solution before re-linearizing
+            joint_pos = solution
+        assert np.linalg.norm(forward_kinematics(joint_pos) - target) < 1e-4
+
+
+def test_dls_ik_solver():
+    joint_lower = -np.ones(3) * 2.5
+    joint_upper = np.ones(3) * 2.5
+    solver = DampedLeastSquaresIKSolver(joint_lower, joint_upper, 0.01, 1, warm_start_tol=0.1)
+    joint_pos = np.array([0.3, -0.4, 0.5])
+
+    def expected(initial_guess, target):
+        return damped_least_squares_ik(
+            jacobian(joint_pos),
+            target - forward_kinematics(joint_pos),
+            joint_pos,
+            initial_guess,
+            joint_lower,
+            joint_upper,
+            0.01,
+            1,
+        )
+
+    # The first solve is a cold start from the measured joint positions
+    target = forward_kinematics(joint_pos + 0.02)
+    solution = solver.solve(jacobian(joint_pos), target - forward_kinematics(joint_pos), joint_pos)
+    np.testing.assert_array_equal(solution, expected(joint_pos, target))
+    np.testing.assert_array_equal(solver.offset, solution - joint_pos)
+
+    # A small offset warm-starts the next solve, relative to the (new) measured joint positions
+    offset = solver.offset
+    joint_pos = joint_pos + 0.01
+    solution = solver.solve(jacobian(joint_pos), target - forward_kinematics(joint_pos), joint_pos)
+    np.testing.assert_array_equal(solution, expected(joint_pos + offset, target))
+
+    # A large offset is dropped in favor of a cold start
+    target = forward_kinematics(joint_pos + 0.5)
+    solver.solve(jacobian(joint_pos), target - forward_kinematics(joint_pos), joint_pos)
+    assert np.max(np.abs(solver.offset)) > 0.1
+    solution = solver.solve(jacobian(joint_pos), target - forward_kinematics(joint_pos), joint_pos)
+    np.testing.assert_array_equal(solution, expected(joint_pos, target))
+
+    # Resetting the solver drops its warm-start state
+    solver.reset()
+    assert solver.offset is None
+
+
+if __name__ == "__main__":
+
+    test_dls_ik()
+    test_dls_ik_solver()
+
+    # Tests passed!
+    print("DLS IK tests passed successfully!")
@@ -0,0 +1,67 @@
+"""
+Test the sparse mass matrix extraction used by all controllers.
+
+This checks that the mass matrix block extracted by each controller's MassMatrixProvider matches the corresponding
+block of the fully expanded mass matrix, both for a single-arm robot in a scene with many free objects and for
+a bimanual robot whose arms share a single provider. For the latter, it also checks that the shared provider is only
+updated once per simulation substep.
+"""
+import mujoco_py
+import numpy as np
+
+import robosuite
+
+
+def full_mass_matrix(sim):
+    nv = sim.model.nv
+    mass_matrix = np.ndarray(shape=(nv**2,), dtype=np.float64, order="C")
+    mujoco_py.cymj._mj_fullM(sim.model, mass_matrix, sim.data.qM)
+    return mass_matrix.reshape((nv, nv))
+
+
+def test_mass_matrix():
+    for env_name, robots in (("PickPlace", "Panda"), ("TwoArmLift", "Baxter")):
+        env = robosuite.make(
+            env_name,
+            robots=robots,
+            has_renderer=False,
+            has_offscreen_renderer=False,
+            use_camera_obs=False,
+        )
+        env.reset()
+        robot = env.robots[0]
+        controllers = list(robot.controller.values()) if isinstance(robot.controller, dict) else [robot.controller]
+        if len(controllers) > 1:
+            assert controllers[0].mass_matrix_provider is controllers[1].mass_matrix_provider
+
+        # Count the updates of every (distinct) provider
+        providers = {id(controller.mass_matrix_provider): controller.mass_matrix_provider for controller in controllers}
+        num_updates = [0]
+        for provider in providers.values():
+            provider_update = provider.update
+
+            def counted_update(provider_update=provider_update):
+                num_updates[0] += 1
+                return provider_update()
+
+            provider.update = counted_update
+
+        num_substeps = int(env.control_timestep / env.model_timestep)
+        for _ in range(5):
+            num_updates[0] = 0
+            env.step(np.random.uniform(*env.action_spec))
+            assert num_updates[0] == num_substeps * len(providers)
+            for controller in controllers:
+                controller.update(force=True)
+                expected = full_mass_matrix(env.sim)[controller.qvel_index, :][:, controller.qvel_index]
+                assert np.allclose(controller.mass_matrix, expected)
+
+        env.close()
+
+    # Tests passed!
+    print("Mass matrix tests passed successfully!")
+
+
+if __name__ == "__main__":
+
+    test_mass_matrix()
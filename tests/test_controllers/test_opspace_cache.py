@@ -0,0 +1,57 @@
+"""
+Test the OSC opspace matrices cache.
+
+This runs some basic sanity checks, namely, checking that:
+    - with a zero tolerance, cached matrices are only re-used for identical configurations, so the resulting torques
+        match those of the uncached controller
+    - with a loose tolerance, the matrices are re-used across controller updates, and the hit rate reflects this
+"""
+import numpy as np
+
+import robosuite
+from robosuite import load_controller_config
+
+
+def _rollout(opspace_cache_tol, num_steps=10):
+    controller_config = load_controller_config(default_controller="OSC_POSE")
+    controller_config["opspace_cache_tol"] = opspace_cache_tol
+    env = robosuite.make(
+        "Lift",
+        robots="Panda",
+        controller_configs=controller_config,
+        has_renderer=False,
+        has_offscreen_renderer=False,
+        use_camera_obs=False,
+    )
+    np.random.seed(0)
+    env.reset()
+    torques = []
+    for _ in range(num_steps):
+        env.step(np.random.uniform(*env.action_spec))
+        torques.append(np.array(env.robots[0].torques))
+    controller = env.robots[0].controller
+    env.close()
+    return np.array(torques), controller
+
+
+def test_opspace_cache():
+    reference_torques, controller = _rollout(None)
+    assert controller.opspace_cache_queries == 0
+    assert controller.opspace_cache_hit_rate == 0.0
+
+    torques, controller = _rollout(0.0)
+    assert np.allclose(torques, reference_torques, atol=1e-6)
+    assert controller.opspace_cache_queries > 0
+
+    _, controller = _rollout(1e-2)
+    assert controller.opspace_cache_hits > 0
+    assert 0.0 < controller.opspace_cache_hit_rate <= 1.0
+    assert controller.opspace_cache_hit_rate == controller.opspace_cache_hits / controller.opspace_cache_queries
+
+    # Tests passed!
+    print("Opspace cache tests passed successfully!")
+
+
+if __name__ == "__main__":
+
+    test_opspace_cache()
@@ -0,0 +1,118 @@
+"""
+Test the batched evaluation of OSC controllers.
+
+This runs some basic sanity checks, namely, checking that:
+    - OperationalSpaceController.run_batch() computes the same torques as calling run_controller() on each controller,
+        on two identical sets of environments stepped through the same goals, for controllers with a pose
+        interpolator, with separate position / orientation interpolators, and with coupled position / orientation
+        control (i.e.: covering both the interpolator and uncoupling paths)
+    - run_batch() rejects controllers whose settings it cannot honor (unfused kernel, opspace matrix caching, update
+        period larger than 1)
+"""
+import numpy as np
+
+import robosuite
+from robosuite import load_controller_config
+from robosuite.controllers.osc import OperationalSpaceController
+
+NUM_POLICY_STEPS = 5
+NUM_SUBSTEPS = 10
+
+
+def _controller_configs():
+    # OSC_POSE with a pose interpolator, uncoupled
+    pose_interpolated = load_controller_config(default_controller="OSC_POSE")
+    pose_interpolated["interpolation"] = "linear"
+
+    # OSC_POSITION with a position / orientation interpolator, uncoupled
+    position_interpolated = load_controller_config(default_controller="OSC_POSITION")
+    position_interpolated["interpolation"] = "linear"
+
+    # OSC_POSE without interpolation, coupled
+    pose_coupled = load_controller_config(default_controller="OSC_POSE")
+    pose_coupled["uncouple_pos_ori"] = False
+
+    return [pose_interpolated, position_interpolated, pose_coupled]
+
+
+def _make_envs(controller_configs):
+    envs = []
+    for i, controller_config in enumerate(controller_configs):
+        env = robosuite.make(
+            "Lift",
+            robots="Panda",
+            controller_configs=controller_config,
+            has_renderer=False,
+            has_offscreen_renderer=False,
+            use_camera_obs=False,
+            ignore_done=True,
+        )
+        np.random.seed(i)
+        env.reset()
+        envs.append(env)
+    return envs
+
+
+def test_osc_batch():
+    configs = _controller_configs()
+    sequential_envs, batched_envs = _make_envs(configs), _make_envs(configs)
+    sequential = [env.robots[0].controller for env in sequential_envs]
+    batched = [env.robots[0].controller for env in batched_envs]
+    assert sequential[0].interpolator_pose is not None
+    assert sequential[1].interpolator_pos is not None and sequential[1].interpolator_ori is not None
+    assert not sequential[2].uncoupling
+
+    rng = np.random.RandomState(0)
+    for _ in range(NUM_POLICY_STEPS):
+        for seq, bat in zip(sequential, batched):
+            action = rng.uniform(-1, 1, seq.control_dim)
+            seq.set_goal(action)
+            bat.set_goal(action)
+
+        for _ in range(NUM_SUBSTEPS):
+            seq_torques = np.stack([controller.run_controller() for controller in sequential])
+            bat_torques = OperationalSpaceController.run_batch(batched)
+            np.testing.assert_allclose(bat_torques, seq_torques, rtol=1e-7, atol=1e-7)
+            for controller, torques in zip(batched, bat_torques):
+                np.testing.assert_array_equal(controller.torques, torques)
+
+            # Apply the same torques to both sets of envs, so that their states stay identical
+            for seq_env, bat_env, torques in zip(sequential_envs, batched_envs, seq_torques):
+                for env in (seq_env, bat_env):
+                    robot = env.robots[0]
+                    low, high = robot.torque_limits
+                    env.sim.data.ctrl[robot._ref_joint_actuator_indexes] = np.clip(torques, low, high)
+                    env.sim.step()
+
+    for env in sequential_envs + batched_envs:
+        env.close()
+
+
+def test_osc_batch_incompatible():
+    unfused = load_controller_config(default_controller="OSC_POSE")
+    unfused["fused_kernel"] = False
+    cached = load_controller_config(default_controller="OSC_POSE")
+    cached["opspace_cache_tol"] = 0.01
+    held = load_controller_config(default_controller="OSC_POSE")
+    held["update_period"] = 2
+    envs = _make_envs([load_controller_config(default_controller="OSC_POSE"), unfused, cached, held])
+    compatible = envs[0].robots[0].controller
+    for env in envs[1:]:
+        try:
+            OperationalSpaceController.run_batch([compatible, env.robots[0].controller])
+        except AssertionError:
+            pass
+        else:
+            raise AssertionError("run_batch() accepted an incompatible controller")
+
+    for env in envs:
+        env.close()
+
+
+if __name__ == "__main__":
+
+    test_osc_batch()
+    test_osc_batch_incompatible()
+
+    # Tests passed!
+    print("Batched OSC tests passed successfully!")
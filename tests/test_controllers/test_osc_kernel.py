@@ -0,0 +1,92 @@
+"""
+Test the fused OSC torque kernel.
+
+Checks that @opspace_torques computes the same torques as chaining @opspace_matrices and @nullspace_torques (the
+unfused OSC path), for both coupled and uncoupled position / orientation control, on random well-conditioned inputs.
+Also checks that @opspace_torques_from_matrices (given the matrices from @opspace_matrices) and @opspace_torques_batch
+match per-robot calls to @opspace_torques.
+"""
+import numpy as np
+
+from robosuite.utils.control_utils import (
+    nullspace_torques,
+    opspace_matrices,
+    opspace_torques,
+    opspace_torques_batch,
+    opspace_torques_from_matrices,
+)
+
+
+def unfused_torques(
+    mass_matrix, J_full, position_error, ori_error, ee_vel, kp, kd, initial_joint, joint_pos, joint_vel, uncoupling
+):
+    lambda_full, lambda_pos, lambda_ori, nullspace_matrix = opspace_matrices(
+        mass_matrix, J_full, np.array(J_full[:3]), np.array(J_full[3:])
+    )
+    desired_force = kp[:3] * position_error - kd[:3] * ee_vel[:3]
+    desired_torque = kp[3:] * ori_error - kd[3:] * ee_vel[3:]
+    if uncoupling:
+        decoupled_wrench = np.concatenate([np.dot(lambda_pos, desired_force), np.dot(lambda_ori, desired_torque)])
+    else:
+        decoupled_wrench = np.dot(lambda_full, np.concatenate([desired_force, desired_torque]))
+    torques = np.dot(J_full.T, decoupled_wrench)
+    return torques + nullspace_torques(mass_matrix, nullspace_matrix, initial_joint, joint_pos, joint_vel)
+
+
+def test_osc_kernel():
+    np.random.seed(0)
+    for dof in (6, 7):
+        for _ in range(50):
+            A = np.random.randn(dof, dof)
+            mass_matrix = A.dot(A.T) + dof * np.eye(dof)
+            kp = np.random.uniform(50, 300, 6)
+            args = (
+                mass_matrix,
+                np.random.randn(6, dof),
+                np.random.randn(3),
+                np.random.randn(3),
+                np.random.randn(6),
+                kp,
+                2 * np.sqrt(kp),
+                np.random.randn(dof),
+                np.random.randn(dof),
+                np.random.randn(dof),
+            )
+            matrices = opspace_matrices(args[0], args[1], np.array(args[1][:3]), np.array(args[1][3:]))
+            for uncoupling in (True, False):
+                assert np.allclose(opspace_torques(*args, uncoupling), unfused_torques(*args, uncoupling))
+                assert np.allclose(
+                    opspace_torques_from_matrices(*args[:2], *matrices, *args[2:], uncoupling),
+                    opspace_torques(*args, uncoupling),
+                )
+
+        # Batched kernel, with mixed coupled / uncoupled robots
+        batch_args, batch_torques = [], []
+        uncoupling = np.arange(8) % 2 == 0
+        for i in range(8):
+            A = np.random.randn(dof, dof)
+            kp = np.random.uniform(50, 300, 6)
+            args = (
+                A.dot(A.T) + dof * np.eye(dof),
+                np.random.randn(6, dof),
+                np.random.randn(3),
+                np.random.randn(3),
+                np.random.randn(6),
+                kp,
+                2 * np.sqrt(kp),
+                np.random.randn(dof),
+                np.random.randn(dof),
+                np.random.randn(dof),
+            )
+            batch_args.append(args)
+            batch_torques.append(opspace_torques(*args, uncoupling[i]))
+        stacked_args = [np.stack(arg) for arg in zip(*batch_args)]
+        assert np.allclose(opspace_torques_batch(*stacked_args, uncoupling), np.stack(batch_torques))
+
+    # Tests passed!
+    print("OSC kernel tests passed successfully!")
+
+
+if __name__ == "__main__":
+
+    test_osc_kernel()
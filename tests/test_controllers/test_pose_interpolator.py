@@ -0,0 +1,59 @@
+"""
+Test the precomputed pose interpolator.
+
+Checks that @LinearPoseInterpolator produces the same position / orientation goals as a pair of LinearInterpolators
+(as previously used by the OSC_POSE controller) over several consecutive goals, for both euler and quaternion
+orientations, and for both single and batched goals.
+"""
+import numpy as np
+
+from robosuite.controllers.interpolators.linear_interpolator import LinearInterpolator, LinearPoseInterpolator
+
+
+def test_pose_interpolator():
+    np.random.seed(0)
+    for ori_interpolate, ori_dim in (("euler", 3), ("quat", 4)):
+        for batch_shape in ((), (2,)):
+            num_goals = int(np.prod(batch_shape))
+            pose_interpolator = LinearPoseInterpolator(
+                controller_freq=500,
+                policy_freq=20,
+                ramp_ratio=0.2,
+                ori_interpolate=ori_interpolate,
+                batch_shape=batch_shape,
+            )
+            interpolators = []
+            for _ in range(num_goals):
+                pos_interpolator = LinearInterpolator(ndim=3, controller_freq=500, policy_freq=20, ramp_ratio=0.2)
+                ori_interpolator = LinearInterpolator(ndim=3, controller_freq=500, policy_freq=20, ramp_ratio=0.2)
+                ori_interpolator.set_states(dim=ori_dim, ori=ori_interpolate)
+                interpolators.append((pos_interpolator, ori_interpolator))
+
+            for _ in range(5):
+                goal_pos = np.random.randn(*(batch_shape + (3,)))
+                goal_ori = np.random.uniform(-0.5, 0.5, batch_shape + (ori_dim,))
+                if ori_interpolate == "quat":
+                    goal_ori /= np.linalg.norm(goal_ori, axis=-1, keepdims=True)
+                pose_interpolator.set_goal(goal_pos, goal_ori)
+                for (pos_interpolator, ori_interpolator), pos, ori in zip(
+                    interpolators, goal_pos.reshape(-1, 3), goal_ori.reshape(-1, ori_dim)
+                ):
+                    pos_interpolator.set_goal(pos)
+                    ori_interpolator.set_goal(ori)
+
+                # Step past the end of the interpolation, as the controller does between policy steps
+                for _ in range(25):
+                    pos, ori = pose_interpolator.get_interpolated_goal()
+                    for (pos_interpolator, ori_interpolator), pos_i, ori_i in zip(
+                        interpolators, pos.reshape(-1, 3), ori.reshape(-1, ori_dim)
+                    ):
+                        assert np.allclose(pos_i, pos_interpolator.get_interpolated_goal(), atol=1e-6)
+                        assert np.allclose(ori_i, ori_interpolator.get_interpolated_goal(), atol=1e-6)
+
+    # Tests passed!
+    print("Pose interpolator tests passed successfully!")
+
+
+if __name__ == "__main__":
+
+    test_pose_interpolator()
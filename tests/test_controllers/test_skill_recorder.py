@@ -0,0 +1,145 @@
+"""
+Test the trajectory recording policies of skills.
+
+This runs some basic sanity checks on SkillRecorder, namely, checking that for each record mode:
+    - 'all' records every observation, state, and action
+    - 'none' records nothing, and never queries the state
+    - 'final' only records the final observation, state, and action
+    - 'every_k' records the initial and every k-th observation / state plus the final one (without duplicating it if
+        the final step is itself a k-th step), along with every action
+    - 'buffer' records everything into re-used arrays, and only keeps the latest steps once it wraps around
+    - states are only queried when they are recorded
+    - the record settings of a SkillController are threaded through to all of its skills
+"""
+import numpy as np
+
+from robosuite.controllers.skill_controller import SkillController
+from robosuite.controllers.skills import SkillRecorder
+
+
+def _obs(t):
+    return {"pos": np.full(3, t, dtype=np.float64), "flag": np.array([t % 2])}
+
+
+def _state(t):
+    return np.array([t, -t], dtype=np.float64)
+
+
+def _action(t):
+    return np.full(4, t, dtype=np.float64)
+
+
+def _run(recorder, num_steps, max_steps=None):
+    """
+    Records a fake execution of @num_steps steps, where the observation, state, and action of step t are filled
+    with t. Returns the recorded info and the steps at which the state was queried.
+    """
+    queried = []
+
+    def get_state_at(t):
+        def get_state():
+            queried.append(t)
+            return _state(t)
+
+        return get_state
+
+    recorder.start(_obs(0), get_state_at(0), num_steps if max_steps is None else max_steps)
+    for t in range(1, num_steps + 1):
+        recorder.add(_obs(t), get_state_at(t), _action(t))
+    info = {}
+    recorder.finish(_obs(num_steps), get_state_at(num_steps), info)
+    return info, queried
+
+
+def _assert_recorded(info, obs_steps, action_steps):
+    obs_list = info["obs_list"]
+    if isinstance(obs_list, dict):
+        # Buffer mode, which records each observation key as an array
+        np.testing.assert_array_equal(obs_list["pos"], [_obs(t)["pos"] for t in obs_steps])
+        np.testing.assert_array_equal(obs_list["flag"], [_obs(t)["flag"] for t in obs_steps])
+    else:
+        assert len(obs_list) == len(obs_steps)
+        for obs, t in zip(obs_list, obs_steps):
+            np.testing.assert_array_equal(obs["pos"], _obs(t)["pos"])
+    np.testing.assert_array_equal(np.array(info["state_list"]), [_state(t) for t in obs_steps])
+    assert len(info["action_list"]) == len(action_steps)
+    for action, t in zip(info["action_list"], action_steps):
+        np.testing.assert_array_equal(action, _action(t))
+
+
+def test_record_all():
+    info, queried = _run(SkillRecorder(mode="all"), num_steps=5)
+    _assert_recorded(info, obs_steps=range(6), action_steps=range(1, 6))
+    assert queried == list(range(6))
+
+
+def test_record_none():
+    info, queried = _run(SkillRecorder(mode="none"), num_steps=5)
+    assert info["obs_list"] == [] and info["state_list"] == [] and info["action_list"] == []
+    assert queried == []
+
+
+def test_record_final():
+    info, queried = _run(SkillRecorder(mode="final"), num_steps=5)
+    _assert_recorded(info, obs_steps=[5], action_steps=[5])
+    assert queried == [5]
+
+
+def test_record_every_k():
+    # Final step is not a k-th step, so it is recorded in addition
+    info, queried = _run(SkillRecorder(mode="every_k", every_k=3), num_steps=7)
+    _assert_recorded(info, obs_steps=[0, 3, 6, 7], action_steps=range(1, 8))
+    assert queried == [0, 3, 6, 7]
+
+    # Final step is a k-th step, so it is only recorded once
+    info, queried = _run(SkillRecorder(mode="every_k", every_k=3), num_steps=6)
+    _assert_recorded(info, obs_steps=[0, 3, 6], action_steps=range(1, 7))
+    assert queried == [0, 3, 6]
+
+
+def test_record_buffer():
+    # By default, the buffer fits the initial observation plus one per step
+    recorder = SkillRecorder(mode="buffer")
+    info, queried = _run(recorder, num_steps=5)
+    _assert_recorded(info, obs_steps=range(6), action_steps=range(1, 6))
+    assert queried == list(range(6))
+
+    # Buffers are re-used across executions
+    pos = info["obs_list"]["pos"]
+    info, _ = _run(recorder, num_steps=4, max_steps=5)
+    _assert_recorded(info, obs_steps=range(5), action_steps=range(1, 5))
+    assert np.shares_memory(pos, info["obs_list"]["pos"])
+
+    # Once the buffer wraps around, only the latest steps are kept, in chronological order
+    info, queried = _run(SkillRecorder(mode="buffer", buffer_size=4), num_steps=9)
+    _assert_recorded(info, obs_steps=range(6, 10), action_steps=range(7, 10))
+    assert queried == list(range(10))
+
+
+def test_record_config():
+    controller = SkillController(
+        None,
+        primitive_set=["atomic", "reach", "grasp", "place", "push", "gripper_release"],
+        controller_type="OSC_POSE",
+        output_mode="max",
+        record_mode="every_k",
+        record_every_k=5,
+        record_buffer_size=20,
+    )
+    for skill in controller.name_to_skill.values():
+        assert skill._recorder.mode == "every_k"
+        assert skill._recorder.every_k == 5
+        assert skill._recorder.buffer_size == 20
+
+
+if __name__ == "__main__":
+
+    test_record_all()
+    test_record_none()
+    test_record_final()
+    test_record_every_k()
+    test_record_buffer()
+    test_record_config()
+
+    # Tests passed!
+    print("Skill recorder tests passed successfully!")
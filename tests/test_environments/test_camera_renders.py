@@ -0,0 +1,239 @@
+"""
+Test that the image observables of a camera share their render passes.
+
+This runs some basic sanity checks, namely, checking that:
+    - a camera with rgb, depth and several segmentation types is rendered in only two passes per observation (one for
+        rgb + depth, one shared by all segmentation types)
+    - the resulting observations match those rendered directly from the sim
+    - cameras are only rendered according to their render schedule (every sampling period, every k-th policy step,
+        or on request), and requested renders invalidate memoized observations
+    - the batched camera renderer matches sim.render() for cameras of different resolutions, and its returned buffers
+        are not overwritten by later renders
+    - the lookup table remapping of instance / class segmentations matches a per-pixel dict remap, including for the
+        background, unmapped ids, and ids beyond the number of geoms
+    - segmentation observables have the expected shape and dtype, both with and without macros.RAW_SEGMENTATION
+"""
+import numpy as np
+
+import robosuite
+import robosuite.utils.macros as macros
+from robosuite.utils.mjcf_utils import IMAGE_CONVENTION_MAPPING
+
+
+def test_camera_renders():
+    env = robosuite.make(
+        "Lift",
+        robots="Panda",
+        has_renderer=False,
+        has_offscreen_renderer=True,
+        use_camera_obs=True,
+        camera_names="agentview",
+        camera_heights=64,
+        camera_widths=64,
+        camera_depths=True,
+        camera_segmentations=["instance", "class", "element"],
+    )
+    env.reset()
+
+    # Count (per-camera) render passes over one observation
+    renderer = env._get_camera_renderer()
+    render = renderer.render
+    calls = []
+
+    def counted_render(cameras, depth=False, segmentation=False):
+        calls.extend(segmentation for _ in cameras)
+        return render(cameras, depth=depth, segmentation=segmentation)
+
+    renderer.render = counted_render
+    obs = env._get_observations(force_update=True)
+    renderer.render = render
+    assert len(calls) == 2
+    assert sum(calls) == 1
+
+    # Observations match direct renders
+    convention = IMAGE_CONVENTION_MAPPING[macros.IMAGE_CONVENTION]
+    rgb, depth = env.sim.render(camera_name="agentview", width=64, height=64, depth=True)
+    seg = env.sim.render(camera_name="agentview", width=64, height=64, segmentation=True)
+    assert np.array_equal(obs["agentview_image"], rgb[::convention])
+    assert np.allclose(obs["agentview_depth"], depth[::convention][..., None])
+    assert np.array_equal(obs["agentview_segmentation_element"], seg[::convention, :, 1:2])
+    assert obs["agentview_segmentation_instance"].shape == (64, 64, 1)
+    assert obs["agentview_segmentation_class"].shape == (64, 64, 1)
+    env.close()
+
+
+def test_camera_render_schedule():
+    env = robosuite.make(
+        "Lift",
+        robots="Panda",
+        has_renderer=False,
+        has_offscreen_renderer=True,
+        use_camera_obs=True,
+        camera_names="agentview",
+        camera_heights=64,
+        camera_widths=64,
+    )
+    env.reset()
+
+    renderer = env._get_camera_renderer()
+    render = renderer.render
+    calls = []
+
+    def counted_render(cameras, depth=False, segmentation=False):
+        calls.extend(cameras)
+        return render(cameras, depth=depth, segmentation=segmentation)
+
+    def count_renders(num_steps):
+        del calls[:]
+        for _ in range(num_steps):
+            env.step(np.zeros(env.action_dim))
+        return len(calls)
+
+    renderer.render = counted_render
+
+    # By default, cameras are rendered at their sampling rate, i.e.: once per policy step
+    assert count_renders(4) == 4
+
+    env.set_camera_render_schedule(mode="policy_step", period=2)
+    assert count_renders(4) == 2
+
+    env.set_camera_render_schedule(mode="on_request")
+    image = np.array(env._get_observations()["agentview_image"])
+    assert count_renders(4) == 0
+    assert np.array_equal(env._get_observations()["agentview_image"], image)
+    stale_obs = env.get_snapshot("obs", env._get_observations)
+    env.request_camera_render()
+    assert len(calls) == 1
+
+    # Requested renders invalidate memoized observations, which would otherwise hold stale images
+    assert env.get_snapshot("obs", env._get_observations) is not stale_obs
+
+    # Deferred rendering renders once at the end, and restores the previous schedule
+    env.set_camera_render_schedule(mode="sampling_rate")
+    with env.deferred_camera_rendering():
+        assert count_renders(4) == 0
+    assert len(calls) == 1
+    assert count_renders(4) == 4
+
+    renderer.render = render
+    env.close()
+
+
+def test_batched_camera_renderer():
+    env = robosuite.make(
+        "Lift",
+        robots="Panda",
+        has_renderer=False,
+        has_offscreen_renderer=True,
+        use_camera_obs=True,
+        camera_names=["agentview", "frontview"],
+        camera_heights=[84, 128],
+        camera_widths=[84, 128],
+    )
+    env.reset()
+    renderer = env._get_camera_renderer()
+    cameras = [("agentview", 84, 84), ("frontview", 128, 128)]
+    images = renderer.render(cameras, depth=True)
+    for (cam_name, cam_w, cam_h), (rgb, depth) in zip(cameras, images):
+        ref_rgb, ref_depth = env.sim.render(camera_name=cam_name, width=cam_w, height=cam_h, depth=True)
+        assert np.array_equal(rgb, ref_rgb)
+        assert np.allclose(depth, ref_depth)
+
+    # Returned buffers are not overwritten by later renders
+    rgbs = [np.array(rgb) for rgb, _ in images]
+    for _ in range(5):
+        env.step(np.random.uniform(*env.action_spec))
+    new_images = renderer.render(cameras, depth=True)
+    assert all(new[0] is not old[0] for new, old in zip(new_images, images))
+    assert all(np.array_equal(rgb, old[0]) for rgb, old in zip(rgbs, images))
+    env.close()
+
+
+def _dict_remap(seg, mapping):
+    return np.fromiter(map(lambda x: mapping.get(x, -1), seg.flatten()), dtype=np.int32).reshape(seg.shape) + 1
+
+
+def test_segmentation_remap():
+    env = robosuite.make(
+        "Lift",
+        robots="Panda",
+        has_renderer=False,
+        has_offscreen_renderer=True,
+        use_camera_obs=True,
+        camera_names="agentview",
+        camera_heights=64,
+        camera_widths=64,
+        camera_segmentations=["instance", "class"],
+    )
+    env.reset()
+
+    # Mappings from geom id to grouped id, as used by the segmentation sensors
+    instance_ids = {inst: i for i, inst in enumerate(env.model.instances_to_ids.keys())}
+    class_ids = {cls: i for i, cls in enumerate(env.model.classes_to_ids.keys())}
+    mappings = {
+        "instance": {idn: instance_ids[inst] for idn, inst in env.model.geom_ids_to_instances.items()},
+        "class": {idn: class_ids[cls] for idn, cls in env.model.geom_ids_to_classes.items()},
+    }
+
+    # Rendered segmentations
+    obs = env._get_observations(force_update=True)
+    seg = env.sim.render(camera_name="agentview", width=64, height=64, segmentation=True)
+    seg = seg[:: IMAGE_CONVENTION_MAPPING[macros.IMAGE_CONVENTION], :, 1]
+    for cam_s, mapping in mappings.items():
+        assert np.array_equal(obs["agentview_segmentation_" + cam_s][..., 0], _dict_remap(seg, mapping))
+
+    # Synthetic segmentation containing the background, every geom id, and ids beyond the number of geoms
+    ngeom = env.sim.model.ngeom
+    ids = np.arange(-1, ngeom + 7, dtype=np.int32)
+    synthetic = np.zeros((1, len(ids), 2), dtype=np.int32)
+    synthetic[0, :, 1] = ids
+    env._render_camera = lambda *args, **kwargs: synthetic
+    for cam_s, mapping in mappings.items():
+        assert any(idn not in mapping for idn in range(ngeom))
+        sensor, _ = env._create_segementation_sensor("agentview", len(ids), 1, cam_s, "agentview_segmentation")
+        remapped = sensor({})
+        assert remapped.dtype == np.int32
+        assert np.array_equal(remapped[..., 0], _dict_remap(synthetic[:, :, 1], mapping))
+        assert remapped[0, 0, 0] == 0
+    del env._render_camera
+    env.close()
+
+
+def test_raw_segmentation():
+    raw_segmentation = macros.RAW_SEGMENTATION
+    try:
+        for raw in (False, True):
+            macros.RAW_SEGMENTATION = raw
+            env = robosuite.make(
+                "Lift",
+                robots="Panda",
+                has_renderer=False,
+                has_offscreen_renderer=True,
+                use_camera_obs=True,
+                camera_names="agentview",
+                camera_heights=48,
+                camera_widths=64,
+                camera_segmentations=["instance", "class", "element"],
+            )
+            obs = env.reset()
+            seg = env.sim.render(camera_name="agentview", width=64, height=48, segmentation=True)
+            shape = (48, 64) if raw else (48, 64, 1)
+            for cam_s in ("instance", "class", "element"):
+                value = obs["agentview_segmentation_" + cam_s]
+                assert value.shape == shape
+                assert value.dtype == (seg.dtype if cam_s == "element" else np.int32)
+            env.close()
+    finally:
+        macros.RAW_SEGMENTATION = raw_segmentation
+
+
+if __name__ == "__main__":
+
+    test_camera_renders()
+    test_camera_render_schedule()
+    test_batched_camera_renderer()
+    test_segmentation_remap()
+    test_raw_segmentation()
+
+    # Tests passed!
+    print("Camera render tests passed successfully!")
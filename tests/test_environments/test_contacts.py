@@ -0,0 +1,121 @@
+"""
+Test the indexed contact queries.
+
+This runs some basic sanity checks, namely, checking that check_contact(), get_contacts(), and _check_grasp() match a
+brute-force scan over sim.data.contact[:ncon], throughout a scripted grasp of the cube in Lift:
+    - after every step
+    - after directly setting the sim state in between steps, without stepping
+"""
+import numpy as np
+
+import robosuite
+from robosuite.models.base import MujocoModel
+
+
+def _geom_names(geoms):
+    if isinstance(geoms, MujocoModel):
+        return set(geoms.contact_geoms)
+    return {geoms} if type(geoms) is str else set(geoms)
+
+
+def _contact_pairs(env):
+    model = env.sim.model
+    return [
+        (model.geom_id2name(contact.geom1), model.geom_id2name(contact.geom2))
+        for contact in env.sim.data.contact[: env.sim.data.ncon]
+    ]
+
+
+def _brute_force_check_contact(env, geoms_1, geoms_2=None):
+    names_1 = _geom_names(geoms_1)
+    names_2 = _geom_names(geoms_2) if geoms_2 is not None else None
+    for name_a, name_b in _contact_pairs(env):
+        for g1, g2 in ((name_a, name_b), (name_b, name_a)):
+            if g1 in names_1 and (names_2 is None or g2 in names_2):
+                return True
+    return False
+
+
+def _brute_force_get_contacts(env, model):
+    names = _geom_names(model)
+    contacts = set()
+    for name_a, name_b in _contact_pairs(env):
+        if name_a in names and name_b not in names:
+            contacts.add(name_b)
+        elif name_b in names and name_a not in names:
+            contacts.add(name_a)
+    return contacts
+
+
+def _brute_force_check_grasp(env, gripper, object_geoms):
+    return all(
+        _brute_force_check_contact(env, gripper.important_geoms[group], object_geoms)
+        for group in ("left_fingerpad", "right_fingerpad")
+    )
+
+
+def _assert_matches_brute_force(env):
+    gripper, cube = env.robots[0].gripper, env.cube
+    table_geoms = ["table_collision"]
+    for geoms_1, geoms_2 in (
+        (gripper, cube),
+        (cube, table_geoms),
+        (cube, None),
+        (gripper, None),
+        ("table_collision", None),
+    ):
+        assert env.check_contact(geoms_1, geoms_2) == _brute_force_check_contact(env, geoms_1, geoms_2)
+    for model in (gripper, cube, env.robots[0].robot_model):
+        assert env.get_contacts(model) == _brute_force_get_contacts(env, model)
+    grasped = env._check_grasp(gripper, cube)
+    assert grasped == _brute_force_check_grasp(env, gripper, cube)
+    return grasped
+
+
+def test_contacts():
+    env = robosuite.make(
+        "Lift",
+        robots="Panda",
+        has_renderer=False,
+        has_offscreen_renderer=False,
+        use_camera_obs=False,
+        ignore_done=True,
+    )
+    np.random.seed(0)
+    obs = env.reset()
+
+    # Scripted grasp: move above the cube, lower onto it, close the gripper, and lift
+    targets = [
+        (np.array([0, 0, 0.1]), -1, 40),
+        (np.array([0, 0, 0]), -1, 40),
+        (None, 1, 20),
+        (np.array([0, 0, 0.15]), 1, 20),
+    ]
+    states, grasped = [], []
+    for offset, gripper_action, num_steps in targets:
+        for _ in range(num_steps):
+            action = np.zeros(env.action_dim)
+            if offset is not None:
+                action[:3] = np.clip(10 * (obs["cube_pos"] + offset - obs["robot0_eef_pos"]), -1, 1)
+            action[-1] = gripper_action
+            obs, _, _, _ = env.step(action)
+            grasped.append(_assert_matches_brute_force(env))
+            states.append(env.sim.get_state().flatten())
+    # Make sure both the contact and no contact cases were covered
+    assert any(grasped) and not all(grasped)
+
+    # Jump between states without stepping, so that contacts change within a single step
+    for i in np.random.permutation(len(states))[:20]:
+        env.sim.set_state_from_flattened(states[i])
+        env.sim.forward()
+        assert _assert_matches_brute_force(env) == grasped[i]
+
+    env.close()
+
+    # Tests passed!
+    print("Contact tests passed successfully!")
+
+
+if __name__ == "__main__":
+
+    test_contacts()
@@ -0,0 +1,58 @@
+"""
+Test the compiled model cache.
+
+This runs some basic sanity checks on the cache, namely, checking that:
+    - re-compiling an identical xml is served from the cache
+    - models restored from the cache simulate identically to freshly compiled ones
+    - modifying a cached model does not affect models subsequently handed out by the cache
+"""
+import numpy as np
+
+import robosuite
+import robosuite.utils.macros as macros
+from robosuite.utils.model_cache import get_model_cache
+
+
+def test_model_cache():
+    macros.CACHE_COMPILED_MODELS = True
+    cache = get_model_cache()
+    cache.clear()
+
+    env = robosuite.make(
+        "Lift",
+        robots="Panda",
+        has_renderer=False,
+        has_offscreen_renderer=False,
+        use_camera_obs=False,
+    )
+    xml = env.model.get_xml()
+    state = env.sim.get_state().flatten()
+    stats = cache.stats
+
+    # Reset twice from the xml that was already compiled during construction -- both resets should hit the cache
+    actions = np.random.uniform(*env.action_spec, size=(10, env.action_dim))
+    final_states = []
+    for i in range(2):
+        env.reset_from_xml_string(xml)
+        env.sim.set_state_from_flattened(state)
+        env.sim.forward()
+        for action in actions:
+            env.step(action)
+        final_states.append(env.sim.get_state().flatten())
+        # Modifying the current model must not leak into the next model restored from the cache
+        env.sim.model.body_mass[:] *= 2.0
+    assert cache.stats["hits"] == stats["hits"] + 2
+    assert cache.stats["misses"] == stats["misses"]
+    assert np.allclose(final_states[0], final_states[1])
+
+    env.close()
+    cache.clear()
+    macros.CACHE_COMPILED_MODELS = False
+
+    # Tests passed!
+    print("Model cache tests passed successfully!")
+
+
+if __name__ == "__main__":
+
+    test_model_cache()
@@ -0,0 +1,62 @@
+"""
+Test the resolved name -> id references used in the step loop.
+
+This runs some basic sanity checks, namely, checking that:
+    - controller / robot quantities computed from cached ids match their name-based counterparts
+    - robots and controllers make no name-based sim lookups while stepping (see macros.DEBUG_NAME_LOOKUPS)
+"""
+import os
+import warnings
+
+import numpy as np
+
+import robosuite
+import robosuite.utils.macros as macros
+
+
+def test_name_lookups():
+    env = robosuite.make(
+        "Lift",
+        robots="Panda",
+        has_renderer=False,
+        has_offscreen_renderer=False,
+        use_camera_obs=False,
+    )
+    env.reset()
+    robot = env.robots[0]
+
+    macros.DEBUG_NAME_LOOKUPS = True
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", RuntimeWarning)
+        for _ in range(5):
+            env.step(np.random.uniform(*env.action_spec))
+    macros.DEBUG_NAME_LOOKUPS = False
+
+    # Robots and controllers should only index the sim with pre-resolved ids
+    for directory in ("controllers", "robots"):
+        path = os.path.join(os.path.dirname(robosuite.__file__), directory)
+        lookups = [key for key in env._name_lookup_monitor.lookups if key[1].startswith(path)]
+        assert len(lookups) == 0, "Got name-based lookups in the step loop: {}".format(lookups)
+
+    # Id-based quantities should match their name-based counterparts
+    controller = robot.controller
+    controller.update(force=True)
+    J_pos = env.sim.data.get_site_jacp(controller.eef_name).reshape((3, -1))[:, controller.qvel_index]
+    J_ori = env.sim.data.get_site_jacr(controller.eef_name).reshape((3, -1))[:, controller.qvel_index]
+    assert np.allclose(controller.J_pos, J_pos)
+    assert np.allclose(controller.J_ori, J_ori)
+    assert np.allclose(robot._hand_pose, robot.pose_in_base_from_name(robot.robot_model.eef_name))
+    sensor_name = robot.gripper.important_sensors["force_ee"]
+    sensor_id = env.sim.model.sensor_name2id(sensor_name)
+    sensor_adr = env.sim.model.sensor_adr[sensor_id]
+    assert np.allclose(robot.ee_force, env.sim.data.sensordata[sensor_adr : sensor_adr + 3])
+
+    env.close()
+
+    # Tests passed!
+    print("Name lookup tests passed successfully!")
+
+
+if __name__ == "__main__":
+
+    test_name_lookups()
@@ -0,0 +1,96 @@
+"""
+Test the compiled observable dependency graph.
+
+This runs some basic sanity checks, namely, checking that:
+    - observables are updated after the observables their sensors depend on
+    - the resulting observations match those of updating every observable in its original order
+    - inactive intermediate observables are only computed while some consumed observable depends on them
+    - deactivated source observables keep being computed for the env sensors that read them (e.g.: in Stack)
+    - directly modifying an observable (without env.modify_observable()) recompiles the observables to update
+"""
+import numpy as np
+
+import robosuite
+
+
+def test_observable_graph():
+    env = robosuite.make(
+        "PickPlace",
+        robots="Panda",
+        has_renderer=False,
+        has_offscreen_renderer=False,
+        use_camera_obs=False,
+        single_object_mode=2,
+        object_type="cereal",
+    )
+    obs = env.reset()
+
+    # Dependencies come first
+    order = [observable.name for observable in env._get_compiled_observables()]
+    for i, name in enumerate(order):
+        for dependency in env._observables[name].dependencies:
+            if dependency in order:
+                assert order.index(dependency) < i, (name, dependency)
+
+    # Only the sensors of the object in use are compiled
+    pf = env.robots[0].robot_model.naming_prefix
+    assert "world_pose_in_gripper" in order
+    assert f"Cereal_to_{pf}eef_pos" in order
+    assert f"Milk_to_{pf}eef_pos" not in order
+
+    # Observations match those of a full update in the original order
+    obs_cache = {}
+    for observable in env._observables.values():
+        observable.update(timestep=0, obs_cache=obs_cache, force=True)
+    for name, value in obs.items():
+        if name in obs_cache:
+            assert np.allclose(value, obs_cache[name]), name
+
+    # The intermediate is skipped once nothing consumes it
+    for name in env.object_id_to_sensors[env.object_id]:
+        if "_to_" in name:
+            env.modify_observable(observable_name=name, attribute="enabled", modifier=False)
+    order = [observable.name for observable in env._get_compiled_observables()]
+    assert "world_pose_in_gripper" not in order
+    assert f"{pf}joint_pos" in order
+    env.close()
+
+
+def test_inactive_source_observables():
+    env = robosuite.make(
+        "Stack",
+        robots="Panda",
+        has_renderer=False,
+        has_offscreen_renderer=False,
+        use_camera_obs=False,
+    )
+    env.reset()
+    pf = env.robots[0].robot_model.naming_prefix
+
+    # Deactivated observables that other sensors read are still computed, but not returned
+    env.modify_observable(observable_name="cubeA_pos", attribute="active", modifier=False)
+    env._observables[f"{pf}eef_pos"].set_active(False)
+    env.step(np.zeros(env.action_dim))
+    obs = env._get_observations(force_update=True)
+    order = [observable.name for observable in env._get_compiled_observables()]
+    assert "cubeA_pos" in order and f"{pf}eef_pos" in order
+    assert "cubeA_pos" not in obs and f"{pf}eef_pos" not in obs
+    eef_pos = env.sim.data.site_xpos[env.robots[0].eef_site_id]
+    assert np.allclose(obs["gripper_to_cubeA"], env.sim.data.body_xpos[env.cubeA_body_id] - eef_pos)
+    assert not np.allclose(obs["gripper_to_cubeA"], 0)
+
+    # Directly disabling an observable removes it from the compiled observables
+    env._observables["gripper_to_cubeB"].set_enabled(False)
+    order = [observable.name for observable in env._get_compiled_observables()]
+    assert "gripper_to_cubeB" not in order
+    assert "cubeB_pos" in order
+    env.close()
+
+
+if __name__ == "__main__":
+
+    test_observable_graph()
+    test_inactive_source_observables()
+
+    # Tests passed!
+    print("Observable graph tests passed successfully!")
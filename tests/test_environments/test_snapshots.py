@@ -0,0 +1,82 @@
+"""
+Test the per-simulation-state memoization of values (env.get_snapshot()).
+
+This runs some basic sanity checks, namely, checking that:
+    - memoized values are not recomputed while the simulation state is unchanged
+    - memoized values are invalidated on step(), reset(), sim.set_state_from_flattened(), and direct changes to the
+        controls
+    - seeded values (env.set_snapshot()) are returned without being computed
+"""
+import numpy as np
+
+import robosuite
+
+
+def test_snapshots():
+    env = robosuite.make(
+        "Lift",
+        robots="Panda",
+        has_renderer=False,
+        has_offscreen_renderer=False,
+        use_camera_obs=False,
+    )
+    env.reset()
+
+    calls = []
+
+    def compute():
+        calls.append(None)
+        return np.array(env.sim.data.qpos)
+
+    def get_snapshot():
+        return env.get_snapshot("qpos", compute)
+
+    # Nothing is recomputed while the state is unchanged
+    value = get_snapshot()
+    assert get_snapshot() is value
+    env.sim.forward()
+    assert get_snapshot() is value
+    assert len(calls) == 1
+
+    # Stepping invalidates the memo
+    env.step(np.zeros(env.action_dim))
+    assert np.array_equal(get_snapshot(), env.sim.data.qpos)
+    assert len(calls) == 2
+
+    # Directly setting the sim state invalidates the memo
+    state = env.sim.get_state().flatten()
+    state[1:] += 0.01
+    env.sim.set_state_from_flattened(state)
+    assert np.array_equal(get_snapshot(), env.sim.data.qpos)
+    assert len(calls) == 3
+    get_snapshot()
+    assert len(calls) == 3
+
+    # So do direct changes to the controls, which are not part of the flattened state
+    env.sim.data.ctrl[0] += 0.01
+    get_snapshot()
+    assert len(calls) == 4
+
+    # Resetting invalidates the memo, even if the reset state happens to be the same
+    env.reset()
+    get_snapshot()
+    assert len(calls) == 5
+
+    # Seeded values are returned as is, until the state changes
+    seeded = np.zeros(3)
+    env.set_snapshot("qpos", seeded)
+    assert get_snapshot() is seeded
+    assert len(calls) == 5
+    env.step(np.zeros(env.action_dim))
+    assert get_snapshot() is not seeded
+    assert len(calls) == 6
+
+    env.close()
+
+    # Tests passed!
+    print("Snapshot tests passed successfully!")
+
+
+if __name__ == "__main__":
+
+    test_snapshots()
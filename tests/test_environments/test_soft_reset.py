@@ -0,0 +1,84 @@
+"""
+Test the soft reset mode.
+
+This runs some basic sanity checks, namely, checking that:
+    - soft resets keep re-using the compiled model
+    - soft resets produce the same distribution of initial observations as hard resets
+    - truthy / falsy hard_reset values behave like True / False
+    - tasks that randomize their model topology (e.g.: CleanUpMedium object train) still re-load their model
+"""
+import numpy as np
+
+import robosuite
+
+
+def _make_env(name="Lift", **kwargs):
+    return robosuite.make(
+        name,
+        robots="Panda",
+        has_renderer=False,
+        has_offscreen_renderer=False,
+        use_camera_obs=False,
+        **kwargs,
+    )
+
+
+def _initial_observations(hard_reset, num_resets=30):
+    np.random.seed(0)
+    env = _make_env(hard_reset=hard_reset)
+    model = env.sim.model
+    cube_pos, joint_pos = [], []
+    same_model = True
+    for _ in range(num_resets):
+        obs = env.reset()
+        same_model = same_model and env.sim.model is model
+        cube_pos.append(obs["cube_pos"])
+        joint_pos.append(obs["robot0_joint_pos_cos"])
+        # Move away from the initial state before the next reset
+        env.step(np.random.uniform(*env.action_spec))
+    env.close()
+    return np.array(cube_pos), np.array(joint_pos), same_model
+
+
+def test_soft_reset():
+    soft_cube_pos, soft_joint_pos, soft_same_model = _initial_observations(hard_reset="soft")
+    hard_cube_pos, hard_joint_pos, hard_same_model = _initial_observations(hard_reset=True)
+    assert soft_same_model
+    assert not hard_same_model
+
+    # Same initial distribution, i.e.: means agree up to a few standard errors, and similar spreads
+    for soft, hard in ((soft_cube_pos, hard_cube_pos), (soft_joint_pos, hard_joint_pos)):
+        stderr = np.sqrt((soft.var(axis=0) + hard.var(axis=0)) / len(soft)) + 1e-6
+        assert np.all(np.abs(soft.mean(axis=0) - hard.mean(axis=0)) < 4 * stderr)
+        assert np.allclose(soft.std(axis=0), hard.std(axis=0), rtol=0.5, atol=1e-4)
+    # Placements are still resampled at every soft reset
+    assert len(np.unique(soft_cube_pos[:, 0])) == len(soft_cube_pos)
+
+
+def test_hard_reset_normalization():
+    for hard_reset, rebuilds in ((1, True), (np.True_, True), (0, False), (np.False_, False)):
+        env = _make_env(hard_reset=hard_reset)
+        assert env.hard_reset is rebuilds
+        model = env.sim.model
+        env.reset()
+        assert (env.sim.model is not model) == rebuilds
+        env.close()
+
+
+def test_soft_reset_model_rebuild():
+    env = _make_env("CleanUpMediumSmallInitDObjectTrain", hard_reset="soft")
+    assert env._requires_model_rebuild()
+    model = env.sim.model
+    env.reset()
+    assert env.sim.model is not model
+    env.close()
+
+
+if __name__ == "__main__":
+
+    test_soft_reset()
+    test_hard_reset_normalization()
+    test_soft_reset_model_rebuild()
+
+    # Tests passed!
+    print("Soft reset tests passed successfully!")
@@ -0,0 +1,89 @@
+"""
+Test the vectorized multi-environment runner.
+
+This runs some basic sanity checks on VectorEnv, namely, checking that:
+    - observations are stacked along a leading batch dimension and keyed like a single environment's observations
+    - rewards and dones are returned as (N,) arrays
+    - environments whose episode terminates are automatically reset
+    - masked resets only reset the requested environments
+    - the shared-memory observation transport returns the same observations as the pickling transport
+"""
+import numpy as np
+
+from robosuite.vector import make_vector
+
+
+def _copy_observations(obs):
+    # Shared-memory observations are views that get overwritten by the next step, so copy them
+    return {k: np.array(v) for k, v in obs.items()}
+
+
+def _run_vector_env(shared_memory):
+    num_envs, horizon = 4, 5
+    rng = np.random.RandomState(0)
+    env = make_vector(
+        "Lift",
+        num_envs=num_envs,
+        num_workers=2,
+        seed=0,
+        robots="Panda",
+        has_renderer=False,
+        has_offscreen_renderer=False,
+        use_camera_obs=False,
+        horizon=horizon,
+        shared_memory=shared_memory,
+    )
+    single_obs = env.observation_spec()
+
+    obs = env.reset()
+    observations = [_copy_observations(obs)]
+    assert set(obs.keys()) == set(single_obs.keys())
+    for k, v in obs.items():
+        assert v.shape == (num_envs,) + np.asarray(single_obs[k]).shape
+
+    # Different workers must be seeded differently
+    assert not np.allclose(obs["obj_pos"][0], obs["obj_pos"][-1])
+
+    action_min, action_max = env.action_spec
+    for t in range(horizon):
+        actions = rng.uniform(action_min, action_max, size=(num_envs, env.action_dim))
+        obs, rewards, dones, infos = env.step(actions)
+        observations.append(_copy_observations(obs))
+        assert rewards.shape == (num_envs,)
+        assert dones.shape == (num_envs,)
+        assert len(infos) == num_envs
+
+    # All episodes terminated on the final step and should have been auto-reset
+    assert dones.all()
+    assert all("terminal_observation" in info for info in infos)
+    assert all(timestep == 0 for timestep in env.get_attr("timestep"))
+
+    # Masked reset only resets the requested environments
+    obs, _, _, _ = env.step(np.zeros((num_envs, env.action_dim)))
+    observations.append(_copy_observations(obs))
+    obs = env.reset(mask=[True, False, False, True])
+    observations.append(_copy_observations(obs))
+    assert env.get_attr("timestep") == [0, 1, 1, 0]
+
+    env.close()
+    return observations
+
+
+def test_vector_env():
+    pickled = _run_vector_env(shared_memory=False)
+    shared = _run_vector_env(shared_memory=True)
+
+    # Both transports return the same observations for the same seed and actions
+    assert len(pickled) == len(shared)
+    for pickled_obs, shared_obs in zip(pickled, shared):
+        assert set(pickled_obs.keys()) == set(shared_obs.keys())
+        for k in pickled_obs:
+            np.testing.assert_array_equal(pickled_obs[k], shared_obs[k])
+
+    # Tests passed!
+    print("Vector environment tests passed successfully!")
+
+
+if __name__ == "__main__":
+
+    test_vector_env()
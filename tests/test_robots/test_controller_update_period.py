@@ -0,0 +1,114 @@
+"""
+Test evaluating robot controllers less often than the simulation is stepped.
+
+This runs some basic sanity checks, namely, checking that:
+    - with an update period of N, the controller is evaluated every N-th substep, starting at every policy step
+    - with zero-order hold, the applied torques stay constant in between controller evaluations
+    - without zero-order hold, the applied torques change in between controller evaluations by exactly the change in
+        gravity / coriolis compensation
+    - an update period of 1 (the default) evaluates the controller at every substep
+"""
+import numpy as np
+
+import robosuite
+from robosuite import load_controller_config
+
+
+def _make_env(update_period, zero_order_hold=True):
+    controller_config = load_controller_config(default_controller="OSC_POSE")
+    controller_config["update_period"] = update_period
+    controller_config["zero_order_hold"] = zero_order_hold
+    env = robosuite.make(
+        "Lift",
+        robots="Panda",
+        controller_configs=controller_config,
+        has_renderer=False,
+        has_offscreen_renderer=False,
+        use_camera_obs=False,
+        control_freq=20,
+    )
+    env.reset()
+    return env
+
+
+def _count_controller_evaluations(env, num_steps):
+    """
+    Steps @env with random actions, recording the arm torques applied at every substep, as well as the unclipped
+    torques and the gravity / coriolis compensation at the time they were computed
+    """
+    robot = env.robots[0]
+    run_controller = robot.controller.run_controller
+    evaluations = []
+
+    def counted_run_controller():
+        evaluations.append(1)
+        return run_controller()
+
+    robot.controller.run_controller = counted_run_controller
+    unclipped_torques, compensations = [], []
+    run_schedule = robot._run_controller
+
+    def recorded_run_schedule(controller, schedule, policy_step):
+        scheduled_torques = run_schedule(controller, schedule, policy_step)
+        unclipped_torques.append(np.array(scheduled_torques))
+        compensations.append(controller.torque_compensation)
+        return scheduled_torques
+
+    robot._run_controller = recorded_run_schedule
+    torques = []
+    sim_step = env.sim.step
+
+    def recorded_sim_step():
+        torques.append(np.array(robot.torques))
+        sim_step()
+
+    env.sim.step = recorded_sim_step
+    for _ in range(num_steps):
+        env.step(np.random.uniform(*env.action_spec))
+    env.sim.step = sim_step
+    del robot._run_controller
+    return len(evaluations), np.array(torques), np.array(unclipped_torques), np.array(compensations)
+
+
+def test_controller_update_period():
+    np.random.seed(0)
+    num_steps = 3
+
+    env = _make_env(update_period=1)
+    substeps = int(env.control_timestep / env.model_timestep)
+    evaluations, _, _, _ = _count_controller_evaluations(env, num_steps)
+    assert evaluations == num_steps * substeps
+    env.close()
+
+    update_period = 5
+    env = _make_env(update_period=update_period)
+    evaluations, torques, _, _ = _count_controller_evaluations(env, num_steps)
+    assert evaluations == num_steps * int(np.ceil(substeps / update_period))
+    for substep, torque in enumerate(torques):
+        if (substep % substeps) % update_period != 0:
+            assert np.allclose(torque, torques[substep - 1])
+    env.close()
+
+    # Without zero-order hold, the gravity compensation is still refreshed in between evaluations
+    env = _make_env(update_period=update_period, zero_order_hold=False)
+    evaluations, _, torques, compensations = _count_controller_evaluations(env, num_steps)
+    assert evaluations == num_steps * int(np.ceil(substeps / update_period))
+    held_substeps = [substep for substep in range(len(torques)) if (substep % substeps) % update_period != 0]
+    for substep in held_substeps:
+        np.testing.assert_allclose(
+            torques[substep] - torques[substep - 1],
+            compensations[substep] - compensations[substep - 1],
+            rtol=0,
+            atol=1e-10,
+        )
+    # Make sure the compensation actually changed in between evaluations
+    assert any(not np.allclose(compensations[substep], compensations[substep - 1]) for substep in held_substeps)
+    env.close()
+
+    # Tests passed!
+    print("Controller update period tests passed successfully!")
+
+
+if __name__ == "__main__":
+
+    test_controller_update_period()
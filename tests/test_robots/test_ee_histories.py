@@ -0,0 +1,61 @@
+"""
+Test the lazily subscribed eef histories of robots.
+
+This runs some basic sanity checks, namely, checking that:
+    - robots don't track any eef histories unless they're accessed (or subscribed to by the environment, e.g.: Wipe)
+    - subscribed histories are updated at every policy step, and cleared at reset
+"""
+import numpy as np
+
+import robosuite
+
+
+def test_ee_histories():
+    env = robosuite.make(
+        "Lift",
+        robots="Panda",
+        has_renderer=False,
+        has_offscreen_renderer=False,
+        use_camera_obs=False,
+    )
+    env.reset()
+    robot = env.robots[0]
+    for _ in range(3):
+        env.step(np.random.uniform(*env.action_spec))
+    assert len(robot._ee_histories) == 0
+
+    # Accessing a history subscribes to it (and its dependencies) from then on
+    ee_acc = robot.recent_ee_acc
+    assert set(robot._ee_histories) == {"ee_acc", "ee_vel_buffer"}
+    ee_pose = robot.recent_ee_pose
+    env.step(np.random.uniform(*env.action_spec))
+    assert np.allclose(ee_pose.current[:3], robot.controller.ee_pos, atol=1e-2)
+    assert ee_acc.current.any()
+
+    # Histories are cleared (but stay subscribed to) at reset
+    env.reset()
+    robot = env.robots[0]
+    assert not robot.recent_ee_pose.current.any()
+    env.step(np.random.uniform(*env.action_spec))
+    assert robot.recent_ee_pose.current.any()
+    env.close()
+
+    # Wipe reads the force / torque and acceleration histories in its reward, so it subscribes at reset
+    env = robosuite.make(
+        "Wipe",
+        robots="Panda",
+        has_renderer=False,
+        has_offscreen_renderer=False,
+        use_camera_obs=False,
+    )
+    env.reset()
+    assert {"ee_forcetorques", "ee_acc"}.issubset(env.robots[0]._ee_histories)
+    env.close()
+
+    # Tests passed!
+    print("Eef history tests passed successfully!")
+
+
+if __name__ == "__main__":
+
+    test_ee_histories()
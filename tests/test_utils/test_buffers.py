@@ -0,0 +1,64 @@
+"""
+Test the buffers used for proprioceptive histories and controller filtering.
+
+This runs some basic sanity checks, namely, checking that:
+    - RingBuffer's running average matches the mean of the stored values, before and after wrapping around
+    - RingBuffer's delta matches the moving-window finite difference over the values in chronological order
+    - DeltaBuffer tracks the current and last values when written in-place
+    - clear() resets buffers without reallocating their storage
+"""
+import numpy as np
+
+from robosuite.utils.buffers import DeltaBuffer, RingBuffer
+
+
+def test_ring_buffer():
+    np.random.seed(0)
+    buf = RingBuffer(dim=6, length=10)
+    storage = buf.buf
+    history = [np.zeros(6)] * 10
+    for i in range(35):
+        value = np.random.randn(6)
+        buf.push(value)
+        history.append(value)
+        assert np.allclose(buf.current, value)
+        assert np.allclose(buf.average, np.mean(history[-min(i + 1, 10) :], axis=0))
+
+        # The summed finite differences over the (chronological) window telescope to newest - oldest
+        window = np.array(history[-10:])
+        assert np.allclose(buf.delta, np.sum(np.diff(window, axis=0), axis=0))
+
+    buf.clear()
+    assert buf.buf is storage
+    assert not buf.buf.any()
+    buf.push(np.ones(6))
+    assert np.allclose(buf.average, np.ones(6))
+
+
+def test_delta_buffer():
+    buf = DeltaBuffer(dim=3)
+    buf.push([1.0, 2.0, 3.0])
+    buf.push([2.0, 4.0, 6.0])
+    assert np.allclose(buf.last, [1.0, 2.0, 3.0])
+    assert np.allclose(buf.current, [2.0, 4.0, 6.0])
+    assert np.allclose(buf.delta, [1.0, 2.0, 3.0])
+    assert np.allclose(buf.average, [1.5, 3.0, 4.5])
+
+    # Pushing the current value back in should be safe
+    buf.push(buf.current)
+    assert np.allclose(buf.last, [2.0, 4.0, 6.0])
+    assert np.allclose(buf.current, [2.0, 4.0, 6.0])
+
+    storage = (buf.last, buf.current)
+    buf.clear()
+    assert {id(buf.last), id(buf.current)} == {id(arr) for arr in storage}
+    assert not buf.last.any() and not buf.current.any()
+
+
+if __name__ == "__main__":
+
+    test_ring_buffer()
+    test_delta_buffer()
+
+    # Tests passed!
+    print("Buffer tests passed successfully!")
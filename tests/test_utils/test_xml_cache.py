@@ -0,0 +1,94 @@
+"""
+Test the MJCF element tree cache.
+
+This runs some basic sanity checks on the cache, namely, checking that:
+    - loading a cached MujocoXML produces the same xml as a fresh parse
+    - mutating a loaded model (e.g.: merging into it or renaming its elements) does not leak into subsequent loads
+    - modifying the source file (i.e.: changing its mtime) invalidates its cache entry
+"""
+import os
+import shutil
+import tempfile
+
+import robosuite.utils.macros as macros
+from robosuite.models import assets_root
+from robosuite.models.base import MujocoXML
+from robosuite.utils.xml_cache import get_xml_tree_cache
+
+ROBOT_XML = os.path.join(assets_root, "robots/baxter/robot.xml")
+ARENA_XML = os.path.join(assets_root, "arenas/table_arena.xml")
+
+
+def _load(fname, cached):
+    macros.CACHE_XML_TREES = cached
+    try:
+        return MujocoXML(fname)
+    finally:
+        macros.CACHE_XML_TREES = False
+
+
+def test_xml_cache_equivalence():
+    cache = get_xml_tree_cache()
+    cache.clear()
+    fresh = _load(ROBOT_XML, cached=False).get_xml()
+
+    # First cached load parses and fills the cache, second one is served from it
+    assert _load(ROBOT_XML, cached=True).get_xml() == fresh
+    assert _load(ROBOT_XML, cached=True).get_xml() == fresh
+    assert cache.stats["misses"] == 1
+    assert cache.stats["hits"] == 1
+
+
+def test_xml_cache_isolation():
+    cache = get_xml_tree_cache()
+    cache.clear()
+    fresh = _load(ROBOT_XML, cached=False).get_xml()
+
+    # Mutate a cached load, both by merging another model into it and by renaming its elements
+    model = _load(ROBOT_XML, cached=True)
+    model.merge(_load(ARENA_XML, cached=True))
+    for body in model.worldbody.iter("body"):
+        body.set("name", "renamed_" + body.get("name", ""))
+    assert model.get_xml() != fresh
+
+    assert _load(ROBOT_XML, cached=True).get_xml() == fresh
+    assert cache.stats["hits"] == 1
+
+
+def test_xml_cache_invalidation():
+    cache = get_xml_tree_cache()
+    cache.clear()
+    tmp_dir = tempfile.mkdtemp()
+    try:
+        fname = os.path.join(tmp_dir, "arena.xml")
+        shutil.copyfile(ARENA_XML, fname)
+        _load(fname, cached=True)
+        _load(fname, cached=True)
+        assert cache.stats["hits"] == 1
+
+        # Touching the file re-parses it on the next load
+        stat = os.stat(fname)
+        os.utime(fname, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+        _load(fname, cached=True)
+        assert cache.stats["hits"] == 1
+        assert cache.stats["misses"] == 2
+
+        # Edits to the file are picked up
+        with open(fname) as f:
+            xml = f.read()
+        with open(fname, "w") as f:
+            f.write(xml.replace('<mujoco model="', '<mujoco model="edited_'))
+        assert 'model="edited_' in _load(fname, cached=True).get_xml()
+    finally:
+        shutil.rmtree(tmp_dir)
+        cache.clear()
+
+
+if __name__ == "__main__":
+
+    test_xml_cache_equivalence()
+    test_xml_cache_isolation()
+    test_xml_cache_invalidation()
+
+    # Tests passed!
+    print("XML tree cache tests passed successfully!")